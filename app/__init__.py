@@ -1,6 +1,8 @@
-from app.routes import rc_router, sender_router
+from app.routes import rc_router, sender_router, jobs_router, roster_router
 
 __all__ = [
+    "roster_router",
+    "jobs_router",
     "sender_router",
     "rc_router"
 ]
\ No newline at end of file
@@ -1,12 +1,41 @@
-from app import rc_router, sender_router
+from app import rc_router, sender_router, jobs_router, roster_router
+from app.routes.rc import REPORT_CARD_JOB, run_report_card_job
+from app.dependencies import get_job_queue, get_credential_managers, get_async_clients
+from components.utils import CredentialManager
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
+import logging
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    job_queue = get_job_queue()
+    job_queue.register(REPORT_CARD_JOB, run_report_card_job)
+    job_queue.start()
+
+    credential_managers: list[CredentialManager] = []
+    try:
+        credential_managers = get_credential_managers()
+    except Exception as e:
+        # Requests needing Google APIs will fail with the same error; nothing here prompts for OAuth.
+        logging.error(f"Google credentials unavailable, background refresh disabled: {e}")
+    for manager in credential_managers:
+        manager.start()
+    yield
+    for client in get_async_clients():
+        await client.aclose()
+    for manager in credential_managers:
+        manager.stop(timeout=5)
+    job_queue.stop(timeout=5)
 
 app = FastAPI(
-    title="LICA HR Email Automation"
+    title="LICA HR Email Automation",
+    lifespan=lifespan
 )
 
 app.include_router(rc_router, prefix="/generate", tags=["report-card"])
 app.include_router(sender_router, prefix="/send", tags=["send-email"])
+app.include_router(jobs_router, prefix="/jobs", tags=["jobs"])
+app.include_router(roster_router, prefix="/roster", tags=["roster"])
 
 @app.get("/")
 def root():
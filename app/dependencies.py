@@ -1,5 +1,13 @@
-from components.utils import GmailService, GSheetService
-from config import GMAIL_TOKEN_FILE, OAUTH_FILE
+from components.utils import GmailService, GmailSendEngine, GSheetService, JobQueue, JobStore
+from components.utils import AsyncGmailService, AsyncGSheetService, AsyncGoogleClient
+from components.utils import EmailOutbox, OutboxDispatcher, CredentialManager, RosterCache, RosterSync
+from config import GMAIL_TOKEN_FILE, OAUTH_FILE, JOB_STORE_FILE, JOB_WORKERS, EMAIL_OUTBOX_FILE
+from config import GMAIL_API_ENDPOINT, GMAIL_BATCH_SIZE, GMAIL_SEND_WORKERS, GMAIL_QUOTA_PER_SECOND
+from config import GMAIL_UPLOAD_THRESHOLD, GOOGLE_HTTP_POOL_SIZE, ROSTER_CACHE_TTL, SHEETS_CHUNK_ROWS
+from config import ROSTER_SNAPSHOT_FILE, LINK_INDEX_FILE, SC_BASE_URL, GRM_BASE_URL, ASYNC_HTTP_MAX_CONNECTIONS
+from components.looker import LinkIndexes, LinkIndexStore
+from components.run import default_link_table
+from components.storage import ObjectStore, ObjectStoreFactory
 from components import GoogleServiceFactory
 from functools import lru_cache
 from config import Sheets
@@ -7,25 +15,144 @@ from typing import cast
 import json
 import os
 
+@lru_cache
+def _gmail_credentials_factory() -> CredentialManager:
+    # Never runs the OAuth consent flow; a missing token fails fast instead.
+    return CredentialManager.from_user_token(
+        GMAIL_TOKEN_FILE,
+        token_key="GMAIL_TOKEN_LICAHR",
+        scopes=GmailService.SCOPES,
+        name="gmail"
+    )
+
+@lru_cache
+def _sheets_credentials_factory() -> CredentialManager:
+    return CredentialManager.from_service_account(
+        json.loads(os.environ["LICA_HR_SERVICE_INFO"]),
+        scopes=GSheetService.SCOPES,
+        name="sheets"
+    )
+
 @lru_cache
 def _gmail_service_factory() -> GmailService:
     config = {
+        "credential_manager": _gmail_credentials_factory(),
         "gmail_token_file": GMAIL_TOKEN_FILE,
-        "oauth_file": OAUTH_FILE
+        "oauth_file": OAUTH_FILE,
+        "api_endpoint": GMAIL_API_ENDPOINT,
+        "batch_size": GMAIL_BATCH_SIZE,
+        "upload_threshold": GMAIL_UPLOAD_THRESHOLD,
+        "pool_size": GOOGLE_HTTP_POOL_SIZE
     }
     return cast(GmailService, GoogleServiceFactory.create("gmail", config))
 
+@lru_cache
+def _async_gmail_factory() -> AsyncGmailService:
+    # Shares the credentials (and their refresh) with the sync client.
+    return AsyncGmailService(
+        _gmail_credentials_factory(),
+        api_endpoint=GMAIL_API_ENDPOINT,
+        upload_threshold=GMAIL_UPLOAD_THRESHOLD,
+        max_connections=ASYNC_HTTP_MAX_CONNECTIONS
+    )
+
+@lru_cache
+def _gmail_send_engine_factory() -> GmailSendEngine:
+    # One engine per process so every request draws from the same quota bucket.
+    return GmailSendEngine(
+        _gmail_service_factory(),
+        workers=GMAIL_SEND_WORKERS,
+        quota_per_second=GMAIL_QUOTA_PER_SECOND,
+        async_gmail=_async_gmail_factory(),
+        async_concurrency=ASYNC_HTTP_MAX_CONNECTIONS
+    )
+
+@lru_cache
+def _outbox_dispatcher_factory() -> OutboxDispatcher:
+    return OutboxDispatcher(
+        EmailOutbox(EMAIL_OUTBOX_FILE),
+        _gmail_service_factory(),
+        engine=_gmail_send_engine_factory(),
+        store=_report_card_store_factory()
+    )
+
 @lru_cache
 def _gsheet_service_factory() -> GSheetService:
     config = {
         "service_account_file": json.loads(os.environ["LICA_HR_SERVICE_INFO"]),
         "spreadsheet_id": Sheets.EMAIL_MASTERLIST.id,
-        "spreadsheet_range": Sheets.EMAIL_MASTERLIST.range
+        "spreadsheet_range": Sheets.EMAIL_MASTERLIST.range,
+        "pool_size": GOOGLE_HTTP_POOL_SIZE,
+        "credential_manager": _sheets_credentials_factory(),
+        "chunk_rows": SHEETS_CHUNK_ROWS
     }
     return cast(GSheetService, GoogleServiceFactory.create("gsheet", config))
 
+@lru_cache
+def _async_gsheet_factory() -> AsyncGSheetService:
+    return AsyncGSheetService(
+        _sheets_credentials_factory(),
+        spreadsheet_id=Sheets.EMAIL_MASTERLIST.id,
+        spreadsheet_range=Sheets.EMAIL_MASTERLIST.range,
+        chunk_rows=SHEETS_CHUNK_ROWS,
+        max_connections=ASYNC_HTTP_MAX_CONNECTIONS
+    )
+
+@lru_cache
+def _roster_cache_factory() -> RosterCache:
+    # Shared by every endpoint and job in the process; see `RosterCache` for when it refetches.
+    return RosterCache(
+        _gsheet_service_factory(),
+        ttl=ROSTER_CACHE_TTL,
+        sync=RosterSync(ROSTER_SNAPSHOT_FILE),
+        async_gsheet=_async_gsheet_factory()
+    )
+
+@lru_cache
+def _link_indexes_factory() -> LinkIndexes:
+    return LinkIndexes(
+        _roster_cache_factory(),
+        base_urls={"SC": SC_BASE_URL, "GRM": GRM_BASE_URL},
+        link_table=default_link_table(),
+        store=LinkIndexStore(LINK_INDEX_FILE)
+    )
+
+@lru_cache
+def _job_queue_factory() -> JobQueue:
+    return JobQueue(JobStore(JOB_STORE_FILE), workers=JOB_WORKERS)
+
+@lru_cache
+def _report_card_store_factory() -> ObjectStore:
+    return ObjectStoreFactory.report_card_store()
+
+def get_credential_managers() -> list[CredentialManager]:
+    return [_gmail_credentials_factory(), _sheets_credentials_factory()]
+
+def get_async_clients() -> list[AsyncGoogleClient]:
+    """The async Google clients created so far (for closing their connection pools)."""
+    factories = (_async_gmail_factory, _async_gsheet_factory)
+    return [factory() for factory in factories if factory.cache_info().currsize]
+
 def get_gmail_service() -> GmailService:
     return _gmail_service_factory()
 
+def get_gmail_send_engine() -> GmailSendEngine:
+    return _gmail_send_engine_factory()
+
+def get_outbox_dispatcher() -> OutboxDispatcher:
+    return _outbox_dispatcher_factory()
+
 def get_gsheet_service() -> GSheetService:
-    return _gsheet_service_factory()
\ No newline at end of file
+    return _gsheet_service_factory()
+
+def get_roster_cache() -> RosterCache:
+    return _roster_cache_factory()
+
+def get_link_indexes() -> LinkIndexes:
+    return _link_indexes_factory()
+
+def get_job_queue() -> JobQueue:
+    return _job_queue_factory()
+
+def get_report_card_store() -> ObjectStore:
+    return _report_card_store_factory()
\ No newline at end of file
@@ -1,7 +1,11 @@
 from app.routes.send_email import router as sender_router
 from app.routes.rc import router as rc_router
+from app.routes.jobs import router as jobs_router
+from app.routes.roster import router as roster_router
 
 __all__ = [
+    "roster_router",
+    "jobs_router",
     "sender_router",
     "rc_router"
 ]
\ No newline at end of file
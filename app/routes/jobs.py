@@ -0,0 +1,80 @@
+from components.utils import JobQueue
+from app.dependencies import get_job_queue
+from typing import Optional, Literal
+from app.common import (
+    HTTPException,
+    JSONResponse,
+    APIRouter,
+    Depends,
+    status,
+    Query
+)
+
+router = APIRouter()
+
+def _job_view(job: dict) -> dict:
+    return {
+        "job_id": job["id"],
+        "kind": job["kind"],
+        "job_status": job["status"],
+        "progress": {
+            "done": job["done"],
+            "total": job["total"]
+        },
+        "cancel_requested": job["cancel_requested"],
+        "created_at": job["created_at"],
+        "started_at": job["started_at"],
+        "finished_at": job["finished_at"],
+        "params": job["params"],
+        "result": job["result"],
+        "error": job["error"]
+    }
+
+@router.get("")
+def list_jobs(
+    job_status: Optional[Literal["queued", "running", "succeeded", "failed", "cancelled"]] = Query(
+        None, alias="status", description="Only jobs with this status"
+    ),
+    limit: int = Query(50, ge=1, le=500, description="Number of jobs"),
+    job_queue: JobQueue = Depends(get_job_queue)
+):
+    jobs = job_queue.store.list(status=job_status, limit=limit)
+    return JSONResponse(
+        content={
+            "status": "success",
+            "content": [_job_view(job) for job in jobs]
+        },
+        status_code=status.HTTP_200_OK
+    )
+
+@router.get("/{job_id}")
+def get_job(job_id: str, job_queue: JobQueue = Depends(get_job_queue)):
+    job = job_queue.store.get(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job '{job_id}' not found"
+        )
+    return JSONResponse(
+        content={
+            "status": "success",
+            "content": _job_view(job)
+        },
+        status_code=status.HTTP_200_OK
+    )
+
+@router.post("/{job_id}/cancel")
+def cancel_job(job_id: str, job_queue: JobQueue = Depends(get_job_queue)):
+    job = job_queue.cancel(job_id)
+    if not job:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Job '{job_id}' not found"
+        )
+    return JSONResponse(
+        content={
+            "status": "success",
+            "content": _job_view(job)
+        },
+        status_code=status.HTTP_200_OK
+    )
@@ -4,16 +4,57 @@ from app.common import (
     SC_BASE_URL,
     GRM_BASE_URL,
     APIRouter,
+    Depends,
     status,
     Query,
     run
 )
 
-from components.run import generate_employee_links
+from components.utils.JobQueue import JobContext, JobQueue
+from components.looker.StepTimer import summarize_timings
+from app.dependencies import get_job_queue, get_report_card_store, get_roster_cache, get_link_indexes
+from components.looker.RequestPolicy import RequestPolicy
+from components.looker.LinkIndex import LinkIndexes, MatchMode
+from components.looker.LinkTable import EmployeeLink
+from components.storage import ObjectStore
+from components.utils.RosterCache import RosterCache
+from components.run import generate_employee_links, browser_caches, default_blocked_sizes
+from config import LOOKER_REQUEST_AUDIT, LOOKER_REQUEST_PROFILE
 import pyperclip
 
 router = APIRouter()
 
+REPORT_CARD_JOB = "report-card"
+
+def run_report_card_job(params: dict, context: JobContext) -> dict:
+    """`JobQueue` handler for report-card batches submitted through `/get-report-card`."""
+    request_policy = RequestPolicy.profile(
+        params.get("request_profile", LOOKER_REQUEST_PROFILE),
+        audit=params.get("request_audit", LOOKER_REQUEST_AUDIT),
+        sizes=default_blocked_sizes()
+    )
+    results = run(
+        **params,
+        request_policy=request_policy,
+        roster_cache=get_roster_cache(),
+        headless=False,
+        progress=context.progress,
+        should_cancel=context.cancelled
+    )
+    return {
+        "total": len(results),
+        "succeeded": sum(1 for result in results if result["status"] == "success"),
+        "skipped": sum(1 for result in results if result["status"] == "skipped"),
+        "mode": params["mode"],
+        "navigation": {
+            path: sum(1 for result in results if result.get("navigation") == path)
+            for path in ("full", "in_place", "fallback")
+        },
+        "average_timings": summarize_timings(results),
+        "requests": request_policy.stats(),
+        "results": results
+    }
+
 @router.get("/get-report-card")
 def get_report_card(
     dept: Literal["SC", "SC_TEST", "GRM"] = Query(..., description="Dept: SC or GRM"),
@@ -21,7 +62,24 @@ def get_report_card(
     month: int = Query(..., ge=1, le=12, description="Month (1-12)"),
     limit: Optional[int] = Query(None, description="Number of employees"),
     employee_keys: Optional[list[str]] = Query(default=[], description="List of employee names"),
-    grm_email: Optional[str] = Query(default=None, description="GRM email to filter employees under them")
+    grm_email: Optional[str] = Query(default=None, description="GRM email to filter employees under them"),
+    concurrency: int = Query(1, ge=1, le=16, description="Number of report cards rendered at once"),
+    workers: int = Query(1, ge=1, le=16, description="Number of worker processes sharing the roster"),
+    task_timeout: float = Query(180, gt=0, description="Seconds allowed per report card"),
+    mode: Literal["fixed", "fast"] = Query("fixed", description="fixed: fixed delays, fast: event-driven waits"),
+    navigation: Literal["full", "in_place"] = Query(
+        "full", description="full: load the report for every employee, in_place: switch employees on the loaded report"
+    ),
+    request_profile: Literal["off", "safe", "lean"] = Query(
+        LOOKER_REQUEST_PROFILE, description="Requests blocked during renders: off, safe (beacons/media), lean (also fonts/avatars)"
+    ),
+    request_audit: bool = Query(
+        LOOKER_REQUEST_AUDIT, alias="audit", description="Don't block anything; measure what the profile would save"
+    ),
+    rerun: Literal["missing", "only-failed", "force"] = Query(
+        "missing", description="missing: skip completed report cards, only-failed: retry failures only, force: redo everything"
+    ),
+    job_queue: JobQueue = Depends(get_job_queue)
 ):
     try:
         if dept:
@@ -29,19 +87,56 @@ def get_report_card(
                 base_url = SC_BASE_URL
             elif dept == "GRM":
                 base_url = GRM_BASE_URL
-        run(
-            base_url=base_url,
-            dept=dept,
-            year=year,
-            month=month,
-            limit=limit,
-            employee_keys=employee_keys,
-            headless=False,
-            grm_email=grm_email
+        job = job_queue.submit(
+            REPORT_CARD_JOB,
+            {
+                "base_url": base_url,
+                "dept": dept,
+                "year": year,
+                "month": month,
+                "limit": limit,
+                "employee_keys": employee_keys,
+                "grm_email": grm_email,
+                "concurrency": concurrency,
+                "workers": workers,
+                "task_timeout": task_timeout,
+                "mode": mode,
+                "navigation": navigation,
+                "request_profile": request_profile,
+                "request_audit": request_audit,
+                "rerun": rerun
+            }
+        )
+        return JSONResponse(
+            content={
+                "status": "accepted",
+                "content": {
+                    "job_id": job["id"],
+                    "job_status": job["status"],
+                    "status_url": f"/jobs/{job['id']}"
+                }
+            },
+            status_code=status.HTTP_202_ACCEPTED
+        )
+    except Exception as e:
+        return JSONResponse(
+            content={
+                "status": "error",
+                "message": str(e)
+            },
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
+
+@router.get("/report-cards")
+def list_report_cards(
+    prefix: str = Query("", description="Key prefix, e.g. 'SC-2025-09/' or 'SC-2025-09/HYUNDAI SHAW/'"),
+    store: ObjectStore = Depends(get_report_card_store)
+):
+    try:
         return JSONResponse(
             content={
-                "status": "success"
+                "status": "success",
+                "content": store.list(prefix)
             },
             status_code=status.HTTP_200_OK
         )
@@ -54,47 +149,89 @@ def get_report_card(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@router.post("/looker-session/invalidate")
+def invalidate_looker_session():
+    """Drops the saved Looker session state and asset cache; the next render starts cold."""
+    caches = browser_caches()
+    caches["session"].invalidate()
+    caches["asset_cache"].invalidate()
+    return JSONResponse(
+        content={
+            "status": "success"
+        },
+        status_code=status.HTTP_200_OK
+    )
+
+def _link_view(link: EmployeeLink) -> dict:
+    names = link.employee.split()
+    return {
+        "first_name": names[0] if names else "",
+        "last_name": names[-1] if names else "",
+        "employee": link.employee,
+        "url": link.url,
+        "branch": link.branch
+    }
+
 @router.get("/get-employee-url")
-def get_employee_url(
+async def get_employee_url(
     year: int = Query(..., description="Assessment year for the employee."),
     month: int = Query(..., description="Assessment month for the employee."),
     emp_key: list[str] = Query(None, description="Employee key you want to look up."),
     grm_email: str = Query(None, description="GRM you want to look up."),
-    is_copy: bool = Query(False, description="Copy to clipboard.")
+    is_copy: bool = Query(False, description="Copy the first match's URL to clipboard."),
+    match: MatchMode = Query("auto", description="Name matching: exact, prefix, token (any word order) or auto"),
+    limit: int = Query(50, ge=1, le=1000, description="Maximum number of matches"),
+    roster_cache: RosterCache = Depends(get_roster_cache),
+    link_indexes: LinkIndexes = Depends(get_link_indexes)
 ):
+    """
+    Looker Studio URLs of every employee matching `emp_key`, answered from the
+    period's link index (no Google API calls while the roster is fresh).
+    """
     try:
-        base_url = GRM_BASE_URL if grm_email else SC_BASE_URL
-        links = generate_employee_links(
-            base_url=base_url,
-            year=year,
-            month=month,
-            grm_email=grm_email if grm_email else None
-        )
+        if grm_email:
+            links = generate_employee_links(
+                base_url=GRM_BASE_URL,
+                year=year,
+                month=month,
+                grm_email=grm_email,
+                roster=await roster_cache.aget()
+            )
+            matches = [
+                EmployeeLink(employee=name, branch=data["branch"], url=data["url"])
+                for name, data in links.items()
+                if not emp_key or any(key in name for key in emp_key)
+            ]
+        else:
+            index = await link_indexes.aget("SC", year, month)
+            if emp_key:
+                matches, seen = [], set()
+                for key in emp_key:
+                    for link in index.lookup(key, mode=match):
+                        if link.employee not in seen:
+                            seen.add(link.employee)
+                            matches.append(link)
+            else:
+                matches = list(index.links)
 
-        if emp_key:
-            links = {name: url for name, url in links.items() if any(key in name for key in emp_key)}
+        if not matches:
+            return JSONResponse(
+                content={
+                    "status": "error",
+                    "message": "No employee matched the given key."
+                },
+                status_code=status.HTTP_404_NOT_FOUND
+            )
 
-        url_list = []
-        name_list = []
-        branch_list = []
-
-        for names, data in links.items():
-            name_list.append(names)
-            url_list.append(data['url'])
-            branch_list.append(data['branch'])
-
-        first_name, last_name = name_list[0].split()[0], name_list[0].split()[-1]
         if is_copy:
-            pyperclip.copy(url_list[0])
+            pyperclip.copy(matches[0].url)
 
         return JSONResponse(
             content={
                 "status": "success",
                 "content": {
-                    "last_name": last_name,
-                    "first_name": first_name,
-                    "url": url_list[0],
-                    "branch": branch_list[0]
+                    "count": len(matches),
+                    "matches": [_link_view(link) for link in matches[:limit]]
                 }
             },
             status_code=status.HTTP_200_OK
@@ -107,4 +244,4 @@ def get_employee_url(
                 "message": "Exception occurred while getting employee Looker Studio URL."
             },
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
-        )
\ No newline at end of file
+        )
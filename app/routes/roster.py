@@ -0,0 +1,84 @@
+from components.utils import RosterCache
+from app.dependencies import get_roster_cache
+from app.common import (
+    HTTPException,
+    JSONResponse,
+    APIRouter,
+    Depends,
+    status,
+    Query
+)
+
+router = APIRouter()
+
+@router.get("/stats")
+def roster_stats(roster_cache: RosterCache = Depends(get_roster_cache)):
+    """Roster cache hit/miss counters and the age and version of the cached roster."""
+    return JSONResponse(
+        content={
+            "status": "success",
+            "content": roster_cache.stats()
+        },
+        status_code=status.HTTP_200_OK
+    )
+
+@router.post("/invalidate")
+def invalidate_roster(roster_cache: RosterCache = Depends(get_roster_cache)):
+    """Drops the cached roster, e.g. right after editing the masterlist; the next read refetches it."""
+    roster_cache.invalidate()
+    return JSONResponse(
+        content={
+            "status": "success"
+        },
+        status_code=status.HTTP_200_OK
+    )
+
+@router.get("/diff")
+def roster_diff(
+    refresh: bool = Query(False, description="Re-read the masterlist first, e.g. right before a send"),
+    roster_cache: RosterCache = Depends(get_roster_cache)
+):
+    """Added, removed and changed employees in the latest roster sync."""
+    if not roster_cache.sync:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Roster sync is not enabled"
+        )
+    try:
+        if refresh:
+            roster_cache.invalidate()
+            roster_cache.get()
+        return JSONResponse(
+            content={
+                "status": "success",
+                "content": roster_cache.sync.last_diff()
+            },
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        return JSONResponse(
+            content={
+                "status": "error",
+                "message": str(e)
+            },
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+@router.get("/syncs")
+def roster_syncs(
+    limit: int = Query(20, ge=1, le=50, description="Number of syncs"),
+    roster_cache: RosterCache = Depends(get_roster_cache)
+):
+    """Per-sync added/removed/changed counts, newest first."""
+    if not roster_cache.sync:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Roster sync is not enabled"
+        )
+    return JSONResponse(
+        content={
+            "status": "success",
+            "content": roster_cache.sync.history(limit=limit)
+        },
+        status_code=status.HTTP_200_OK
+    )
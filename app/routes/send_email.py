@@ -1,12 +1,16 @@
-from app.dependencies import get_gmail_service, get_gsheet_service
+from app.dependencies import get_roster_cache, get_outbox_dispatcher
 from config.email_contents import generate_email, EMAIL_TEMPLATES
-from components.utils import GmailService, GSheetService
+from components.utils import Employee, Roster, RosterCache, OutboxDispatcher, MatchReport, NameMatcher, normalize_name
+from components.storage import ObjectStore
 from pydantic import BaseModel, EmailStr
 from typing import Optional, Union
+from components.utils.EmailOutbox import SendStrategy
 from config import SC_BASE_URL
 from datetime import date
 from enum import Enum
+import asyncio
 import logging
+import time
 from app.common import (
     HTTPException,
     JSONResponse,
@@ -37,6 +41,17 @@ class RecipientType(str, Enum):
     SC = "SC"
     GRM = "GRM"
 
+class EmailTemplate(str, Enum):
+    """Kind of email; the outbox keeps one entry per recipient, period and kind."""
+    SC_LINKS_TO_SC = "SC_LINKS:SC"
+    SC_LINKS_TO_GRM = "SC_LINKS:GRM"
+    GRM_DIGEST = "GRM_DIGEST"
+
+SC_LINK_TEMPLATES = {
+    RecipientType.SC: EmailTemplate.SC_LINKS_TO_SC,
+    RecipientType.GRM: EmailTemplate.SC_LINKS_TO_GRM
+}
+
 class SendEmailRequest(BaseModel):
     recipients: Optional[Union[EmailStr, list[EmailStr]]] = None
     subject: Optional[str] = None
@@ -46,6 +61,12 @@ class BranchEmailRequest(SendEmailRequest):
     branch: Branch
     recipient_type: RecipientType = RecipientType.SC
 
+DEFAULT_BRANCHES = [branch for branch in Branch if branch is not Branch.TEST]
+
+class FanOutEmailRequest(BaseModel):
+    branches: Optional[list[Branch]] = None  # every branch but TEST BRANCH when omitted
+    recipient_type: RecipientType = RecipientType.SC
+
 def _default_month_year(year: int=None, month: int=None):
     if not year and not month:
         today = date.today()
@@ -63,51 +84,41 @@ def _split_name(full_name: str) -> tuple[str, str]:
         return "", ""
     return parts[0], " ".join(parts[1:])
 
-def _normalize_name(name: Optional[str]) -> str:
-    if not name:
-        return ""
-    return " ".join(name.split()).strip().lower()
-
-def _recipient_key_candidates(recipient: dict) -> list[str]:
-    data = recipient.get("data", {})
+def _recipient_key_candidates(recipient: dict, recipient_type: RecipientType) -> list[str]:
+    data: Employee = recipient["data"]
     raw_candidates = [
         recipient.get("full_name"),
         f"{recipient.get('first_name', '')} {recipient.get('last_name', '')}",
-        f"{data.get('sc_firstname', '')} {data.get('sc_lastname', '')}",
-        data.get("grm_name"),
+        data.grm_name if recipient_type is RecipientType.GRM else data.sc_name,
     ]
     candidates: list[str] = []
     seen: set[str] = set()
 
     for value in raw_candidates:
-        normalized = _normalize_name(value)
+        normalized = normalize_name(value)
         if normalized and normalized not in seen:
             seen.add(normalized)
             candidates.append(normalized)
     return candidates
 
-def _build_recipient_list(branch: Branch, recipient_type: RecipientType, gsheet_service: GSheetService) -> list[str]:
+def _build_recipient_list(branch: Branch, recipient_type: RecipientType, roster: Roster) -> dict[str, dict]:
+    """Recipients of one branch, keyed by lowercased email address."""
     logging.info("Building recipient list for branch=%s, target=%s", branch.value, recipient_type.value)
-    
-    branch_value = branch.value.upper()
-    employees = [
-        emp for emp in gsheet_service.fetch_emails()
-        if emp.get("branch", "").strip().upper() == branch_value
-    ]
+
     recipients: dict[str, dict] = {}
 
-    for emp in employees:
+    for emp in roster.in_branch(branch.value):
         if recipient_type is RecipientType.GRM:
-            email = emp.get("grm_email_address")
+            email = emp.grm_email_address
             if not email:
                 continue
-            first, last = _split_name(emp.get("grm_name", ""))
+            first, last = _split_name(emp.grm_name)
         else:
-            email = emp.get("sc_email_address")
+            email = emp.sc_email_address
             if not email:
                 continue
-            first = emp.get("sc_firstname", "")
-            last = emp.get("sc_lastname", "")
+            first = emp.sc_firstname
+            last = emp.sc_lastname
 
         email_key = email.lower()
         if email_key not in recipients:
@@ -120,7 +131,7 @@ def _build_recipient_list(branch: Branch, recipient_type: RecipientType, gsheet_
                 "full_name": (first_name + " " + last_name).strip(),
                 "data": emp
             }
-    return list(recipients.values())
+    return recipients
 
 def _format_link_block(entries: list[dict]) -> str:
     return "\n".join(
@@ -139,7 +150,7 @@ def _render_grm_email(
         "first_name": employee["first_name"],
         "last_name": employee["last_name"],
         "email_address": employee["email"],
-        "branch": employee["data"]["branch"],
+        "branch": employee["data"].branch,
         "month": employee_month,
         "year": employee_year,
         "department": recipient_type,
@@ -159,7 +170,7 @@ def _render_template(
         "last_name": employee["last_name"],
         "email_address": employee["email"],
         "url": url,
-        "branch": employee["data"]["branch"],
+        "branch": employee["data"].branch,
         "month": employee_month,
         "year": employee_year,
         "department": recipient_type.value,
@@ -184,82 +195,186 @@ def _render_template(
         fallback_template = EMAIL_TEMPLATES["Default"]
         return fallback_template.format(**fallback_context)
 
+def _compose_sc_messages(
+    recipients: dict[str, dict],
+    links: dict[str, dict],
+    branch: Branch,
+    recipient_type: RecipientType,
+    year: int,
+    month: int,
+    emp_key: list[str] = None,
+    match_threshold: float = 0.85,
+    store: ObjectStore = None
+) -> tuple[list[dict], list[Employee], MatchReport, list[str]]:
+    """
+    Pairs `recipients` with their report-card links and renders their emails; CPU
+    and local I/O only. With a `store`, each email gets the recipient's stored
+    report card; recipients whose PDF isn't there are returned (and logged) too.
+    """
+    if emp_key:
+        links = {name: data for name, data in links.items() if any(key.lower() in name.lower() for key in emp_key)}
+
+    matcher = NameMatcher(
+        (
+            (names, {"name": names, "url": data.get("url"), "branch": data.get("branch")})
+            for names, data in links.items()
+            if data.get("url")
+        ),
+        threshold=match_threshold
+    )
+    report = matcher.reconcile(
+        (email_key, _recipient_key_candidates(recipient, recipient_type))
+        for email_key, recipient in recipients.items()
+    )
+    for email_key, match in {**report.ambiguous, **report.unmatched}.items():
+        logging.warning(
+            "No confident link for recipient %s (%s, best: %s at %.2f)",
+            recipients[email_key].get("full_name") or email_key, match.status, match.name, match.score
+        )
+
+    logging.info("Collecting recipients...")
+    skipped = []
+    messages = []
+    missing_attachments = []
+    for email_key, recipient in recipients.items():
+        email = recipient["email"]
+        match = report.matched.get(email_key)
+        if not email or not match:
+            skipped.append(recipient["data"])
+            continue
+        link_info = match.value
+
+        body_template = _render_template(
+            employee=recipient,
+            employee_month=month,
+            employee_year=year,
+            recipient_type=recipient_type,
+            url=link_info["url"]
+        )
+        attachments = []
+        if store:
+            # Report cards are stored under the sheet's branch string, not the `Branch` value.
+            key = ObjectStore.report_card_key(
+                f"{recipient_type.value}-{year}-{month:02d}", link_info["branch"], link_info["name"]
+            )
+            if store.head(key):
+                attachments.append({"filename": f"{link_info['name'].title()}.pdf", "key": key})
+            else:
+                logging.warning("No stored report card for %s (%s); sending without it", email, key)
+                missing_attachments.append(email)
+        messages.append({
+            "to": email,
+            "subject": f"RE: {branch.value} Monthly Performance",
+            "body": body_template,
+            "attachments": attachments
+        })
+    return messages, skipped, report, missing_attachments
+
+async def _send_branch(
+    dispatcher: OutboxDispatcher,
+    recipients: dict[str, dict],
+    links: dict[str, dict],
+    branch: Branch,
+    recipient_type: RecipientType,
+    year: int,
+    month: int,
+    strategy: SendStrategy = "async",
+    emp_key: list[str] = None,
+    match_threshold: float = 0.85,
+    attach_report_card: bool = True
+) -> dict:
+    """Queues and sends one branch's SC emails; returns the `/send-sc-email` response content."""
+    messages, skipped, report, missing_attachments = await asyncio.to_thread(
+        _compose_sc_messages,
+        recipients,
+        links,
+        branch=branch,
+        recipient_type=recipient_type,
+        year=year,
+        month=month,
+        emp_key=emp_key,
+        match_threshold=match_threshold,
+        store=dispatcher.store if attach_report_card else None
+    )
+
+    period = {
+        "branch": branch.value,
+        "year": year,
+        "month": month,
+        "template": SC_LINK_TEMPLATES[recipient_type].value
+    }
+    queued = await asyncio.to_thread(dispatcher.outbox.enqueue, **period, messages=messages)
+    logging.info(
+        "Queued %d email(s) for %s (%d already sent this period); dispatching (%s)...",
+        queued["pending"], branch.value, queued["already_sent"], strategy
+    )
+    dispatched = await dispatcher.adrain(strategy=strategy, **period)
+    match_report = report.to_dict()
+    return {
+        "sent": dispatched["sent"],
+        "already_sent": queued["already_sent"],
+        "in_doubt": queued["in_doubt"] + len(dispatched["in_doubt"]),
+        "skipped": len(skipped),
+        "missing_attachments": missing_attachments,
+        "ambiguous": match_report["ambiguous"],
+        "unmatched": match_report["unmatched"],
+        "failed": dispatched["failed"],
+        "stats": dispatched["stats"]
+    }
+
 @router.post("/send-sc-email")
-def send_sc_url(
+async def send_sc_url(
     payload: BranchEmailRequest,
-    gmail_service: GmailService = Depends(get_gmail_service),
-    gsheet_service: GSheetService = Depends(get_gsheet_service),
+    roster_cache: RosterCache = Depends(get_roster_cache),
+    dispatcher: OutboxDispatcher = Depends(get_outbox_dispatcher),
     year: int = Query(None, description="Assessment year for the employee."),
     month: int = Query(None, description="Assessment month for the employee."),
-    emp_key: list[str] = Query(None, description="Employee key you want to look up.")
+    emp_key: list[str] = Query(None, description="Employee key you want to look up."),
+    strategy: SendStrategy = Query(
+        "async",
+        description="async: rate-limited sends on the event loop, batch: Gmail batch requests, concurrent: rate-limited parallel sends on threads"
+    ),
+    attach_report_card: bool = Query(True, description="Attach the employee's stored report-card PDF, if any."),
+    match_threshold: float = Query(
+        0.85, ge=0, le=1, description="Minimum name-match score for pairing a recipient with a report-card link"
+    )
 ):
-    recipients = _build_recipient_list(payload.branch, payload.recipient_type, gsheet_service)
+    roster = await roster_cache.aget()
+    recipients = _build_recipient_list(payload.branch, payload.recipient_type, roster)
     if not recipients:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"No employees found for branch '{payload.branch}'"
         )
 
-    sent = []
-    skipped = []
-
     year, month = _default_month_year(year, month)
 
     try:
         logging.info("Collecting employee links...")
-        links = generate_employee_links(
+        links = await asyncio.to_thread(
+            generate_employee_links,
             base_url=SC_BASE_URL,
             year=year,
-            month=month
+            month=month,
+            roster=roster
+        )
+        content = await _send_branch(
+            dispatcher,
+            recipients,
+            links,
+            branch=payload.branch,
+            recipient_type=payload.recipient_type,
+            year=year,
+            month=month,
+            strategy=strategy,
+            emp_key=emp_key,
+            match_threshold=match_threshold,
+            attach_report_card=attach_report_card
         )
-
-        if emp_key:
-            links = {name: data for name, data in links.items() if any(key.lower() in name.lower() for key in emp_key)}
-
-        link_lookup: dict[str, dict] = {}
-        for names, data in links.items():
-            normalized = _normalize_name(names)
-            if not normalized:
-                continue
-            if normalized in link_lookup:
-                logging.warning("Duplicate link entry detected for %s; overriding previous value", names)
-            link_lookup[normalized] = {
-                "name": names,
-                "url": data.get("url"),
-                "branch": data.get("branch"),
-            }
-
-        logging.info("Collecting recipients...")
-        for recipient in recipients:
-            email = recipient["email"]
-            if not email:
-                skipped.append(recipient["data"])
-                continue
-
-            link_info = None
-            for candidate in _recipient_key_candidates(recipient):
-                if candidate in link_lookup:
-                    link_info = link_lookup.pop(candidate)
-                    break
-
-            if not link_info or not link_info.get("url"):
-                logging.warning("No link found for recipient %s", recipient.get("full_name") or email)
-                skipped.append(recipient["data"])
-                continue
-
-            body_template = _render_template(
-                employee=recipient,
-                employee_month=month,
-                employee_year=year,
-                recipient_type=payload.recipient_type,
-                url=link_info["url"]
-            )
-            logging.info("Sending email to recipients...")
-            gmail_service.send_email(email, f"RE: {payload.branch.value} Monthly Performance", body_template)
-            sent.append(email)
         return JSONResponse(
             content={
-                "status": "success"
+                "status": "success",
+                "content": content
             },
             status_code=status.HTTP_200_OK
         )
@@ -275,21 +390,131 @@ def send_sc_url(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
 
+@router.post("/send-sc-email/all")
+async def send_all_sc_url(
+    payload: FanOutEmailRequest,
+    roster_cache: RosterCache = Depends(get_roster_cache),
+    dispatcher: OutboxDispatcher = Depends(get_outbox_dispatcher),
+    year: int = Query(None, description="Assessment year for the employee."),
+    month: int = Query(None, description="Assessment month for the employee."),
+    strategy: SendStrategy = Query(
+        "async",
+        description="async: rate-limited sends on the event loop, batch: Gmail batch requests, concurrent: rate-limited parallel sends on threads"
+    ),
+    concurrency: int = Query(3, ge=1, le=len(Branch), description="Number of branches sent at once"),
+    attach_report_card: bool = Query(True, description="Attach the employee's stored report-card PDF, if any."),
+    match_threshold: float = Query(
+        0.85, ge=0, le=1, description="Minimum name-match score for pairing a recipient with a report-card link"
+    )
+):
+    """
+    `/send-sc-email` for several branches (every real branch by default) in one call.
+
+    The roster is read and the period's link table built once; branches are then
+    sent `concurrency` at a time. A branch that fails is reported as `error` and
+    doesn't stop the others. Gmail pacing is shared across branches (one quota bucket).
+    """
+    started = time.perf_counter()
+    branches = list(dict.fromkeys(payload.branches or DEFAULT_BRANCHES))
+    year, month = _default_month_year(year, month)
+
+    try:
+        roster = await roster_cache.aget()
+        roster_seconds = time.perf_counter() - started
+        logging.info("Collecting employee links...")
+        links = await asyncio.to_thread(
+            generate_employee_links,
+            base_url=SC_BASE_URL,
+            year=year,
+            month=month,
+            roster=roster
+        )
+        links_seconds = time.perf_counter() - started - roster_seconds
+    except Exception as e:
+        logging.error(f"Exception occurred: {e}")
+        return JSONResponse(
+            content={
+                "status": "error",
+                "message": str(e)
+            },
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def fan_out(branch: Branch) -> dict:
+        async with semaphore:
+            branch_started = time.perf_counter()
+            result = {"branch": branch.value}
+            try:
+                recipients = _build_recipient_list(branch, payload.recipient_type, roster)
+                if not recipients:
+                    result.update(status="skipped", message="No employees found for branch")
+                else:
+                    content = await _send_branch(
+                        dispatcher,
+                        recipients,
+                        links,
+                        branch=branch,
+                        recipient_type=payload.recipient_type,
+                        year=year,
+                        month=month,
+                        strategy=strategy,
+                        match_threshold=match_threshold,
+                        attach_report_card=attach_report_card
+                    )
+                    result.update(status="success", **content)
+            except Exception as e:
+                logging.exception("Sending to branch %s failed", branch.value)
+                result.update(status="error", message=str(e))
+            result["duration"] = round(time.perf_counter() - branch_started, 3)
+            return result
+
+    results = await asyncio.gather(*(fan_out(branch) for branch in branches))
+    totals = {
+        "sent": sum(len(result.get("sent", ())) for result in results),
+        "already_sent": sum(result.get("already_sent", 0) for result in results),
+        "skipped": sum(result.get("skipped", 0) for result in results),
+        "failed": sum(len(result.get("failed", ())) for result in results),
+        "in_doubt": sum(result.get("in_doubt", 0) for result in results),
+        "missing_attachments": sum(len(result.get("missing_attachments", ())) for result in results),
+        "branch_errors": sum(1 for result in results if result["status"] == "error")
+    }
+    return JSONResponse(
+        content={
+            "status": "success",
+            "content": {
+                "year": year,
+                "month": month,
+                "roster_version": roster.version,
+                "totals": totals,
+                "branches": results,
+                "timings": {
+                    "roster": round(roster_seconds, 3),
+                    "links": round(links_seconds, 3),
+                    "total": round(time.perf_counter() - started, 3)
+                }
+            }
+        },
+        status_code=status.HTTP_200_OK
+    )
+
 @router.post("/send-grm-email")
-def send_grm_url(
+async def send_grm_url(
     payload: BranchEmailRequest,
-    gmail_service: GmailService = Depends(get_gmail_service),
-    gsheet_service: GSheetService = Depends(get_gsheet_service),
+    dispatcher: OutboxDispatcher = Depends(get_outbox_dispatcher),
+    roster_cache: RosterCache = Depends(get_roster_cache),
     year: int = Query(None, description="Assessment year for the employee."),
     month: int = Query(None, description="Assessment month for the employee."),
-    grm_email: str = Query(..., description="GRM you want to look up.")
-):
-    recipients = _build_recipient_list(payload.branch, payload.recipient_type, gsheet_service)
-    grm_email_lower = grm_email.lower()
-    grm_recipient = next(
-        (r for r in recipients if r["email"].lower() == grm_email_lower),
-        None
+    grm_email: str = Query(..., description="GRM you want to look up."),
+    strategy: SendStrategy = Query(
+        "async",
+        description="async: send on the event loop, batch: Gmail batch requests, concurrent: rate-limited parallel sends on threads"
     )
+):
+    roster = await roster_cache.aget()
+    recipients = _build_recipient_list(payload.branch, payload.recipient_type, roster)
+    grm_recipient = recipients.get(grm_email.strip().lower())
 
     if not grm_recipient:
         raise HTTPException(
@@ -305,12 +530,13 @@ def send_grm_url(
             base_url=SC_BASE_URL,
             year=year,
             month=month,
-            grm_email=grm_email
+            grm_email=grm_email,
+            roster=roster
         )
         managed_links = [
             {"name": name.title(), "url": info["url"]}
             for name, info in links.items()
-            if name.upper() != grm_recipient["data"]["grm_name"].upper()
+            if name.upper() != grm_recipient["data"].grm_name.upper()
         ]
         
         body_template = _render_grm_email(
@@ -320,15 +546,30 @@ def send_grm_url(
             employee_year=year,
             recipient_type=payload.recipient_type.value
         )
+        period = {
+            "branch": payload.branch.value,
+            "year": year,
+            "month": month,
+            "template": EmailTemplate.GRM_DIGEST.value
+        }
+        await asyncio.to_thread(dispatcher.outbox.enqueue, **period, messages=[{
+            "to": grm_email,
+            "subject": f"RE: {payload.recipient_type.value} {payload.branch.value} Monthly Performance Report",
+            "body": body_template
+        }])
         logging.info("Sending email to recipients...")
-        gmail_service.send_email(
-            recipient_email=grm_email,
-            subject=f"RE: {payload.recipient_type.value} {payload.branch.value} Monthly Performance Report",
-            body=body_template
-        )
+        dispatched = await dispatcher.adrain(strategy=strategy, recipient=grm_email, **period)
+        if dispatched["failed"]:
+            raise RuntimeError(dispatched["failed"][0]["error"])
+        outbox_status = await asyncio.to_thread(dispatcher.outbox.counts, recipient=grm_email, **period)
         return JSONResponse(
             content={
-                "status": "success"
+                "status": "success",
+                "content": {
+                    "sent": dispatched["sent"],
+                    "already_sent": not dispatched["sent"] and bool(outbox_status.get("sent")),
+                    "in_doubt": dispatched["in_doubt"]
+                }
             },
             status_code=status.HTTP_200_OK
         )
@@ -342,4 +583,106 @@ def send_grm_url(
                 "content": "Error sending email."
             },
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
+        )
+
+class OutboxStatus(str, Enum):
+    PENDING = "pending"
+    SENDING = "sending"
+    SENT = "sent"
+    FAILED = "failed"
+
+class RedriveRequest(BaseModel):
+    statuses: list[OutboxStatus] = [OutboxStatus.FAILED]
+    branch: Optional[Branch] = None
+    recipient: Optional[EmailStr] = None
+    year: Optional[int] = None
+    month: Optional[int] = None
+    template: Optional[EmailTemplate] = None
+
+@router.get("/outbox")
+def list_outbox(
+    outbox_status: Optional[OutboxStatus] = Query(None, alias="status", description="Only entries with this status"),
+    branch: Optional[Branch] = Query(None, description="Only entries of this branch"),
+    recipient: Optional[str] = Query(None, description="Only entries for this email address"),
+    year: Optional[int] = Query(None, description="Assessment year"),
+    month: Optional[int] = Query(None, description="Assessment month"),
+    template: Optional[EmailTemplate] = Query(None, description="Only emails of this kind"),
+    limit: int = Query(200, ge=1, le=1000, description="Number of entries"),
+    dispatcher: OutboxDispatcher = Depends(get_outbox_dispatcher)
+):
+    filters = {
+        "branch": branch.value if branch else None,
+        "recipient": recipient,
+        "year": year,
+        "month": month,
+        "template": template.value if template else None
+    }
+    entries = dispatcher.outbox.entries(
+        status=outbox_status.value if outbox_status else None,
+        limit=limit,
+        **filters
+    )
+    return JSONResponse(
+        content={
+            "status": "success",
+            "content": {
+                "counts": dispatcher.outbox.counts(**filters),
+                "entries": [
+                    {key: value for key, value in entry.items() if key != "body"}
+                    for entry in entries
+                ]
+            }
+        },
+        status_code=status.HTTP_200_OK
+    )
+
+@router.post("/outbox/redrive")
+def redrive_outbox(
+    payload: RedriveRequest,
+    strategy: SendStrategy = Query("batch", description="batch: Gmail batch requests, concurrent: rate-limited parallel sends"),
+    dispatcher: OutboxDispatcher = Depends(get_outbox_dispatcher)
+):
+    """
+    Puts failed (or stuck `sending`) entries back in the queue and sends them;
+    other pending entries are left to their own send.
+
+    Only re-drive `sending` entries after checking the Gmail "Sent" folder: the
+    previous attempt may have gone out before the crash.
+    """
+    if OutboxStatus.SENT in payload.statuses:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Sent entries can't be re-driven"
+        )
+    filters = {
+        "branch": payload.branch.value if payload.branch else None,
+        "recipient": payload.recipient,
+        "year": payload.year,
+        "month": payload.month,
+        "template": payload.template.value if payload.template else None
+    }
+    try:
+        requeued = dispatcher.outbox.redrive(tuple(s.value for s in payload.statuses), **filters)
+        dispatched = dispatcher.drain(strategy=strategy, ids=requeued)
+        return JSONResponse(
+            content={
+                "status": "success",
+                "content": {
+                    "requeued": len(requeued),
+                    "sent": dispatched["sent"],
+                    "failed": dispatched["failed"],
+                    "in_doubt": dispatched["in_doubt"],
+                    "stats": dispatched["stats"]
+                }
+            },
+            status_code=status.HTTP_200_OK
+        )
+    except Exception as e:
+        logging.error(f"Exception occurred: {e}")
+        return JSONResponse(
+            content={
+                "status": "error",
+                "message": str(e)
+            },
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR
         )
\ No newline at end of file
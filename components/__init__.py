@@ -1,11 +1,26 @@
-from components.looker import ReportDownloader, LookerStudioURLBuilder
+from components.looker import (
+    AsyncReportDownloader,
+    LookerStudioURLBuilder,
+    AsyncBrowserPool,
+    ReportDownloader,
+    RequestPolicy,
+    SessionState,
+    BrowserPool,
+    AssetCache
+)
 from components.utils import GSheetService, GoogleServiceFactory
 from components.run import  run
 
 __all__ = [
+    "AsyncReportDownloader",
+    "AsyncBrowserPool",
     "LookerStudioURLBuilder",
     "GoogleServiceFactory",
     "ReportDownloader",
+    "RequestPolicy",
+    "SessionState",
+    "BrowserPool",
+    "AssetCache",
     "GSheetService",
     "run"
 ]
\ No newline at end of file
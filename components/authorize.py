@@ -0,0 +1,33 @@
+"""
+Creates (or replaces) the Gmail user token with the interactive OAuth consent flow.
+
+The API never does this itself; run it on a machine with a browser:
+
+```
+python -m components.authorize
+```
+"""
+from components.utils.CredentialManager import CredentialManager
+from components.utils.GmailService import GmailService
+from config import GMAIL_TOKEN_FILE, OAUTH_FILE
+import argparse
+import json
+import os
+
+def main():
+    parser = argparse.ArgumentParser(description="Authorize the Gmail sender account")
+    parser.add_argument("--oauth-file", default=OAUTH_FILE, help="OAuth client config (or set LICAHR_EMAIL_OAUTH)")
+    parser.add_argument("--token-file", default=GMAIL_TOKEN_FILE, help="Where to save the user token")
+    args = parser.parse_args()
+
+    if "LICAHR_EMAIL_OAUTH" in os.environ:
+        client_config = json.loads(os.environ["LICAHR_EMAIL_OAUTH"])
+    else:
+        with open(args.oauth_file, "r") as f:
+            client_config = json.load(f)
+
+    CredentialManager.authorize(client_config, GmailService.SCOPES, args.token_file)
+    print(f"Saved Gmail token to {args.token_file}")
+
+if __name__ == "__main__":
+    main()
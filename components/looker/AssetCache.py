@@ -0,0 +1,136 @@
+from playwright.async_api import Route as AsyncRoute
+from playwright.sync_api import Route
+from typing import Optional
+import tempfile
+import asyncio
+import hashlib
+import logging
+import shutil
+import time
+import json
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class AssetCache:
+    """
+    Shared on-disk HTTP cache for Looker Studio's static assets (JS bundles,
+    stylesheets, fonts, images), installed with `context.route`.
+
+    Browser contexts created with `new_context()` keep their HTTP cache in
+    memory only, so without this every pool member and every run downloads the
+    whole Looker app again. Only successful `GET`s of the resource types below
+    are cached; data requests always go to the network.
+    """
+    RESOURCE_TYPES = ("script", "stylesheet", "font", "image")
+    DROPPED_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
+    def __init__(self, directory: str, max_age: float = 24 * 3600):
+        self.logger = logging.getLogger(__name__)
+        self.directory = directory
+        self.max_age = max_age
+        self.hits = 0
+        self.misses = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _paths(self, url: str) -> tuple[str, str]:
+        name = hashlib.sha256(url.encode()).hexdigest()
+        return os.path.join(self.directory, f"{name}.body"), os.path.join(self.directory, f"{name}.json")
+
+    def _cacheable(self, method: str, resource_type: str) -> bool:
+        return method == "GET" and resource_type in self.RESOURCE_TYPES
+
+    def _clean_headers(self, headers: dict[str, str]) -> dict[str, str]:
+        # Bodies are stored decoded, so encoding/length headers no longer apply.
+        return {k: v for k, v in headers.items() if k.lower() not in self.DROPPED_HEADERS}
+
+    def get(self, url: str) -> Optional[tuple[dict, bytes]]:
+        body_path, meta_path = self._paths(url)
+        try:
+            if time.time() - os.path.getmtime(meta_path) > self.max_age:
+                return None
+            with open(meta_path) as f:
+                meta = json.load(f)
+            with open(body_path, "rb") as f:
+                return meta, f.read()
+        except (OSError, ValueError):
+            return None
+
+    def put(self, url: str, status: int, headers: dict[str, str], body: bytes):
+        cache_control = headers.get("cache-control", "")
+        if status != 200 or "no-store" in cache_control:
+            return
+        body_path, meta_path = self._paths(url)
+        headers = self._clean_headers(headers)
+        for path, content in ((body_path, body), (meta_path, json.dumps({"url": url, "status": status, "headers": headers}).encode())):
+            fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(content)
+                os.replace(tmp_path, path)
+            except OSError:
+                if os.path.exists(tmp_path):
+                    os.remove(tmp_path)
+                raise
+
+    def _store(self, url: str, status: int, headers: dict[str, str], body: bytes):
+        try:
+            self.put(url, status, headers, body)
+        except OSError as e:
+            # A cache write failure must never fail the page request.
+            self.logger.warning(f"Could not cache {url}: {e}")
+
+    def handle(self, route: Route):
+        """Sync `context.route("**/*", cache.handle)` handler."""
+        request = route.request
+        if not self._cacheable(request.method, request.resource_type):
+            route.fallback()
+            return
+        cached = self.get(request.url)
+        if cached:
+            self.hits += 1
+            meta, body = cached
+            route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+        self.misses += 1
+        try:
+            response = route.fetch()
+            body = response.body()
+        except Exception as e:
+            # Left unanswered, the request would hang until the navigation timeout.
+            self.logger.warning(f"Asset fetch failed, letting the browser load it: {request.url}: {e}")
+            route.continue_()
+            return
+        self._store(request.url, response.status, response.headers, body)
+        route.fulfill(status=response.status, headers=self._clean_headers(response.headers), body=body)
+
+    async def handle_async(self, route: AsyncRoute):
+        """`async_playwright` version of `handle`; disk reads and writes run in a worker thread."""
+        request = route.request
+        if not self._cacheable(request.method, request.resource_type):
+            await route.fallback()
+            return
+        cached = await asyncio.to_thread(self.get, request.url)
+        if cached:
+            self.hits += 1
+            meta, body = cached
+            await route.fulfill(status=meta["status"], headers=meta["headers"], body=body)
+            return
+        self.misses += 1
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            self.logger.warning(f"Asset fetch failed, letting the browser load it: {request.url}: {e}")
+            await route.continue_()
+            return
+        await asyncio.to_thread(self._store, request.url, response.status, response.headers, body)
+        await route.fulfill(status=response.status, headers=self._clean_headers(response.headers), body=body)
+
+    def invalidate(self):
+        self.logger.info(f"Clearing Looker asset cache at {self.directory}")
+        shutil.rmtree(self.directory, ignore_errors=True)
+        os.makedirs(self.directory, exist_ok=True)
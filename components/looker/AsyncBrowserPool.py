@@ -0,0 +1,232 @@
+from playwright.async_api import (
+    async_playwright,
+    BrowserContext,
+    Playwright,
+    Browser,
+    Page
+)
+from components.looker.SessionState import SessionState
+from components.looker.RequestPolicy import RequestPolicy
+from components.looker.AssetCache import AssetCache
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from typing import AsyncIterator, Optional
+import asyncio
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+@dataclass
+class _PooledPage:
+    context: BrowserContext
+    page: Page
+    uses: int = 0
+    broken: bool = False
+
+class AsyncBrowserPool:
+    """
+    `async_playwright` counterpart of `BrowserPool`.
+
+    Each slot is its own browser context, so up to `size` report cards render
+    at once. Borrowers wait for a free slot instead of failing. Session state,
+    the asset cache, the request policy and slots whose replacement couldn't be
+    built work as in `BrowserPool`.
+
+    ```python
+    async with AsyncBrowserPool(size=4, headless=True) as pool:
+        async with pool.page() as page:
+            await page.goto(url)
+    ```
+    """
+    LOGIN_HOST = "accounts.google.com"
+
+    def __init__(
+        self,
+        size: int = 4,
+        max_uses: int = 25,
+        headless: bool = False,
+        slow_mo: int = 100,
+        session: SessionState = None,
+        asset_cache: AssetCache = None,
+        request_policy: RequestPolicy = None
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        if max_uses < 1:
+            raise ValueError("max_uses must be at least 1.")
+        self.logger = logging.getLogger(__name__)
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.session = session
+        self.asset_cache = asset_cache
+        self.request_policy = request_policy
+
+        self.playwright: Playwright = None
+        self.browser: Browser = None
+        # `None` marks a slot whose context has to be rebuilt on its next borrow.
+        self._idle: asyncio.Queue[Optional[_PooledPage]] = None
+        self._launch_lock: asyncio.Lock = None
+
+    async def __aenter__(self) -> "AsyncBrowserPool":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+
+    async def start(self):
+        if self.playwright:
+            return
+        self.logger.info(f"Starting async browser pool (size={self.size}, max_uses={self.max_uses})...")
+        self._idle = asyncio.Queue()
+        self._launch_lock = asyncio.Lock()
+        self.playwright = await async_playwright().start()
+        await self._launch_browser()
+        for _ in range(self.size):
+            self._idle.put_nowait(await self._new_slot())
+
+    async def close(self):
+        while self._idle and not self._idle.empty():
+            slot = self._idle.get_nowait()
+            if slot:
+                await self._close_slot(slot)
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing browser: {e}")
+            self.browser = None
+        if self.playwright:
+            await self.playwright.stop()
+            self.playwright = None
+        self.logger.info("Async browser pool closed.")
+
+    async def _launch_browser(self):
+        self.logger.info("Launching chromium browser...")
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless,
+            slow_mo=self.slow_mo
+        )
+
+    async def _new_slot(self) -> _PooledPage:
+        async with self._launch_lock:
+            if not self.browser or not self.browser.is_connected():
+                self.logger.warning("Browser disconnected; relaunching...")
+                await self._launch_browser()
+        context = await self.browser.new_context(
+            accept_downloads=True,
+            storage_state=self.session.load() if self.session else None
+        )
+        if self.asset_cache:
+            await context.route("**/*", self.asset_cache.handle_async)
+        if self.request_policy:
+            # Registered last so it runs first; allowed requests fall back to the cache.
+            await context.route("**/*", self.request_policy.handle_async)
+        return _PooledPage(context=context, page=await context.new_page())
+
+    async def _close_slot(self, slot: _PooledPage):
+        try:
+            await slot.context.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing browser context: {e}")
+
+    async def _is_healthy(self, slot: _PooledPage) -> bool:
+        if slot.broken or slot.page.is_closed():
+            return False
+        if not self.browser or not self.browser.is_connected():
+            return False
+        try:
+            return await slot.page.evaluate("1") == 1
+        except Exception:
+            return False
+
+    async def _save_session(self, slot: _PooledPage):
+        """Shares the context's cookies/localStorage with future contexts and runs."""
+        if not self.session:
+            return
+        if self.LOGIN_HOST in slot.page.url:
+            # Landed on a sign-in page: the saved state is stale.
+            self.logger.warning("Looker redirected to sign-in; invalidating session state")
+            self.session.invalidate()
+            return
+        if not self.session.needs_save():
+            return
+        try:
+            self.session.save(await slot.context.storage_state())
+        except Exception as e:
+            self.logger.warning(f"Error saving session state: {e}")
+
+    async def _recycle(self, slot: Optional[_PooledPage]) -> _PooledPage:
+        if slot:
+            self.logger.info(f"Recycling browser context after {slot.uses} use(s)...")
+            await self._close_slot(slot)
+        return await self._new_slot()
+
+    async def _recycle_into_pool(self, slot: _PooledPage):
+        """
+        Recycles `slot` and puts its replacement in the pool, or a `None` marker
+        if it can't be built. The recycle finishes and the slot comes back even
+        if the borrower is cancelled meanwhile.
+        """
+        task = asyncio.ensure_future(self._recycle(slot))
+
+        def put_back(task: asyncio.Task):
+            replacement = None
+            if task.cancelled():
+                self.logger.error("Recycling browser context was cancelled; rebuilding it on the next borrow")
+            elif task.exception():
+                self.logger.error(
+                    f"Error recycling browser context; rebuilding it on the next borrow: {task.exception()}"
+                )
+            else:
+                replacement = task.result()
+            self._idle.put_nowait(replacement)
+
+        task.add_done_callback(put_back)
+        try:
+            await asyncio.shield(task)
+        except Exception:
+            pass
+
+    @asynccontextmanager
+    async def page(self) -> AsyncIterator[Page]:
+        """
+        Waits for a free slot and lends its page for the `async with` block.
+
+        Errors and cancellations (e.g. a task timeout) mark the slot broken so
+        it is recycled before the next borrower gets it.
+        """
+        if not self.playwright:
+            raise RuntimeError("Browser pool is not started.")
+
+        slot = await self._idle.get()
+        try:
+            healthy = slot is not None and await self._is_healthy(slot)
+        except BaseException:
+            self._idle.put_nowait(slot)
+            raise
+        if not healthy:
+            try:
+                slot = await self._recycle(slot)
+            except BaseException:
+                # The old context is gone; leave a marker for the next borrower to rebuild.
+                self._idle.put_nowait(None)
+                raise
+
+        slot.uses += 1
+        try:
+            yield slot.page
+            await self._save_session(slot)
+        except BaseException:
+            slot.broken = True
+            raise
+        finally:
+            if slot.broken or slot.uses >= self.max_uses:
+                await self._recycle_into_pool(slot)
+            else:
+                self._idle.put_nowait(slot)
@@ -0,0 +1,64 @@
+from components.looker.ReportSteps import DownloadMode, NavigationMode, ReportSteps, drive_async
+from components.looker.AsyncBrowserPool import AsyncBrowserPool
+from components.storage import ObjectStore
+from playwright.async_api import Page
+from typing import Literal, Optional
+import asyncio
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class AsyncReportDownloader(ReportSteps):
+    """
+    `async_playwright` version of `ReportDownloader`. Always borrows its page
+    from an `AsyncBrowserPool` so several employees can render concurrently.
+
+    Runs the same steps as `ReportDownloader` (see `ReportSteps`); the store
+    upload runs in a worker thread.
+    """
+    def __init__(
+        self,
+        pool: AsyncBrowserPool,
+        url: str = None,
+        branch: str = None,
+        dept: Literal["SC", "SC_TEST", "GRM"] = None,
+        employee_name: str = None,
+        mode: DownloadMode = "fixed",
+        store: ObjectStore = None,
+        run_id: str = None,
+        navigation: NavigationMode = "full"
+    ):
+        super().__init__(
+            url=url,
+            branch=branch,
+            dept=dept,
+            employee_name=employee_name,
+            mode=mode,
+            store=store,
+            run_id=run_id,
+            navigation=navigation
+        )
+        self.pool = pool
+        self.page: Page = None
+
+    async def _download_file(self):
+        async with self.page.expect_download() as file:
+            await self.page.click(self.DOWNLOAD_BUTTON_SELECTOR)
+        return await file.value
+
+    async def _save(self, source: str, dept: str) -> dict:
+        return await asyncio.to_thread(self._store_download, source, dept)
+
+    async def run_automation(self) -> Optional[dict]:
+        """Renders and downloads the report card and returns its `ObjectStore` record; failures are raised."""
+        async with self.pool.page() as page:
+            self.page = page
+            try:
+                await drive_async(self._navigate_steps())
+                # Errors reach `AsyncBrowserPool.page`, so the possibly dead page is recycled.
+                return await drive_async(self._download_steps(self.dept))
+            finally:
+                self.page = None
@@ -0,0 +1,220 @@
+from playwright.sync_api import (
+    sync_playwright,
+    BrowserContext,
+    Playwright,
+    Browser,
+    Page
+)
+from components.looker.SessionState import SessionState
+from components.looker.RequestPolicy import RequestPolicy
+from components.looker.AssetCache import AssetCache
+from contextlib import contextmanager
+from dataclasses import dataclass
+from collections import deque
+from typing import Iterator, Optional
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+@dataclass
+class _PooledPage:
+    context: BrowserContext
+    page: Page
+    uses: int = 0
+    broken: bool = False
+
+class BrowserPool:
+    """
+    Long-lived Playwright + Chromium instance that hands out pages from a
+    fixed pool of browser contexts.
+
+    Contexts are recycled after `max_uses` borrows, or as soon as a health
+    check fails, so one bad render can't poison the rest of the run. If a
+    replacement context can't be built, its slot stays in the pool as an empty
+    marker that the next borrower rebuilds, so the pool never shrinks. With a
+    `SessionState` and `AssetCache`, new contexts start from the last saved
+    Looker session and share one on-disk asset cache. A `RequestPolicy` is
+    installed on every context to drop requests the PDF doesn't need.
+
+    The sync Playwright API is bound to the thread that started it; use one
+    pool per thread.
+
+    ```python
+    with BrowserPool(size=2, headless=True) as pool:
+        with pool.page() as page:
+            page.goto(url)
+    ```
+    """
+    LOGIN_HOST = "accounts.google.com"
+
+    def __init__(
+        self,
+        size: int = 1,
+        max_uses: int = 25,
+        headless: bool = False,
+        slow_mo: int = 100,
+        session: SessionState = None,
+        asset_cache: AssetCache = None,
+        request_policy: RequestPolicy = None
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        if max_uses < 1:
+            raise ValueError("max_uses must be at least 1.")
+        self.logger = logging.getLogger(__name__)
+        self.size = size
+        self.max_uses = max_uses
+        self.headless = headless
+        self.slow_mo = slow_mo
+        self.session = session
+        self.asset_cache = asset_cache
+        self.request_policy = request_policy
+
+        self.playwright: Playwright = None
+        self.browser: Browser = None
+        # `None` marks a slot whose context has to be rebuilt on its next borrow.
+        self._idle: deque[Optional[_PooledPage]] = deque()
+        self._leased = 0
+
+    def __enter__(self) -> "BrowserPool":
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def start(self):
+        if self.playwright:
+            return
+        self.logger.info(f"Starting browser pool (size={self.size}, max_uses={self.max_uses})...")
+        self.playwright = sync_playwright().start()
+        self._launch_browser()
+        for _ in range(self.size):
+            self._idle.append(self._new_slot())
+
+    def close(self):
+        while self._idle:
+            slot = self._idle.popleft()
+            if slot:
+                self._close_slot(slot)
+        if self.browser:
+            try:
+                self.browser.close()
+            except Exception as e:
+                self.logger.warning(f"Error closing browser: {e}")
+            self.browser = None
+        if self.playwright:
+            self.playwright.stop()
+            self.playwright = None
+        self.logger.info("Browser pool closed.")
+
+    def _launch_browser(self):
+        self.logger.info("Launching chromium browser...")
+        self.browser = self.playwright.chromium.launch(
+            headless=self.headless,
+            slow_mo=self.slow_mo
+        )
+
+    def _new_slot(self) -> _PooledPage:
+        if not self.browser or not self.browser.is_connected():
+            self.logger.warning("Browser disconnected; relaunching...")
+            self._launch_browser()
+        context = self.browser.new_context(
+            accept_downloads=True,
+            storage_state=self.session.load() if self.session else None
+        )
+        if self.asset_cache:
+            context.route("**/*", self.asset_cache.handle)
+        if self.request_policy:
+            # Registered last so it runs first; allowed requests fall back to the cache.
+            context.route("**/*", self.request_policy.handle)
+        return _PooledPage(context=context, page=context.new_page())
+
+    def _close_slot(self, slot: _PooledPage):
+        try:
+            slot.context.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing browser context: {e}")
+
+    def _is_healthy(self, slot: _PooledPage) -> bool:
+        if slot.broken or slot.page.is_closed():
+            return False
+        if not self.browser or not self.browser.is_connected():
+            return False
+        try:
+            return slot.page.evaluate("1") == 1
+        except Exception:
+            return False
+
+    def _save_session(self, slot: _PooledPage):
+        """Shares the context's cookies/localStorage with future contexts and runs."""
+        if not self.session:
+            return
+        if self.LOGIN_HOST in slot.page.url:
+            # Landed on a sign-in page: the saved state is stale.
+            self.logger.warning("Looker redirected to sign-in; invalidating session state")
+            self.session.invalidate()
+            return
+        if not self.session.needs_save():
+            return
+        try:
+            self.session.save(slot.context.storage_state())
+        except Exception as e:
+            self.logger.warning(f"Error saving session state: {e}")
+
+    def _recycle(self, slot: Optional[_PooledPage]) -> _PooledPage:
+        if slot:
+            self.logger.info(f"Recycling browser context after {slot.uses} use(s)...")
+            self._close_slot(slot)
+        return self._new_slot()
+
+    @property
+    def idle(self) -> int:
+        return len(self._idle)
+
+    @property
+    def leased(self) -> int:
+        return self._leased
+
+    @contextmanager
+    def page(self) -> Iterator[Page]:
+        """
+        Borrows a healthy page for the duration of the `with` block.
+
+        The slot is marked broken if the block raises, and is recycled before
+        it goes back to the pool.
+        """
+        if not self.playwright:
+            raise RuntimeError("Browser pool is not started.")
+        if not self._idle:
+            raise RuntimeError("No idle pages left in the browser pool.")
+
+        slot: Optional[_PooledPage] = self._idle.popleft()
+        if slot is None or not self._is_healthy(slot):
+            try:
+                slot = self._recycle(slot)
+            except Exception:
+                # The old context is gone; leave a marker for the next borrower to rebuild.
+                self._idle.append(None)
+                raise
+
+        slot.uses += 1
+        self._leased += 1
+        try:
+            yield slot.page
+            self._save_session(slot)
+        except Exception:
+            slot.broken = True
+            raise
+        finally:
+            self._leased -= 1
+            if slot.broken or slot.uses >= self.max_uses:
+                try:
+                    slot = self._recycle(slot)
+                except Exception as e:
+                    self.logger.error(f"Error recycling browser context; rebuilding it on the next borrow: {e}")
+                    slot = None
+            self._idle.append(slot)
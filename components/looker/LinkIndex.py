@@ -0,0 +1,256 @@
+from components.looker.LinkTable import EmployeeLink, LinkTable
+from components.utils.RosterCache import RosterCache
+from components.utils.Roster import Roster, normalize_name
+from typing import Iterator, Literal, Optional
+from contextlib import contextmanager
+from bisect import bisect_left
+import threading
+import asyncio
+import logging
+import sqlite3
+import time
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+MatchMode = Literal["auto", "exact", "prefix", "token"]
+
+class LinkIndex:
+    """
+    Immutable name index over one period's `EmployeeLink`s.
+
+    - `exact`: the normalized full name (`"juan dela cruz"`).
+    - `prefix`: names starting with the query (`"juan d"`).
+    - `token`: every query word starts some word of the name, in any order (`"cruz juan"`).
+
+    `auto` tries them in that order and returns the first non-empty result.
+    """
+    def __init__(self, links: list[EmployeeLink], version: str = "", built_at: float = None):
+        self.version = version
+        self.built_at = built_at or time.time()
+        self.links = links
+        self._by_key: dict[str, list[int]] = {}
+        self._by_token: dict[str, set[int]] = {}
+        for position, link in enumerate(links):
+            key = normalize_name(link.employee)
+            self._by_key.setdefault(key, []).append(position)
+            for token in key.split():
+                self._by_token.setdefault(token, set()).add(position)
+        self._keys = sorted(self._by_key)
+        self._tokens = sorted(self._by_token)
+
+    def __len__(self) -> int:
+        return len(self.links)
+
+    @staticmethod
+    def _prefixed(sorted_keys: list[str], prefix: str) -> Iterator[str]:
+        for i in range(bisect_left(sorted_keys, prefix), len(sorted_keys)):
+            if not sorted_keys[i].startswith(prefix):
+                break
+            yield sorted_keys[i]
+
+    def _exact(self, query: str) -> list[int]:
+        return list(self._by_key.get(query, ()))
+
+    def _prefix(self, query: str) -> list[int]:
+        return [position for key in self._prefixed(self._keys, query) for position in self._by_key[key]]
+
+    def _token(self, query: str) -> list[int]:
+        matches: Optional[set[int]] = None
+        for word in query.split():
+            positions = set()
+            for token in self._prefixed(self._tokens, word):
+                positions |= self._by_token[token]
+            matches = positions if matches is None else matches & positions
+            if not matches:
+                return []
+        return sorted(matches or ())
+
+    def lookup(self, query: str, mode: MatchMode = "auto") -> list[EmployeeLink]:
+        query = normalize_name(query)
+        if not query:
+            return []
+        if mode == "auto":
+            for search in (self._exact, self._prefix, self._token):
+                positions = search(query)
+                if positions:
+                    break
+        else:
+            positions = {"exact": self._exact, "prefix": self._prefix, "token": self._token}[mode](query)
+        return [self.links[position] for position in positions]
+
+class LinkIndexStore:
+    """SQLite copy of the latest `LinkIndex` of each `(dept, year, month)`, so a restart doesn't start cold."""
+    def __init__(self, path: str):
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS link_indexes (
+                    dept TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    month INTEGER NOT NULL,
+                    version TEXT NOT NULL,
+                    built_at REAL NOT NULL,
+                    PRIMARY KEY (dept, year, month)
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS link_index_entries (
+                    dept TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    month INTEGER NOT NULL,
+                    position INTEGER NOT NULL,
+                    employee TEXT NOT NULL,
+                    branch TEXT NOT NULL,
+                    url TEXT NOT NULL,
+                    PRIMARY KEY (dept, year, month, position)
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def save(self, dept: str, year: int, month: int, index: LinkIndex):
+        period = (dept, year, month)
+        with self._connect() as conn:
+            conn.execute("DELETE FROM link_index_entries WHERE dept = ? AND year = ? AND month = ?", period)
+            conn.executemany(
+                """
+                INSERT INTO link_index_entries (dept, year, month, position, employee, branch, url)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                [(*period, position, link.employee, link.branch, link.url) for position, link in enumerate(index.links)]
+            )
+            conn.execute(
+                """
+                INSERT INTO link_indexes (dept, year, month, version, built_at) VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT (dept, year, month) DO UPDATE SET version = excluded.version, built_at = excluded.built_at
+                """,
+                (*period, index.version, index.built_at)
+            )
+
+    def load(self, dept: str, year: int, month: int) -> Optional[LinkIndex]:
+        period = (dept, year, month)
+        with self._connect() as conn:
+            header = conn.execute(
+                "SELECT version, built_at FROM link_indexes WHERE dept = ? AND year = ? AND month = ?", period
+            ).fetchone()
+            if not header:
+                return None
+            rows = conn.execute(
+                """
+                SELECT employee, branch, url FROM link_index_entries
+                WHERE dept = ? AND year = ? AND month = ? ORDER BY position
+                """,
+                period
+            ).fetchall()
+        links = [EmployeeLink(employee=row["employee"], branch=row["branch"], url=row["url"]) for row in rows]
+        return LinkIndex(links, version=header["version"], built_at=header["built_at"])
+
+class LinkIndexes:
+    """
+    One `LinkIndex` per `(dept, year, month)`, kept in memory and in `store`.
+
+    While the roster cache holds a fresh roster (within its TTL), an index built
+    for that roster version is served without touching Google APIs. Otherwise the
+    roster is re-read through the cache, and the index is rebuilt from the
+    `LinkTable` if the roster changed. After a restart, a stored index younger
+    than the roster TTL is served as is, and an older one is kept as long as the
+    re-read roster has the same (content-hashed) version.
+    """
+    def __init__(
+        self,
+        roster_cache: RosterCache,
+        base_urls: dict[str, str],
+        link_table: LinkTable = None,
+        store: LinkIndexStore = None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.roster_cache = roster_cache
+        self.base_urls = base_urls
+        self.link_table = link_table or LinkTable()
+        self.store = store
+        self._indexes: dict[tuple[str, int, int], LinkIndex] = {}
+        self._lock = threading.Lock()
+
+    def _period(self, dept: str, year: int, month: int) -> tuple[str, int, int]:
+        if dept not in self.base_urls:
+            raise ValueError(f"Unknown department: {dept}. Choose from {', '.join(self.base_urls)}.")
+        return (dept, year, month)
+
+    def _fresh(self, period: tuple[str, int, int]) -> Optional[LinkIndex]:
+        # Called with `_lock` held.
+        index = self._indexes.get(period)
+        if index is None and self.store:
+            index = self._indexes[period] = self.store.load(*period)
+        if index is None:
+            return None
+        roster = self.roster_cache.peek()
+        if roster is not None and index.version == roster.version:
+            return index
+        if roster is None and time.time() - index.built_at < self.roster_cache.ttl:
+            return index
+        return None
+
+    def _build(self, period: tuple[str, int, int], roster: Roster) -> LinkIndex:
+        # Called with `_lock` held.
+        index = self._indexes.get(period)
+        if index is not None and index.version == roster.version:
+            return index
+        dept, year, month = period
+        name_of = (lambda emp: emp.grm_name) if dept == "GRM" else (lambda emp: emp.sc_name)
+        links = self.link_table.get(self.base_urls[dept], year, month, roster, name_of)
+        index = self._indexes[period] = LinkIndex(list(links.values()), version=roster.version)
+        if self.store:
+            self.store.save(*period, index)
+        self.logger.info(f"Built {dept} link index for {year}-{month:02d}: {len(index)} employee(s)")
+        return index
+
+    def get(self, dept: str, year: int, month: int) -> LinkIndex:
+        period = self._period(dept, year, month)
+        with self._lock:
+            index = self._fresh(period)
+        if index is not None:
+            return index
+        # Fetched outside `_lock`: a roster refresh must not stall lookups of other periods.
+        roster = self.roster_cache.get()
+        with self._lock:
+            return self._build(period, roster)
+
+    async def aget(self, dept: str, year: int, month: int) -> LinkIndex:
+        """`get` for async endpoints; a fresh in-memory index is returned without leaving the event loop."""
+        period = self._period(dept, year, month)
+        index, roster = self._indexes.get(period), self.roster_cache.peek()
+        if index is not None and roster is not None and index.version == roster.version:
+            return index
+
+        def fresh() -> Optional[LinkIndex]:
+            with self._lock:
+                return self._fresh(period)
+        index = await asyncio.to_thread(fresh)
+        if index is not None:
+            return index
+
+        roster = await self.roster_cache.aget()
+
+        def build() -> LinkIndex:
+            with self._lock:
+                return self._build(period, roster)
+        return await asyncio.to_thread(build)
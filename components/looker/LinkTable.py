@@ -0,0 +1,105 @@
+from components.looker.LookerStudioURLBuilder import LookerStudioURLBuilder
+from components.utils.Roster import Employee, Roster
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Iterable
+import threading
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+@dataclass(frozen=True, slots=True)
+class EmployeeLink:
+    employee: str  # upper-cased, as the report filters on it
+    branch: str
+    url: str
+
+def _by_grm(employees: Iterable[Employee]) -> list[Employee]:
+    """`employees` grouped by GRM, groups in order of first appearance; the order links are built in."""
+    grouped: dict[str, list[Employee]] = {}
+    for employee in employees:
+        grouped.setdefault(employee.grm_email_address, []).append(employee)
+    return [employee for members in grouped.values() for employee in members]
+
+def build_links(
+    base_url: str,
+    year: int,
+    month: int,
+    employees: Iterable[Employee],
+    name_of: Callable[[Employee], str] = lambda employee: employee.sc_name,
+    lang: str = "en"
+) -> dict[str, EmployeeLink]:
+    """
+    Looker links of `employees` for one period in a single pass, keyed by employee
+    name. Employees are ordered by GRM (first appearance); when two share a
+    name, the last one wins.
+    """
+    ordered = _by_grm(employees)
+    names = [name_of(employee).upper() for employee in ordered]
+    urls = LookerStudioURLBuilder.build_urls(base_url, year, month, names, lang=lang)
+    return {
+        name: EmployeeLink(employee=name, branch=employee.branch or "Unassigned", url=url)
+        for name, employee, url in zip(names, ordered, urls)
+    }
+
+class LinkTable:
+    """
+    Memoized link tables of the whole roster, one per `(base_url, year, month, roster version)`.
+
+    A table for a new roster version is derived from the previous version's table
+    when the roster carries the diff between them (see `RosterCache`): only the
+    links of the names the added, removed and changed employees carry are rebuilt,
+    from everyone on the roster with those names, since names can be shared. The
+    `max_tables` most recently used tables are kept.
+    """
+    def __init__(self, max_tables: int = 24):
+        self.logger = logging.getLogger(__name__)
+        self.max_tables = max_tables
+        self._tables: OrderedDict[tuple[str, int, int, str], dict[str, EmployeeLink]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.builds = 0
+        self.patches = 0
+
+    def get(
+        self,
+        base_url: str,
+        year: int,
+        month: int,
+        roster: Roster,
+        name_of: Callable[[Employee], str] = lambda employee: employee.sc_name
+    ) -> dict[str, EmployeeLink]:
+        key = (base_url, year, month, roster.version)
+        with self._lock:
+            if key in self._tables:
+                self._tables.move_to_end(key)
+                self.hits += 1
+                return self._tables[key]
+
+            diff = roster.diff
+            previous = self._tables.get((base_url, year, month, diff.base_version)) if diff else None
+            if previous is not None:
+                links = dict(previous)
+                names = {name_of(employee).upper() for employee in diff.outgoing + diff.incoming}
+                for name in names:
+                    links.pop(name, None)
+                holders = [employee for employee in _by_grm(roster) if name_of(employee).upper() in names]
+                links.update(build_links(base_url, year, month, holders, name_of))
+                self.patches += 1
+                self.logger.info(
+                    f"Patched {len(diff.outgoing) + len(diff.incoming)} link(s) for {year}-{month:02d}"
+                )
+            else:
+                links = build_links(base_url, year, month, roster, name_of)
+                self.builds += 1
+
+            self._tables[key] = links
+            while len(self._tables) > self.max_tables:
+                self._tables.popitem(last=False)
+            return links
+
+    def stats(self) -> dict:
+        return {"tables": len(self._tables), "hits": self.hits, "builds": self.builds, "patches": self.patches}
@@ -1,3 +1,4 @@
+from typing import Iterable
 import urllib.parse
 import pyperclip
 import logging
@@ -40,4 +41,24 @@ class LookerStudioURLBuilder:
         if self.is_clip:
             self.logger.info("Copied to clipboard!")
             pyperclip.copy(full_url)
-        return full_url
\ No newline at end of file
+        return full_url
+
+    @staticmethod
+    def build_urls(base_url: str, year: int, month: int, employee_names: Iterable[str], lang: str = "en") -> list[str]:
+        """
+        `get_looker_url()` for many employees of one period at once.
+
+        The encoded `params` only differ in the name, so the shared prefix and
+        suffix are encoded once and each name is encoded on its own; the URLs are
+        identical to the per-employee ones.
+        """
+        params = json.dumps({
+            "ds0.sc_employee_year": year,
+            "ds0.sc_employee_month": month,
+            "ds0.sc_employee_name": None
+        })
+        head, tail = params.rsplit("null", 1)
+        prefix = f"{base_url}?hl={lang}&params={urllib.parse.quote(head)}"
+        suffix = urllib.parse.quote(tail)
+        quote, dumps = urllib.parse.quote, json.dumps
+        return [f"{prefix}{quote(dumps(name))}{suffix}" for name in employee_names]
@@ -3,7 +3,11 @@ from playwright.sync_api import (
     Browser,
     Page
 )
-from typing import Literal
+from components.looker.ReportSteps import DownloadMode, NavigationMode, ReportSteps, drive
+from components.looker.RequestPolicy import RequestPolicy
+from components.looker.BrowserPool import BrowserPool
+from components.storage import ObjectStore
+from typing import Literal, Optional
 import logging
 
 logging.basicConfig(
@@ -11,7 +15,26 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
-class ReportDownloader:
+class ReportDownloader(ReportSteps):
+    """
+    Downloads one employee's report card from Looker Studio.
+
+    `mode="fixed"` keeps the original `slow_mo` and fixed sleeps. `mode="fast"`
+    drops them and waits on real signals instead: network idle, charts rendered,
+    the download dialog showing up and the download stream finishing. Either way
+    `self.timer` records how long each step took.
+
+    The finished PDF is streamed from Playwright's download artifact straight
+    into `store` under `{run_id}/{branch}/{employee}.pdf`.
+
+    With `navigation="in_place"` and a pooled page that already shows the same
+    report, only the employee filter params are swapped in the loaded app; if
+    the new employee doesn't show up in time it falls back to a full load.
+    `self.navigated` tells which path was taken (`full`, `in_place`, `fallback`).
+
+    `request_policy` filters the standalone browser's requests; pooled pages
+    use the pool's policy instead.
+    """
     def __init__(
         self,
         url: str = None,
@@ -19,16 +42,29 @@ class ReportDownloader:
         dept: Literal["SC", "SC_TEST", "GRM"] = None,
         employee_name: str = None,
         headless: bool = False,
-        slow_mo: int = 100
+        slow_mo: int = 100,
+        pool: BrowserPool = None,
+        mode: DownloadMode = "fixed",
+        store: ObjectStore = None,
+        run_id: str = None,
+        navigation: NavigationMode = "full",
+        request_policy: RequestPolicy = None
     ):
-        self.logger = logging.getLogger(__name__)
-        self.url = url
-        self.branch = branch
-        self.dept = dept
-        self.employee_name = employee_name
+        super().__init__(
+            url=url,
+            branch=branch,
+            dept=dept,
+            employee_name=employee_name,
+            mode=mode,
+            store=store,
+            run_id=run_id,
+            navigation=navigation
+        )
         self.headless = headless
-        self.slow_mo = slow_mo
-        
+        self.slow_mo = 0 if mode == "fast" else slow_mo
+        self.pool = pool
+        self.request_policy = request_policy
+
         self.sync_playwright_instance = None
         self.browser: Browser = None
         self.page: Page = None
@@ -48,55 +84,57 @@ class ReportDownloader:
             slow_mo=self.slow_mo
         )
         self.page = self.browser.new_page()
+        if self.request_policy:
+            self.page.route("**/*", self.request_policy.handle)
 
     def _navigate_to_page(self):
-        self.logger.info(f"Opening website ({self.url})...")
-        try:
-            self.page.goto(
-                self.url,
-                wait_until="load",
-                timeout=30000
-            )
-            self.logger.info("Page loaded!")
-            self.page.wait_for_timeout(2000)
-        except Exception as e:
-            self.logger.error(f"Error loading web page: {e}")
-            self._close_browser()
-            raise
+        drive(self._navigate_steps())
 
     def _close_browser(self):
         if self.browser:
             self.browser.close()
 
-    def _download_report_card(self, dept: str, filename: str):
-        self.logger.info("Downloading report card...")
+    def _download_file(self):
+        with self.page.expect_download() as file:
+            self.page.click(self.DOWNLOAD_BUTTON_SELECTOR)
+        return file.value
+
+    def _save(self, source: str, dept: str) -> dict:
+        return self._store_download(source, dept)
+
+    def _download_report_card(self, dept: str) -> Optional[dict]:
         try:
-            self.logger.info("Locating 'Download report' button...")
-            self.page.click("mat-icon:has-text('arrow_drop_down')")
-            self.page.click("button:has-text('Download report')")
-            self.logger.info("Found! Clicked!")
-
-            self.page.click("md-radio-button[aria-label='Select Pages']")
-            self.logger.info(f"Selecting {dept}...")
-            self.page.click(f"div.pageName:has-text('{dept}')")
-
-            with self.page.expect_download() as file:
-                self.page.click("button.download-button:has-text('Download')")
-            download = file.value
-            download.save_as(f"./tmp/report_cards/{dept}/{self.branch}/{filename}.pdf")
-            self.page.wait_for_timeout(2500)
-            self.logger.info("Done downloading!")
-        except Exception as e:
-            self.logger.error(f"Error downloading report card: {e}")
+            return drive(self._download_steps(dept))
+        except Exception:
+            if self.pool:
+                # Let `BrowserPool.page` see it, so the possibly dead page is recycled.
+                raise
+            return None
+
+    def _run_pooled(self) -> Optional[dict]:
+        with self.pool.page() as page:
+            self.page = page
+            try:
+                self._navigate_to_page()
+                return self._download_report_card(dept=self.dept)
+            finally:
+                self.page = None
 
-    def run_automation(self):
+    def run_automation(self) -> Optional[dict]:
+        """
+        Renders and downloads the report card. Returns its `ObjectStore` record, or
+        `None` if the download failed; on a pooled page the error is raised instead,
+        so the pool recycles the page.
+        """
         self.logger.info("Running automation...")
+        if self.pool:
+            return self._run_pooled()
         p = self._get_sync_playwright_instance()
         try:
             self._launch_browser(p)
             self._navigate_to_page()
-            self._download_report_card(dept=self.dept, filename=f"{self.dept}_{self.employee_name}")
+            return self._download_report_card(dept=self.dept)
         finally:
             self._close_browser()
             if self.sync_playwright_instance:
-                self.sync_playwright_instance.stop()
\ No newline at end of file
+                self.sync_playwright_instance.stop()
@@ -0,0 +1,214 @@
+from components.storage import ObjectStore, LocalObjectStore
+from components.looker.StepTimer import StepTimer
+from typing import Any, Generator, Literal, Optional
+from urllib.parse import urlsplit
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+DownloadMode = Literal["fixed", "fast"]
+NavigationMode = Literal["full", "in_place"]
+
+# A step generator yields each Playwright call it makes and is sent back the
+# call's result; see `ReportSteps`.
+Steps = Generator[Any, Any, Any]
+
+# Swaps the `params` query string of the already-loaded report without a page
+# load and lets Looker's router pick the new filter values up.
+SWITCH_SCRIPT = """
+url => {
+    history.pushState(history.state, "", url);
+    window.dispatchEvent(new PopStateEvent("popstate", { state: history.state }));
+}
+"""
+
+def same_report(current_url: str, target_url: str) -> bool:
+    """True if both URLs point at the same Looker report and only the query differs."""
+    current, target = urlsplit(current_url), urlsplit(target_url)
+    return (current.scheme, current.netloc, current.path) == (target.scheme, target.netloc, target.path)
+
+class ReportSteps:
+    """
+    Navigation, download and store logic shared by `ReportDownloader` and
+    `AsyncReportDownloader`.
+
+    The steps are written once as generators that `yield` every Playwright call
+    (`source = yield self.page.goto(...)`). The sync downloader sends each result
+    straight back; the async one awaits it first (see `drive_async`). Only the
+    calls that differ beyond that, `_download_file` and `_save`, are implemented
+    per subclass.
+    """
+    # Looker Studio renders every chart inside a `lego-component`; while a chart is
+    # still querying it shows one of the progress indicators below.
+    CHART_SELECTOR = "div.lego-component"
+    LOADING_SELECTOR = "div.lego-component .loading-indicator, div.lego-component mat-progress-spinner"
+    MENU_SELECTOR = "mat-icon:has-text('arrow_drop_down')"
+    DOWNLOAD_REPORT_SELECTOR = "button:has-text('Download report')"
+    DIALOG_SELECTOR = "md-radio-button[aria-label='Select Pages']"
+    DOWNLOAD_BUTTON_SELECTOR = "button.download-button:has-text('Download')"
+    NAVIGATION_TIMEOUT = 30000
+    NETWORK_IDLE_TIMEOUT = 15000
+    RENDER_TIMEOUT = 30000
+    SWITCH_TIMEOUT = 15000
+    # `fixed` mode sleeps instead of waiting on render and download signals.
+    FIXED_RENDER_WAIT = 2000
+    FIXED_SAVE_WAIT = 2500
+
+    def __init__(
+        self,
+        url: str = None,
+        branch: str = None,
+        dept: Literal["SC", "SC_TEST", "GRM"] = None,
+        employee_name: str = None,
+        mode: DownloadMode = "fixed",
+        store: ObjectStore = None,
+        run_id: str = None,
+        navigation: NavigationMode = "full"
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.url = url
+        self.branch = branch
+        self.dept = dept
+        self.employee_name = employee_name
+        self.mode = mode
+        self.store = store or LocalObjectStore("./tmp/report_cards")
+        self.run_id = run_id or dept
+        self.navigation = navigation
+        self.navigated: Optional[str] = None
+        self.timer = StepTimer()
+        self.page = None
+
+    def _download_file(self):
+        """Clicks Download and returns the finished download (sync) or a coroutine of it (async)."""
+        raise NotImplementedError
+
+    def _save(self, source: str, dept: str):
+        """Stores the downloaded file; returns the record (sync) or a coroutine of it (async)."""
+        raise NotImplementedError
+
+    def _store_download(self, source: str, dept: str) -> dict:
+        key = ObjectStore.report_card_key(self.run_id, self.branch, self.employee_name)
+        with open(source, "rb") as f:
+            return self.store.put(
+                key,
+                f,
+                metadata={
+                    "run_id": self.run_id,
+                    "dept": dept,
+                    "branch": self.branch,
+                    "employee": self.employee_name
+                }
+            )
+
+    def _render_steps(self) -> Steps:
+        """Waits until the data requests settle and no chart is still loading."""
+        try:
+            yield self.page.wait_for_load_state("networkidle", timeout=self.NETWORK_IDLE_TIMEOUT)
+        except Exception:
+            # Looker keeps some long-polling connections open; charts are checked below anyway.
+            self.logger.warning("Network did not go idle; falling back to chart render checks")
+        yield self.page.wait_for_selector(self.CHART_SELECTOR, state="visible", timeout=self.RENDER_TIMEOUT)
+        yield self.page.wait_for_function(
+            "selector => !document.querySelector(selector)",
+            arg=self.LOADING_SELECTOR,
+            timeout=self.RENDER_TIMEOUT
+        )
+
+    def _switch_steps(self) -> Steps:
+        """Applies this employee's filter params to the loaded report. Returns `False` if it didn't take."""
+        self.logger.info(f"Switching report to {self.employee_name} in place...")
+        try:
+            yield self.page.evaluate(SWITCH_SCRIPT, self.url)
+            yield self.page.get_by_text(self.employee_name, exact=False).first.wait_for(
+                state="visible",
+                timeout=self.SWITCH_TIMEOUT
+            )
+            yield from self._render_steps()
+            return True
+        except Exception as e:
+            self.logger.warning(f"In-place switch failed ({e}); falling back to full navigation")
+            return False
+
+    def _navigate_steps(self) -> Steps:
+        if self.navigation == "in_place" and same_report(self.page.url, self.url):
+            with self.timer.step("switch"):
+                switched = yield from self._switch_steps()
+            if switched:
+                self.navigated = "in_place"
+                return
+            self.navigated = "fallback"
+        else:
+            self.navigated = "full"
+
+        self.logger.info(f"Opening website ({self.url})...")
+        try:
+            with self.timer.step("navigate"):
+                yield self.page.goto(
+                    self.url,
+                    wait_until="domcontentloaded" if self.mode == "fast" else "load",
+                    timeout=self.NAVIGATION_TIMEOUT
+                )
+            self.logger.info(f"Page loaded for {self.employee_name}!")
+            with self.timer.step("render"):
+                if self.mode == "fast":
+                    yield from self._render_steps()
+                else:
+                    yield self.page.wait_for_timeout(self.FIXED_RENDER_WAIT)
+        except Exception as e:
+            self.logger.error(f"Error loading web page: {e}")
+            raise
+
+    def _download_steps(self, dept: str) -> Steps:
+        """Downloads the `dept` page and returns its `ObjectStore` record; errors are logged and raised."""
+        self.logger.info(f"Downloading report card for {self.employee_name}...")
+        try:
+            with self.timer.step("open_dialog"):
+                yield self.page.click(self.MENU_SELECTOR)
+                yield self.page.click(self.DOWNLOAD_REPORT_SELECTOR)
+                if self.mode == "fast":
+                    yield self.page.wait_for_selector(self.DIALOG_SELECTOR, state="visible")
+
+            with self.timer.step("select_pages"):
+                yield self.page.click(self.DIALOG_SELECTOR)
+                self.logger.info(f"Selecting {dept}...")
+                yield self.page.click(f"div.pageName:has-text('{dept}')")
+
+            with self.timer.step("download"):
+                download = yield self._download_file()
+                # Resolves once the download stream has finished.
+                source = yield download.path()
+            with self.timer.step("save"):
+                record = yield self._save(source, dept)
+                yield download.delete()
+                if self.mode != "fast":
+                    yield self.page.wait_for_timeout(self.FIXED_SAVE_WAIT)
+            self.logger.info(f"Done downloading! Stored as {record['key']}")
+            return record
+        except Exception as e:
+            self.logger.error(f"Error downloading report card: {e}")
+            raise
+
+def drive(steps: Steps) -> Any:
+    """Runs a step generator whose yielded calls have already run (sync Playwright)."""
+    result = None
+    try:
+        while True:
+            result = steps.send(result)
+    except StopIteration as stop:
+        return stop.value
+
+async def drive_async(steps: Steps) -> Any:
+    """Runs a step generator whose yielded calls are awaitables (async Playwright)."""
+    result, error = None, None
+    while True:
+        try:
+            call = steps.throw(error) if error else steps.send(result)
+        except StopIteration as stop:
+            return stop.value
+        try:
+            result, error = await call, None
+        except Exception as e:
+            result, error = None, e
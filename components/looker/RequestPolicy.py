@@ -0,0 +1,211 @@
+from playwright.async_api import Route as AsyncRoute
+from playwright.sync_api import Route
+from collections import Counter
+from typing import Iterable, Optional
+from urllib.parse import urlsplit
+import threading
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class BlockedSizes:
+    """
+    Body sizes of blocked URLs, measured by audited runs. A policy in enforce
+    mode estimates `bytes_saved` from them; hand the same instance to every
+    policy that should reuse the measurements (e.g. one per process).
+    """
+    def __init__(self):
+        self._sizes: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def get(self, url: str) -> Optional[int]:
+        with self._lock:
+            return self._sizes.get(url)
+
+    def record(self, url: str, size: int):
+        with self._lock:
+            self._sizes[url] = size
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._sizes)
+
+class RequestPolicy:
+    """
+    `route` handler that aborts requests a report-card render doesn't need
+    (analytics beacons, Google bar widgets, media, ...).
+
+    A request is blocked when its resource type is in `deny_types`, its host
+    (or a parent domain) is in `deny_hosts`, or `allow_types` is set and its type
+    isn't in it. Hosts in `allow_hosts` always go through. Anything let through
+    falls back to the next handler, e.g. the `AssetCache`.
+
+    With `audit=True` (`LOOKER_REQUEST_AUDIT`, `audit=true` on `/get-report-card`
+    or `--request-audit` on the worker) nothing is blocked; would-be-blocked
+    requests are fetched and their body sizes counted as `bytes_saved`. In
+    enforce mode `bytes_saved` adds up the sizes an earlier audit recorded in
+    `sizes` for the same URLs; blocked requests never measured are counted as
+    `unmeasured`, and `stats()` then reports `bytes_saved` as unknown (`None`)
+    next to the measured part, `bytes_saved_at_least`.
+
+    ```python
+    policy = RequestPolicy.profile("safe", sizes=sizes)
+    context.route("**/*", policy.handle)
+    ...
+    policy.stats()  # {"blocked": 42, "bytes_saved": 318211, "unmeasured": 0, ...}
+    ```
+    """
+
+    PROFILES = {
+        "off": {},
+        # Never touches anything the PDF export draws: scripts, styles, fonts and report images stay.
+        "safe": {
+            "deny_types": ("media", "texttrack", "manifest", "eventsource"),
+            "deny_hosts": (
+                "google-analytics.com",
+                "googletagmanager.com",
+                "doubleclick.net",
+                "play.google.com",
+                "ogs.google.com",
+                "feedback-pa.clients6.google.com"
+            )
+        },
+        # Also drops web fonts and account avatars; the PDF falls back to system fonts.
+        "lean": {
+            "deny_types": ("media", "texttrack", "manifest", "eventsource", "font"),
+            "deny_hosts": (
+                "google-analytics.com",
+                "googletagmanager.com",
+                "doubleclick.net",
+                "play.google.com",
+                "ogs.google.com",
+                "feedback-pa.clients6.google.com",
+                "fonts.googleapis.com",
+                "fonts.gstatic.com",
+                "lh3.googleusercontent.com"
+            )
+        }
+    }
+
+    def __init__(
+        self,
+        deny_types: Iterable[str] = (),
+        deny_hosts: Iterable[str] = (),
+        allow_types: Iterable[str] = (),
+        allow_hosts: Iterable[str] = (),
+        audit: bool = False,
+        name: str = "custom",
+        sizes: BlockedSizes = None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.deny_types = frozenset(deny_types)
+        self.deny_hosts = tuple(host.lower() for host in deny_hosts)
+        self.allow_types = frozenset(allow_types)
+        self.allow_hosts = tuple(host.lower() for host in allow_hosts)
+        self.audit = audit
+        self.name = name
+        self.sizes = sizes if sizes is not None else BlockedSizes()
+        self.reset()
+
+    @classmethod
+    def profile(cls, name: str, audit: bool = False, sizes: BlockedSizes = None) -> "RequestPolicy":
+        if name not in cls.PROFILES:
+            raise ValueError(f"Unknown request profile: {name}. Choose from {', '.join(cls.PROFILES)}.")
+        return cls(**cls.PROFILES[name], audit=audit, name=name, sizes=sizes)
+
+    def reset(self):
+        """Zeroes the counters, e.g. at the start of a run. Audited sizes are kept."""
+        self.allowed = 0
+        self.blocked = 0
+        self.bytes_saved = 0
+        self.unmeasured = 0
+        self.blocked_by_type: Counter[str] = Counter()
+        self.blocked_by_host: Counter[str] = Counter()
+
+    @staticmethod
+    def _matches(host: str, domains: tuple[str, ...]) -> bool:
+        return any(host == domain or host.endswith(f".{domain}") for domain in domains)
+
+    def should_block(self, url: str, resource_type: str) -> bool:
+        host = (urlsplit(url).hostname or "").lower()
+        if self._matches(host, self.allow_hosts):
+            return False
+        if resource_type in self.deny_types or self._matches(host, self.deny_hosts):
+            return True
+        return bool(self.allow_types) and resource_type not in self.allow_types
+
+    def _count_blocked(self, url: str, resource_type: str):
+        self.blocked += 1
+        self.blocked_by_type[resource_type] += 1
+        self.blocked_by_host[urlsplit(url).hostname or ""] += 1
+
+    def _count_aborted(self, url: str):
+        size = self.sizes.get(url)
+        if size is None:
+            self.unmeasured += 1
+        else:
+            self.bytes_saved += size
+
+    def _count_audited(self, url: str, size: int):
+        self.sizes.record(url, size)
+        self.bytes_saved += size
+
+    def handle(self, route: Route):
+        """Sync `context.route("**/*", policy.handle)` handler."""
+        request = route.request
+        if not self.should_block(request.url, request.resource_type):
+            self.allowed += 1
+            route.fallback()
+            return
+        self._count_blocked(request.url, request.resource_type)
+        if not self.audit:
+            self._count_aborted(request.url)
+            route.abort("blockedbyclient")
+            return
+        try:
+            response = route.fetch()
+            body = response.body()
+        except Exception as e:
+            self.logger.warning(f"Audit fetch failed, letting the browser load it: {request.url}: {e}")
+            route.continue_()
+            return
+        self._count_audited(request.url, len(body))
+        route.fulfill(response=response, body=body)
+
+    async def handle_async(self, route: AsyncRoute):
+        """`async_playwright` version of `handle`."""
+        request = route.request
+        if not self.should_block(request.url, request.resource_type):
+            self.allowed += 1
+            await route.fallback()
+            return
+        self._count_blocked(request.url, request.resource_type)
+        if not self.audit:
+            self._count_aborted(request.url)
+            await route.abort("blockedbyclient")
+            return
+        try:
+            response = await route.fetch()
+            body = await response.body()
+        except Exception as e:
+            self.logger.warning(f"Audit fetch failed, letting the browser load it: {request.url}: {e}")
+            await route.continue_()
+            return
+        self._count_audited(request.url, len(body))
+        await route.fulfill(response=response, body=body)
+
+    def stats(self) -> dict:
+        return {
+            "profile": self.name,
+            "audit": self.audit,
+            "allowed": self.allowed,
+            "blocked": self.blocked,
+            "bytes_saved": None if self.unmeasured else self.bytes_saved,
+            "bytes_saved_at_least": self.bytes_saved,
+            "unmeasured": self.unmeasured,
+            "blocked_by_type": dict(self.blocked_by_type),
+            "blocked_by_host": dict(self.blocked_by_host.most_common(10))
+        }
@@ -0,0 +1,70 @@
+from typing import Optional
+import tempfile
+import logging
+import time
+import json
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class SessionState:
+    """
+    On-disk Playwright `storage_state` (cookies + localStorage) shared by every
+    browser context, pool member and run, so only the first render pays for
+    Looker Studio's auth redirects and bootstrap.
+
+    The state expires `max_age` seconds after it was written and is re-saved at
+    most every `save_interval` seconds. `invalidate()` drops it, e.g. after an
+    auth failure or a Looker UI change.
+    """
+    def __init__(self, path: str, max_age: float = 12 * 3600, save_interval: float = 300):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.max_age = max_age
+        self.save_interval = save_interval
+        self._saved_at = 0.0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _age(self) -> Optional[float]:
+        try:
+            return time.time() - os.path.getmtime(self.path)
+        except OSError:
+            return None
+
+    def load(self) -> Optional[str]:
+        """Returns the state file to pass as `storage_state`, or `None` if missing or expired."""
+        age = self._age()
+        if age is None:
+            return None
+        if age > self.max_age:
+            self.logger.info("Looker session state expired; starting cold")
+            self.invalidate()
+            return None
+        return self.path
+
+    def needs_save(self) -> bool:
+        return time.time() - self._saved_at >= self.save_interval
+
+    def save(self, state: dict):
+        """Atomically writes a `context.storage_state()` snapshot."""
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(self.path) or ".", suffix=".part")
+        try:
+            with os.fdopen(fd, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        self._saved_at = time.time()
+        self.logger.info("Saved Looker session state")
+
+    def invalidate(self):
+        self._saved_at = 0.0
+        if os.path.exists(self.path):
+            os.remove(self.path)
@@ -0,0 +1,40 @@
+from contextlib import contextmanager
+from typing import Iterator
+import time
+
+class StepTimer:
+    """
+    Records wall-clock seconds per named step.
+
+    Works around `await` calls too, so both report downloaders share it.
+
+    ```python
+    timer = StepTimer()
+    with timer.step("navigate"):
+        page.goto(url)
+    timer.as_dict()  # {"navigate": 1.234}
+    ```
+    """
+    def __init__(self):
+        self.timings: dict[str, float] = {}
+
+    @contextmanager
+    def step(self, name: str) -> Iterator[None]:
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.timings[name] = round(self.timings.get(name, 0.0) + time.perf_counter() - started, 3)
+
+    def as_dict(self) -> dict[str, float]:
+        return dict(self.timings)
+
+def summarize_timings(results: list[dict]) -> dict[str, float]:
+    """Averages the per-step `timings` of a batch of report-card results."""
+    totals: dict[str, float] = {}
+    counts: dict[str, int] = {}
+    for result in results:
+        for name, seconds in (result.get("timings") or {}).items():
+            totals[name] = totals.get(name, 0.0) + seconds
+            counts[name] = counts.get(name, 0) + 1
+    return {name: round(totals[name] / counts[name], 3) for name in totals}
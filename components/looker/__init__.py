@@ -1,7 +1,27 @@
 from components.looker.LookerStudioURLBuilder import LookerStudioURLBuilder
+from components.looker.LinkTable import EmployeeLink, LinkTable
+from components.looker.LinkIndex import LinkIndex, LinkIndexes, LinkIndexStore
 from components.looker.ReportDownloader import ReportDownloader
+from components.looker.AsyncReportDownloader import AsyncReportDownloader
+from components.looker.AsyncBrowserPool import AsyncBrowserPool
+from components.looker.SessionState import SessionState
+from components.looker.BrowserPool import BrowserPool
+from components.looker.RequestPolicy import BlockedSizes, RequestPolicy
+from components.looker.AssetCache import AssetCache
 
 __all__ = [
+    "AsyncReportDownloader",
+    "AsyncBrowserPool",
+    "SessionState",
+    "AssetCache",
+    "RequestPolicy",
+    "BlockedSizes",
+    "BrowserPool",
     "LookerStudioURLBuilder",
+    "EmployeeLink",
+    "LinkTable",
+    "LinkIndex",
+    "LinkIndexes",
+    "LinkIndexStore",
     "ReportDownloader"
 ]
\ No newline at end of file
@@ -1,18 +1,48 @@
 from components import (
-    LookerStudioURLBuilder,
     GoogleServiceFactory,
-    ReportDownloader
+    AsyncReportDownloader,
+    AsyncBrowserPool,
+    ReportDownloader,
+    RequestPolicy,
+    SessionState,
+    BrowserPool,
+    AssetCache
 )
-from urllib.parse import unquote, urlparse, parse_qs
-from collections import defaultdict
+from components.looker.ReportSteps import DownloadMode, NavigationMode
+from components.looker.LinkTable import LinkTable, build_links
+from components.looker.StepTimer import summarize_timings
+from components.looker.RequestPolicy import BlockedSizes
+from components.utils.RunManifest import RunManifest, RerunMode
+from components.utils.Roster import Employee, Roster
+from components.utils.RosterCache import RosterCache
+from components.utils.RosterSync import RosterSync
+from components.storage import ObjectStore, ObjectStoreFactory
+from components.utils.WorkQueue import WorkQueue
+from functools import lru_cache
+from typing import Callable
 from config import (
+    LOOKER_REQUEST_PROFILE,
+    LOOKER_REQUEST_AUDIT,
+    LOOKER_SESSION_MAX_AGE,
+    LOOKER_SESSION_FILE,
+    RUN_MANIFEST_FILE,
+    LOOKER_CACHE_DIR,
+    ROSTER_SNAPSHOT_FILE,
+    ROSTER_CACHE_TTL,
+    SHEETS_CHUNK_ROWS,
+    WORK_QUEUE_FILE,
     SERVICE_FILE,
     GRM_BASE_URL,
-    SC_BASE_URL,
     Sheets
 )
+import multiprocessing
+import threading
+import asyncio
 import logging
+import socket
+import uuid
 import json
+import time
 import os
 
 logging.basicConfig(
@@ -20,144 +50,378 @@ logging.basicConfig(
     format='%(asctime)s - %(level)s - %(message)s'
 )
 
-def group_by_boss(employees: list[dict]) -> dict[str, list[dict]]:
-    """
-    Groups the SC employees by GRM.
-
-    Returns a structure like this:
-
-    ```python
-    {
-        "boss1@email.com": [
-            {emp1},
-            {emp2},
-            ...
-        ]
+def browser_caches(request_policy: RequestPolicy = None) -> dict:
+    """Shared Looker session state, asset cache and request policy, as keyword arguments for the browser pools."""
+    return {
+        "session": SessionState(LOOKER_SESSION_FILE, max_age=LOOKER_SESSION_MAX_AGE),
+        "asset_cache": AssetCache(LOOKER_CACHE_DIR),
+        "request_policy": request_policy
     }
-    ```
-    """
-    grouped = defaultdict(list)
-    for emp in employees:
-        grouped[emp["grm_email_address"]].append(emp)
-    return grouped
 
-def group_by_branch(employees: list[dict]) -> dict[str, list[dict]]:
-    """
-    Groups the employees by branch.
-
-    Returns:
-    
-    ```python
-    {
-        "Shaw": [emp1, emp2, ...],
-        "Batangas": [emp1, emp2, ...],
-        ...
+def _report_card_result(
+    employee_name: str,
+    branch: str,
+    status: str,
+    started: float,
+    stored: dict = None,
+    error: str = None,
+    downloader: ReportDownloader | AsyncReportDownloader = None
+) -> dict:
+    return {
+        "employee": employee_name,
+        "branch": branch,
+        "status": status,
+        "path": stored["key"] if stored else None,
+        "size": stored["size"] if stored else None,
+        "checksum": stored["checksum"] if stored else None,
+        "error": error,
+        "duration": round(time.perf_counter() - started, 2),
+        "timings": downloader.timer.as_dict() if downloader else {},
+        "navigation": downloader.navigated if downloader else None
     }
-    ```
-    """
-    grouped = defaultdict(list)
-    for emp in employees:
-        grouped[emp["branch"]].append(emp)
-    return grouped
-
-def generate_looker_urls(
-    base_url: str,
-    emails: dict[str, list[dict]],
-    year: int,
-    month: int
-):
-    logging.info("Generating Looker Studio URLs...")
-    looker_urls = []
-    for _, employees in emails.items():
-        for emp in employees:
-            if base_url == SC_BASE_URL:
-                emp_name = f"{emp['sc_firstname']} {emp['sc_lastname']}"
-            elif base_url == GRM_BASE_URL:
-                emp_name = f"{emp['grm_name']}" # do some processing
-            url = LookerStudioURLBuilder(
-                base_url=base_url,
-                year=year,
-                month=month,
-                employee_name=emp_name.upper(),
-                lang="en"
-            ).get_looker_url()
-            looker_urls.append(url)
-    return looker_urls
-
-def parse_employee_names(urls: list[str]) -> list:
-    names = []
-    for url in urls:
-        parsed = parse_qs(urlparse(url).query)
-        params_encoded = parsed["params"][0]
-        params_decoded = unquote(params_encoded)
-        params_dict = json.loads(params_decoded)
-        names.append(params_dict["ds0.sc_employee_name"])
-    return names
 
 def generate_employee_report_card(
     url: str,
     branch: str,
     dept: str,
     employee_name: str,
-    headless: bool = False
-):
+    headless: bool = False,
+    pool: BrowserPool = None,
+    mode: DownloadMode = "fixed",
+    store: ObjectStore = None,
+    run_id: str = None,
+    navigation: NavigationMode = "full"
+) -> dict:
+    """Downloads one report card and returns its result (see `render_report_cards_concurrently`)."""
     logging.info(f"Generating report card for {employee_name}")
+    started = time.perf_counter()
     downloader = ReportDownloader(
         url=url,
         branch=branch,
         dept=dept,
         employee_name=employee_name,
-        headless=headless
+        headless=headless,
+        pool=pool,
+        mode=mode,
+        store=store,
+        run_id=run_id,
+        navigation=navigation
     )
+    try:
+        stored = downloader.run_automation()
+    except Exception as e:
+        logging.error(f"Error generating report card for {employee_name}: {e}")
+        return _report_card_result(employee_name, branch, "failed", started, error=str(e), downloader=downloader)
     logging.info("Done!")
-    downloader.run_automation()
+    if not stored:
+        return _report_card_result(employee_name, branch, "failed", started, error="Download failed", downloader=downloader)
+    return _report_card_result(employee_name, branch, "success", started, stored=stored, downloader=downloader)
 
-def generate_employee_links(
-    base_url: str,
+async def render_report_cards_concurrently(
+    links: dict[str, dict],
+    dept: str,
+    concurrency: int = 4,
+    task_timeout: float = 180,
+    headless: bool = False,
+    max_uses: int = 25,
+    mode: DownloadMode = "fixed",
+    on_result: Callable[[dict], None] = None,
+    should_cancel: Callable[[], bool] = None,
+    store: ObjectStore = None,
+    run_id: str = None,
+    navigation: NavigationMode = "full",
+    request_policy: RequestPolicy = None
+) -> list[dict]:
+    """
+    Renders report cards `concurrency` at a time, each in its own browser context.
+
+    Every employee gets at most `task_timeout` seconds; one timeout or failure never
+    stops the rest of the batch. `on_result` is called as soon as each employee finishes.
+    Once `should_cancel()` returns `True`, employees that have not started yet are reported
+    as `cancelled`. Returns one result per employee, in `links` order:
+
+    ```python
+    [
+        {"employee": "JUAN DELA CRUZ", "branch": "HYUNDAI SHAW", "status": "success",
+         "path": "SC-2025-09/HYUNDAI SHAW/JUAN DELA CRUZ.pdf", "size": 181234, "checksum": "9f2c...", "error": None,
+         "duration": 21.4, "timings": {"navigate": 3.1, "render": 2.0, ...}, "navigation": "full"},
+        ...
+    ]
+    ```
+    """
+    slow_mo = 0 if mode == "fast" else 100
+    slots = asyncio.Semaphore(concurrency)
+    async with AsyncBrowserPool(
+        size=concurrency, max_uses=max_uses, headless=headless, slow_mo=slow_mo, **browser_caches(request_policy)
+    ) as pool:
+        async def render(name: str, data: dict) -> dict:
+            async with slots:
+                if should_cancel and should_cancel():
+                    return _report_card_result(name, data["branch"], "cancelled", time.perf_counter())
+                result = await render_one(name, data)
+            if on_result:
+                on_result(result)
+            return result
+
+        async def render_one(name: str, data: dict) -> dict:
+            started = time.perf_counter()
+            downloader = AsyncReportDownloader(
+                pool=pool,
+                url=data["url"],
+                branch=data["branch"],
+                dept=dept,
+                employee_name=name,
+                mode=mode,
+                store=store,
+                run_id=run_id,
+                navigation=navigation
+            )
+            try:
+                stored = await asyncio.wait_for(downloader.run_automation(), timeout=task_timeout)
+            except asyncio.TimeoutError:
+                logging.error(f"Timed out after {task_timeout}s generating report card for {name}")
+                return _report_card_result(
+                    name, data["branch"], "timeout", started,
+                    error=f"Timed out after {task_timeout}s", downloader=downloader
+                )
+            except Exception as e:
+                logging.error(f"Error generating report card for {name}: {e}")
+                return _report_card_result(name, data["branch"], "failed", started, error=str(e), downloader=downloader)
+            if not stored:
+                return _report_card_result(name, data["branch"], "failed", started, error="Download failed", downloader=downloader)
+            return _report_card_result(name, data["branch"], "success", started, stored=stored, downloader=downloader)
+
+        return await asyncio.gather(*(render(name, data) for name, data in links.items()))
+
+def run_worker(
+    run_id: str,
+    dept: str,
     year: int,
     month: int,
-    grm_email: str = None
-):
+    queue_path: str = WORK_QUEUE_FILE,
+    manifest_path: str = RUN_MANIFEST_FILE,
+    worker_id: str = None,
+    headless: bool = True,
+    mode: DownloadMode = "fixed",
+    max_uses: int = 25,
+    lease_seconds: float = 300,
+    store_run_id: str = None,
+    navigation: NavigationMode = "full",
+    request_profile: str = LOOKER_REQUEST_PROFILE,
+    request_audit: bool = LOOKER_REQUEST_AUDIT
+) -> int:
+    """
+    Pulls employees of `run_id` from the shared `WorkQueue` until none are left.
+
+    Each claimed employee is rendered on this worker's own `BrowserPool` while a
+    background thread keeps its lease alive. Can run in-process, as one of
+    `run_sharded`'s local processes, or as an extra process via `python -m components.worker`.
+    Returns the number of employees this worker rendered.
+    """
+    worker_id = worker_id or f"{socket.gethostname()}-{os.getpid()}"
+    store_run_id = store_run_id or f"{dept}-{year}-{month:02d}"
+    queue = WorkQueue(queue_path)
+    store = ObjectStoreFactory.report_card_store()
+    manifest = RunManifest(manifest_path, store=store)
+    request_policy = RequestPolicy.profile(request_profile, audit=request_audit, sizes=default_blocked_sizes())
+    processed = 0
+    logging.info(f"Worker {worker_id} joining run {run_id}")
+
+    slow_mo = 0 if mode == "fast" else 100
+    with BrowserPool(
+        size=1, max_uses=max_uses, headless=headless, slow_mo=slow_mo, **browser_caches(request_policy)
+    ) as pool:
+        while True:
+            item = queue.claim(run_id, worker_id, lease_seconds=lease_seconds)
+            if not item:
+                break
+
+            stop_heartbeat = threading.Event()
+
+            def heartbeat(item_key: str = item["item_key"]):
+                while not stop_heartbeat.wait(lease_seconds / 3):
+                    if not queue.heartbeat(run_id, item_key, worker_id, lease_seconds=lease_seconds):
+                        logging.warning(f"Worker {worker_id} lost the lease on {item_key}")
+                        return
+
+            heartbeat_thread = threading.Thread(target=heartbeat, daemon=True)
+            heartbeat_thread.start()
+            try:
+                payload = item["payload"]
+                result = generate_employee_report_card(
+                    url=payload["url"],
+                    branch=payload["branch"],
+                    dept=dept,
+                    employee_name=item["item_key"],
+                    headless=headless,
+                    pool=pool,
+                    mode=mode,
+                    store=store,
+                    run_id=store_run_id,
+                    navigation=navigation
+                )
+            finally:
+                stop_heartbeat.set()
+                heartbeat_thread.join()
+
+            manifest.record(dept=dept, year=year, month=month, result=result)
+            if result["status"] == "success":
+                queue.complete(run_id, item["item_key"], worker_id, result)
+            else:
+                queue.fail(run_id, item["item_key"], worker_id, result["error"] or result["status"], result=result)
+            processed += 1
+
+    logging.info(f"Worker {worker_id} done with run {run_id}: rendered {processed}")
+    logging.info(f"Worker {worker_id} request policy: {request_policy.stats()}")
+    return processed
+
+def run_sharded(
+    links: dict[str, dict],
+    dept: str,
+    year: int,
+    month: int,
+    workers: int = 2,
+    headless: bool = True,
+    mode: DownloadMode = "fixed",
+    max_uses: int = 25,
+    run_id: str = None,
+    queue_path: str = WORK_QUEUE_FILE,
+    manifest_path: str = RUN_MANIFEST_FILE,
+    store_run_id: str = None,
+    progress: Callable[[int, int], None] = None,
+    should_cancel: Callable[[], bool] = None,
+    navigation: NavigationMode = "full",
+    request_profile: str = LOOKER_REQUEST_PROFILE,
+    request_audit: bool = LOOKER_REQUEST_AUDIT
+) -> list[dict]:
+    """
+    Queues `links` under a new `run_id` and renders them with `workers` local processes.
+
+    Extra worker processes can join the same run with `python -m components.worker
+    --run-id <run_id> ...` while it is in progress: on this host with a SQLite
+    `queue_path`, or from other hosts when `queue_path` and `manifest_path` are a
+    shared PostgreSQL DSN (see `WorkQueue`).
+    Returns one result per employee once every item is done, failed or cancelled.
+    """
+    run_id = run_id or uuid.uuid4().hex
+    queue = WorkQueue(queue_path)
+    queue.enqueue(run_id, {
+        name: {"url": data["url"], "branch": data["branch"]}
+        for name, data in links.items()
+    })
+    logging.info(f"Queued {len(links)} employee(s) as run {run_id} for {workers} worker(s)")
+
+    context = multiprocessing.get_context("spawn")
+    processes = [
+        context.Process(
+            target=run_worker,
+            kwargs={
+                "run_id": run_id,
+                "dept": dept,
+                "year": year,
+                "month": month,
+                "queue_path": queue_path,
+                "manifest_path": manifest_path,
+                "store_run_id": store_run_id,
+                "worker_id": f"{socket.gethostname()}-{run_id[:8]}-{index}",
+                "headless": headless,
+                "mode": mode,
+                "max_uses": max_uses,
+                "navigation": navigation,
+                "request_profile": request_profile,
+                "request_audit": request_audit
+            },
+            daemon=True
+        )
+        for index in range(workers)
+    ]
+    for process in processes:
+        process.start()
+
+    total = len(links)
+    while any(process.is_alive() for process in processes):
+        for process in processes:
+            process.join(timeout=2)
+        counts = queue.counts(run_id)
+        if progress:
+            progress(counts.get("done", 0) + counts.get("failed", 0), total)
+        if should_cancel and should_cancel():
+            cancelled = queue.cancel_pending(run_id)
+            if cancelled:
+                logging.info(f"Cancelled {cancelled} pending employee(s) of run {run_id}")
+
+    results = []
+    for item in queue.items(run_id):
+        if item["result"] and item["status"] in ("done", "failed"):
+            results.append(item["result"])
+        else:
+            status = "cancelled" if item["status"] == "cancelled" else "failed"
+            results.append(_report_card_result(
+                item["item_key"], item["payload"]["branch"], status, time.perf_counter(),
+                error=item["error"] or ("Worker exited before finishing" if status == "failed" else None)
+            ))
+    return results
+
+@lru_cache
+def default_roster_cache() -> RosterCache:
+    """Roster cache for callers outside the API (CLI, workers); the API passes its own."""
     config = {
         "service_account_file": json.loads(os.environ["LICA_HR_SERVICE_INFO"]),
         "spreadsheet_id": Sheets.EMAIL_MASTERLIST.id,
-        "spreadsheet_range": Sheets.EMAIL_MASTERLIST.range
+        "spreadsheet_range": Sheets.EMAIL_MASTERLIST.range,
+        "chunk_rows": SHEETS_CHUNK_ROWS
     }
-    gsheet = GoogleServiceFactory.create("gsheet", config)
-    emails = gsheet.fetch_emails()
+    return RosterCache(
+        GoogleServiceFactory.create("gsheet", config),
+        ttl=ROSTER_CACHE_TTL,
+        sync=RosterSync(ROSTER_SNAPSHOT_FILE)
+    )
 
-    branch_lookup = {
-        f"{emp['sc_firstname']} {emp['sc_lastname']}".upper(): emp.get("branch")
-        for emp in emails
-        if emp.get("sc_firstname") and emp.get("sc_lastname")
-    }
+@lru_cache
+def default_blocked_sizes() -> BlockedSizes:
+    """Blocked-request sizes audited in this process, reused by later runs' `bytes_saved`."""
+    return BlockedSizes()
+
+@lru_cache
+def default_link_table() -> LinkTable:
+    return LinkTable()
+
+def generate_employee_links(
+    base_url: str,
+    year: int,
+    month: int,
+    grm_email: str = None,
+    roster_cache: RosterCache = None,
+    roster: Roster = None
+):
+    """Looker links by employee name; pass `roster` when the caller already has it (e.g. from `RosterCache.aget`)."""
+    roster = roster or (roster_cache or default_roster_cache()).get()
+    name_of = (lambda emp: emp.grm_name) if base_url == GRM_BASE_URL else (lambda emp: emp.sc_name)
 
     if grm_email:
-        employee_under_grm = [emp for emp in emails if emp["grm_email_address"].lower() == grm_email.lower()]
+        employee_under_grm = list(roster.under_grm(grm_email))
         if not employee_under_grm:
             raise ValueError(f"No employees found for: {grm_email}")
 
-        grm_full_name = employee_under_grm[0]["grm_name"].upper()
+        grm_full_name = employee_under_grm[0].grm_name.upper()
         logging.info(f"GRM FULL NAME: {grm_full_name}")
 
-        employee_under_grm.append({
-            "sc_firstname": grm_full_name.split()[0],
-            "sc_lastname": " ".join(grm_full_name.split()[1:]),
-            "grm_email_address": grm_email,
-            "grm_name": grm_full_name
-        })
-        emails = employee_under_grm
-
-    grouped = group_by_boss(employees=emails)
-    looker_urls = generate_looker_urls(base_url, grouped, year, month)
-    employees = parse_employee_names(looker_urls)
-    # return {employee: url for employee, url in zip(employees, looker_urls)}
+        employee_under_grm.append(Employee(
+            sc_firstname=grm_full_name.split()[0],
+            sc_lastname=" ".join(grm_full_name.split()[1:]),
+            grm_email_address=grm_email,
+            grm_name=grm_full_name
+        ))
+        links = build_links(base_url, year, month, employee_under_grm, name_of)
+    else:
+        links = default_link_table().get(base_url, year, month, roster, name_of)
+
     return {
         employee: {
-            "url": url,
-            "branch": branch_lookup.get(employee, "Unassigned")
+            "url": link.url,
+            "branch": link.branch
         }
-        for employee, url in zip(employees, looker_urls)
+        for employee, link in links.items()
     }
 
 def run(
@@ -168,14 +432,66 @@ def run(
     employee_keys: list[str] = None,
     limit: int = None,
     headless: bool = False,
-    grm_email: str = None
-):
+    grm_email: str = None,
+    pool_size: int = 1,
+    max_uses: int = 25,
+    concurrency: int = 1,
+    task_timeout: float = 180,
+    mode: DownloadMode = "fixed",
+    rerun: RerunMode = "missing",
+    manifest: RunManifest = None,
+    progress: Callable[[int, int], None] = None,
+    should_cancel: Callable[[], bool] = None,
+    workers: int = 1,
+    store: ObjectStore = None,
+    navigation: NavigationMode = "full",
+    request_profile: str = LOOKER_REQUEST_PROFILE,
+    request_audit: bool = LOOKER_REQUEST_AUDIT,
+    request_policy: RequestPolicy = None,
+    roster_cache: RosterCache = None
+) -> list[dict]:
+    """
+    Downloads the report card of every matching employee and returns one result per employee.
+
+    The whole roster shares one Chromium instance; browser contexts are recycled every
+    `max_uses` report cards. With `concurrency > 1` the roster is rendered by
+    `render_report_cards_concurrently` instead of one employee at a time. `mode="fast"`
+    swaps the fixed sleeps for event-driven waits (see `ReportDownloader`).
+
+    Every result is recorded in the run manifest as soon as it is known, so a rerun only
+    renders what `rerun` selects (see `RunManifest`); skipped employees are reported with
+    status `skipped`.
+
+    `progress(done, total)` is called after every rendered employee. Once `should_cancel()`
+    returns `True`, the remaining employees are reported as `cancelled` and left out of the
+    manifest so the next run picks them up.
+
+    With `workers > 1` the roster is sharded across that many local worker processes
+    through a lease-based `WorkQueue` (see `run_sharded`).
+
+    PDFs go to `store` (the configured report-card store by default) under
+    `{dept}-{year}-{month:02d}/{branch}/{employee}.pdf`.
+
+    `navigation="in_place"` reuses the report already open on a pooled page and only
+    swaps the employee filter, falling back to a full load when the switch doesn't take.
+    Each result's `navigation` says which path was used; in-place switches are timed
+    under the `switch` step.
+
+    Every browser context drops the requests `request_policy` (or the `request_profile`
+    preset, see `RequestPolicy`) blocks; its counters are reset at the start of the run.
+    With `request_audit` nothing is blocked and the would-be savings are measured.
+    Sharded workers build their own policy from `request_profile`/`request_audit` and
+    log its stats.
+
+    The roster is read through `roster_cache` (a process-wide default if not given).
+    """
     try:
         links = generate_employee_links(
             base_url=base_url,
             year=year,
             month=month,
-            grm_email=grm_email
+            grm_email=grm_email,
+            roster_cache=roster_cache
         )
 
         if employee_keys:
@@ -185,14 +501,102 @@ def run(
             logging.info(f"Limit set to: {limit}")
             links = dict(list(links.items())[:limit])
 
-        for name, data in links.items():
-            generate_employee_report_card(
-                url=data["url"],
-                branch=data["branch"],
+        store = store or ObjectStoreFactory.report_card_store()
+        store_run_id = f"{dept}-{year}-{month:02d}"
+        manifest = manifest or RunManifest(RUN_MANIFEST_FILE, store=store)
+        links, skipped = manifest.select(links, dept=dept, year=year, month=month, rerun=rerun)
+
+        request_policy = request_policy or RequestPolicy.profile(
+            request_profile, audit=request_audit, sizes=default_blocked_sizes()
+        )
+        request_policy.reset()
+
+        total = len(links)
+        done = 0
+        if progress:
+            progress(done, total)
+
+        def record(result: dict):
+            nonlocal done
+            manifest.record(dept=dept, year=year, month=month, result=result)
+            done += 1
+            if progress:
+                progress(done, total)
+
+        if workers > 1:
+            results = run_sharded(
+                links=links,
                 dept=dept,
-                employee_name=name,
-                headless=headless
+                year=year,
+                month=month,
+                workers=workers,
+                headless=headless,
+                mode=mode,
+                max_uses=max_uses,
+                manifest_path=manifest.path,
+                store_run_id=store_run_id,
+                progress=progress,
+                should_cancel=should_cancel,
+                navigation=navigation,
+                request_profile=request_profile,
+                request_audit=request_audit
             )
+        elif concurrency > 1:
+            results = asyncio.run(render_report_cards_concurrently(
+                links=links,
+                dept=dept,
+                concurrency=concurrency,
+                task_timeout=task_timeout,
+                headless=headless,
+                max_uses=max_uses,
+                mode=mode,
+                on_result=record,
+                should_cancel=should_cancel,
+                store=store,
+                run_id=store_run_id,
+                navigation=navigation,
+                request_policy=request_policy
+            ))
+        else:
+            slow_mo = 0 if mode == "fast" else 100
+            with BrowserPool(
+                size=pool_size, max_uses=max_uses, headless=headless, slow_mo=slow_mo, **browser_caches(request_policy)
+            ) as pool:
+                results = []
+                for name, data in links.items():
+                    if should_cancel and should_cancel():
+                        results.append(_report_card_result(name, data["branch"], "cancelled", time.perf_counter()))
+                        continue
+                    result = generate_employee_report_card(
+                        url=data["url"],
+                        branch=data["branch"],
+                        dept=dept,
+                        employee_name=name,
+                        headless=headless,
+                        pool=pool,
+                        mode=mode,
+                        store=store,
+                        run_id=store_run_id,
+                        navigation=navigation
+                    )
+                    record(result)
+                    results.append(result)
+
+        results.extend(
+            _report_card_result(name, data["branch"], "skipped", time.perf_counter())
+            for name, data in skipped.items()
+        )
+
+        succeeded = sum(1 for result in results if result["status"] == "success")
+        logging.info(f"Report cards done: {succeeded}/{len(results)} succeeded")
+        logging.info(f"Average step timings ({mode}): {summarize_timings(results)}")
+        if navigation == "in_place":
+            switched = sum(1 for result in results if result.get("navigation") == "in_place")
+            fallbacks = sum(1 for result in results if result.get("navigation") == "fallback")
+            logging.info(f"In-place switches: {switched}, fallbacks to full load: {fallbacks}")
+        if workers <= 1:
+            logging.info(f"Request policy: {request_policy.stats()}")
+        return results
     except Exception as e:
         import traceback
         traceback.print_exc()
@@ -0,0 +1,89 @@
+from components.storage.ObjectStore import ObjectStore
+from datetime import datetime, timezone
+from typing import BinaryIO, Optional
+import tempfile
+import hashlib
+import json
+import os
+
+class LocalObjectStore(ObjectStore):
+    """
+    `ObjectStore` on the local filesystem. Objects live at `{root}/{key}` with
+    their metadata in `{root}/{key}.meta.json`; writes are atomic.
+    """
+    META_SUFFIX = ".meta.json"
+
+    def __init__(self, root: str):
+        self.root = os.path.abspath(root)
+        os.makedirs(self.root, exist_ok=True)
+
+    def _path(self, key: str) -> str:
+        path = os.path.abspath(os.path.join(self.root, key))
+        if os.path.commonpath([self.root, path]) != self.root:
+            raise ValueError(f"Invalid object key: {key}")
+        return path
+
+    def put(self, key: str, stream: BinaryIO, content_type: str = "application/pdf", metadata: dict = None) -> dict:
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        digest = hashlib.sha256()
+        size = [0]
+
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                for chunk in self._chunks(stream, digest, size):
+                    f.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+        record = {
+            "key": key,
+            "size": size[0],
+            "checksum": digest.hexdigest(),
+            "content_type": content_type,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "metadata": metadata or {}
+        }
+        meta_tmp = path + self.META_SUFFIX + ".part"
+        with open(meta_tmp, "w") as f:
+            json.dump(record, f)
+        os.replace(meta_tmp, path + self.META_SUFFIX)
+        return record
+
+    def open(self, key: str) -> BinaryIO:
+        return open(self._path(key), "rb")
+
+    def head(self, key: str) -> Optional[dict]:
+        path = self._path(key)
+        try:
+            with open(path + self.META_SUFFIX) as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not os.path.exists(path):
+            return None
+        return record
+
+    def list(self, prefix: str = "") -> list[dict]:
+        records = []
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if not name.endswith(self.META_SUFFIX):
+                    continue
+                key = os.path.relpath(os.path.join(directory, name[:-len(self.META_SUFFIX)]), self.root)
+                key = key.replace(os.sep, "/")
+                if key.startswith(prefix):
+                    record = self.head(key)
+                    if record:
+                        records.append(record)
+        return sorted(records, key=lambda record: record["key"])
+
+    def delete(self, key: str):
+        path = self._path(key)
+        for target in (path, path + self.META_SUFFIX):
+            if os.path.exists(target):
+                os.remove(target)
@@ -0,0 +1,46 @@
+from abc import ABC, abstractmethod
+from typing import BinaryIO, Iterator, Optional
+import hashlib
+
+CHUNK_SIZE = 1024 * 1024
+
+class ObjectStore(ABC):
+    """
+    Minimal blob store for generated report cards.
+
+    Every object gets a metadata record next to it (size, SHA-256, content type
+    and caller-supplied fields) so stored PDFs can be queried after a run
+    without downloading them.
+    """
+    @staticmethod
+    def report_card_key(run_id: str, branch: str, employee: str) -> str:
+        """`{run_id}/{branch}/{employee}.pdf`, e.g. `SC-2025-09/HYUNDAI SHAW/JUAN DELA CRUZ.pdf`."""
+        parts = [run_id, branch or "Unassigned", f"{employee}.pdf"]
+        return "/".join(part.replace("/", "-").strip() for part in parts)
+
+    @staticmethod
+    def _chunks(stream: BinaryIO, digest: "hashlib._Hash", counter: list[int]) -> Iterator[bytes]:
+        for chunk in iter(lambda: stream.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+            counter[0] += len(chunk)
+            yield chunk
+
+    @abstractmethod
+    def put(self, key: str, stream: BinaryIO, content_type: str = "application/pdf", metadata: dict = None) -> dict:
+        """Streams `stream` into `key` and returns its metadata record."""
+
+    @abstractmethod
+    def open(self, key: str) -> BinaryIO:
+        """Returns a readable binary stream of the object."""
+
+    @abstractmethod
+    def head(self, key: str) -> Optional[dict]:
+        """Returns the metadata record of `key`, or `None` if it does not exist."""
+
+    @abstractmethod
+    def list(self, prefix: str = "") -> list[dict]:
+        """Returns the metadata records of every object under `prefix`."""
+
+    @abstractmethod
+    def delete(self, key: str):
+        """Removes the object and its metadata record."""
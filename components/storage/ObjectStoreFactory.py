@@ -0,0 +1,29 @@
+from components.storage.LocalObjectStore import LocalObjectStore
+from components.storage.S3ObjectStore import S3ObjectStore
+from components.storage.ObjectStore import ObjectStore
+from config import REPORT_CARD_STORAGE
+from dataclasses import asdict
+from typing import Literal
+
+class ObjectStoreFactory:
+    @staticmethod
+    def create(backend: Literal["local", "s3"], config: dict) -> ObjectStore:
+        if backend == "local":
+            return LocalObjectStore(root=config["root"])
+        elif backend == "s3":
+            return S3ObjectStore(
+                bucket=config["bucket"],
+                prefix=config.get("prefix", ""),
+                endpoint_url=config.get("endpoint_url"),
+                access_key_id=config.get("access_key_id"),
+                secret_access_key=config.get("secret_access_key"),
+                region=config.get("region")
+            )
+        else:
+            raise ValueError(f"Unsupported object store backend: {backend}")
+
+
+    @staticmethod
+    def report_card_store() -> ObjectStore:
+        """The store configured for report cards via the `REPORT_CARD_*` env vars."""
+        return ObjectStoreFactory.create(REPORT_CARD_STORAGE.backend, asdict(REPORT_CARD_STORAGE))
\ No newline at end of file
@@ -0,0 +1,118 @@
+from components.storage.ObjectStore import ObjectStore
+from datetime import datetime, timezone
+from typing import BinaryIO, Optional
+import hashlib
+import json
+import io
+
+class _HashingReader(io.RawIOBase):
+    """Hashes and counts bytes as boto3 streams them from the wrapped file."""
+    def __init__(self, stream: BinaryIO):
+        self.stream = stream
+        self.digest = hashlib.sha256()
+        self.size = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int = -1) -> bytes:
+        chunk = self.stream.read(size)
+        self.digest.update(chunk)
+        self.size += len(chunk)
+        return chunk
+
+    def readinto(self, buffer) -> int:
+        chunk = self.read(len(buffer))
+        buffer[:len(chunk)] = chunk
+        return len(chunk)
+
+class S3ObjectStore(ObjectStore):
+    """
+    `ObjectStore` on any S3-compatible bucket: AWS S3, GCS through its XML API
+    interoperability endpoint (`https://storage.googleapis.com` with HMAC keys),
+    or a local MinIO for testing. Objects are uploaded with multipart streaming;
+    the metadata record is stored as `{key}.meta.json` next to each object.
+
+    Needs `boto3`, which is only imported when this backend is used.
+    """
+    META_SUFFIX = ".meta.json"
+
+    def __init__(
+        self,
+        bucket: str,
+        prefix: str = "",
+        endpoint_url: str = None,
+        access_key_id: str = None,
+        secret_access_key: str = None,
+        region: str = None
+    ):
+        try:
+            import boto3
+        except ImportError as e:
+            raise ImportError("S3ObjectStore requires boto3: pip install boto3") from e
+        self.bucket = bucket
+        self.prefix = prefix.strip("/")
+        self.client = boto3.client(
+            "s3",
+            endpoint_url=endpoint_url,
+            aws_access_key_id=access_key_id,
+            aws_secret_access_key=secret_access_key,
+            region_name=region
+        )
+
+    def _key(self, key: str) -> str:
+        return f"{self.prefix}/{key}" if self.prefix else key
+
+    def put(self, key: str, stream: BinaryIO, content_type: str = "application/pdf", metadata: dict = None) -> dict:
+        reader = _HashingReader(stream)
+        self.client.upload_fileobj(
+            reader,
+            self.bucket,
+            self._key(key),
+            ExtraArgs={"ContentType": content_type}
+        )
+        record = {
+            "key": key,
+            "size": reader.size,
+            "checksum": reader.digest.hexdigest(),
+            "content_type": content_type,
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "metadata": metadata or {}
+        }
+        self.client.put_object(
+            Bucket=self.bucket,
+            Key=self._key(key) + self.META_SUFFIX,
+            Body=json.dumps(record).encode(),
+            ContentType="application/json"
+        )
+        return record
+
+    def open(self, key: str) -> BinaryIO:
+        return self.client.get_object(Bucket=self.bucket, Key=self._key(key))["Body"]
+
+    def head(self, key: str) -> Optional[dict]:
+        try:
+            self.client.head_object(Bucket=self.bucket, Key=self._key(key))
+            body = self.client.get_object(Bucket=self.bucket, Key=self._key(key) + self.META_SUFFIX)["Body"]
+            return json.loads(body.read())
+        except self.client.exceptions.ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+                return None
+            raise
+
+    def list(self, prefix: str = "") -> list[dict]:
+        records = []
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket, Prefix=self._key(prefix)):
+            for obj in page.get("Contents", []):
+                if not obj["Key"].endswith(self.META_SUFFIX):
+                    continue
+                body = self.client.get_object(Bucket=self.bucket, Key=obj["Key"])["Body"]
+                records.append(json.loads(body.read()))
+        return sorted(records, key=lambda record: record["key"])
+
+    def delete(self, key: str):
+        self.client.delete_objects(
+            Bucket=self.bucket,
+            Delete={"Objects": [{"Key": self._key(key)}, {"Key": self._key(key) + self.META_SUFFIX}]}
+        )
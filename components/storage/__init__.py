@@ -0,0 +1,11 @@
+from components.storage.ObjectStoreFactory import ObjectStoreFactory
+from components.storage.LocalObjectStore import LocalObjectStore
+from components.storage.S3ObjectStore import S3ObjectStore
+from components.storage.ObjectStore import ObjectStore
+
+__all__ = [
+    "ObjectStoreFactory",
+    "LocalObjectStore",
+    "S3ObjectStore",
+    "ObjectStore"
+]
\ No newline at end of file
@@ -0,0 +1,124 @@
+from components.utils.AsyncGoogleClient import AsyncGoogleClient
+from components.utils.GSheetService import GSheetService, a1_range
+from components.utils.CredentialManager import CredentialManager
+from google.auth.credentials import Credentials
+from typing import AsyncIterator, Iterable, Union
+from urllib.parse import quote
+import logging
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class AsyncGSheetService(AsyncGoogleClient):
+    """
+    asyncio counterpart of `GSheetService` on the Sheets/Drive REST APIs: same
+    tab handling, grid-size discovery and chunked `batchGet` reads, without
+    holding a thread per request.
+
+    `api_endpoint`/`drive_endpoint` point it somewhere other than Google, e.g. a
+    local fake server.
+    """
+    SCOPES = GSheetService.SCOPES
+    CHUNK_ROWS = GSheetService.CHUNK_ROWS
+    DEFAULT_API_ENDPOINT = "https://sheets.googleapis.com"
+    DEFAULT_DRIVE_ENDPOINT = "https://www.googleapis.com"
+
+    def __init__(
+        self,
+        credentials: Union[Credentials, CredentialManager],
+        spreadsheet_id: str,
+        spreadsheet_range: str,
+        chunk_rows: int = CHUNK_ROWS,
+        api_endpoint: str = None,
+        drive_endpoint: str = None,
+        **kwargs
+    ):
+        super().__init__(credentials, **kwargs)
+        self.spreadsheet_id = spreadsheet_id
+        self.spreadsheet_range = spreadsheet_range
+        self.tab = spreadsheet_range.split("!")[0].strip("'")
+        self.chunk_rows = chunk_rows
+        self.api_endpoint = (api_endpoint or self.DEFAULT_API_ENDPOINT).rstrip("/")
+        self.drive_endpoint = (drive_endpoint or self.DEFAULT_DRIVE_ENDPOINT).rstrip("/")
+
+    @property
+    def _spreadsheet_url(self) -> str:
+        return f"{self.api_endpoint}/v4/spreadsheets/{quote(self.spreadsheet_id)}"
+
+    async def modified_time(self) -> str:
+        result = await self.request(
+            "GET",
+            f"{self.drive_endpoint}/drive/v3/files/{quote(self.spreadsheet_id)}",
+            params={"fields": "modifiedTime", "supportsAllDrives": "true"}
+        )
+        return result["modifiedTime"]
+
+    async def grid_sizes(self, tabs: Iterable[str] = None) -> dict[str, tuple[int, int]]:
+        result = await self.request(
+            "GET",
+            self._spreadsheet_url,
+            params={"fields": "sheets.properties(title,gridProperties(rowCount,columnCount))"}
+        )
+        sizes = {
+            sheet["properties"]["title"]: (
+                sheet["properties"]["gridProperties"].get("rowCount", 0),
+                sheet["properties"]["gridProperties"].get("columnCount", 0)
+            )
+            for sheet in result.get("sheets", [])
+        }
+        if tabs is None:
+            return sizes
+        missing = [tab for tab in tabs if tab not in sizes]
+        if missing:
+            raise ValueError(f"Tabs not found in spreadsheet: {', '.join(missing)}")
+        return {tab: sizes[tab] for tab in tabs}
+
+    async def iter_tabs(self, tabs: Iterable[str]) -> AsyncIterator[tuple[str, dict]]:
+        """See `GSheetService.iter_tabs`."""
+        sizes = await self.grid_sizes(list(tabs))
+        headers: dict[str, list[str]] = {}
+        next_row = {tab: 1 for tab, (rows, columns) in sizes.items() if rows and columns}
+
+        while next_row:
+            ranges = {
+                tab: a1_range(tab, first, min(first + self.chunk_rows - 1, sizes[tab][0]), sizes[tab][1])
+                for tab, first in next_row.items()
+            }
+            result = await self.request(
+                "GET",
+                f"{self._spreadsheet_url}/values:batchGet",
+                params=[("ranges", value) for value in ranges.values()] + [("majorDimension", "ROWS")]
+            )
+
+            for tab, value_range in zip(ranges, result.get("valueRanges", [])):
+                values = value_range.get("values", [])
+                first = next_row[tab]
+                if tab not in headers and values:
+                    headers[tab] = [str(column).strip() for column in values[0]]
+                    values = values[1:]
+                for row in values:
+                    if any(str(cell).strip() for cell in row):
+                        yield tab, dict(zip(headers[tab], row))
+
+                last = first + self.chunk_rows - 1
+                if not value_range.get("values") or last >= sizes[tab][0]:
+                    del next_row[tab]
+                else:
+                    next_row[tab] = last + 1
+
+    async def iter_rows(self, tab: str = None) -> AsyncIterator[dict]:
+        async for _, row in self.iter_tabs([tab or self.tab]):
+            yield row
+
+    async def fetch_tabs(self, tabs: Iterable[str]) -> dict[str, list[dict]]:
+        tabs = list(tabs)
+        rows: dict[str, list[dict]] = {tab: [] for tab in tabs}
+        async for tab, row in self.iter_tabs(tabs):
+            rows[tab].append(row)
+        return rows
+
+    async def fetch_emails(self) -> list[dict]:
+        self.logger.info("Fetching emails...")
+        return [row async for row in self.iter_rows()]
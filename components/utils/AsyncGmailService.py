@@ -0,0 +1,160 @@
+from components.utils.GmailService import Attachment, GmailService, MessageBuilder, MessageUnavailable
+from components.utils.AsyncGoogleClient import AsyncGoogleClient, GoogleAPIError
+from components.utils.CredentialManager import CredentialManager
+from google.auth.credentials import Credentials
+from typing import AsyncIterator, BinaryIO, List, Optional, Union
+import tempfile
+import asyncio
+import httpx
+import logging
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class AsyncGmailService(MessageBuilder, AsyncGoogleClient):
+    """
+    asyncio counterpart of `GmailService.send_email` on the Gmail REST API.
+
+    Messages are built exactly as in `GmailService` (in a worker thread when
+    attachments have to be read). Messages at or above `upload_threshold` are
+    sent from a temporary file through a resumable upload, in chunks. The sender address is
+    looked up on first use unless given.
+
+    Sends are never retried once they may have reached Gmail: rate limits are left
+    to `GmailSendEngine`, and a send without an answer is `is_in_doubt`.
+    """
+    SCOPES = GmailService.SCOPES
+    DEFAULT_API_ENDPOINT = GmailService.DEFAULT_API_ENDPOINT
+    UPLOAD_CHUNK_SIZE = GmailService.UPLOAD_CHUNK_SIZE
+
+    def __init__(
+        self,
+        credentials: Union[Credentials, CredentialManager],
+        sender_email: str = None,
+        api_endpoint: str = None,
+        upload_threshold: int = 1024 * 1024,
+        **kwargs
+    ):
+        super().__init__(credentials, **kwargs)
+        self.sender_email = sender_email
+        self.api_endpoint = (api_endpoint or self.DEFAULT_API_ENDPOINT).rstrip("/")
+        self.upload_threshold = upload_threshold
+
+    def is_in_doubt(self, error: Exception) -> bool:
+        """True when a send failed without an answer from Gmail, so it may have gone out."""
+        return not isinstance(error, (GoogleAPIError, MessageUnavailable, *self.NOT_SENT_ERRORS))
+
+    async def sender(self) -> str:
+        if not self.sender_email:
+            profile = await self.request("GET", f"{self.api_endpoint}/gmail/v1/users/me/profile")
+            self.sender_email = profile["emailAddress"]
+        return self.sender_email
+
+    async def _chunk(self, f: BinaryIO, offset: int, length: int) -> AsyncIterator[bytes]:
+        # httpx keeps a `bytes` body on its request, which stays alive until the
+        # garbage collector breaks the response's reference cycle; a generator
+        # body is dropped as soon as it's sent.
+        def read():
+            f.seek(offset)
+            return f.read(length)
+        yield await asyncio.to_thread(read)
+
+    async def _send_upload(
+        self,
+        to: Union[str, List[str]],
+        subject: str,
+        body: str,
+        attachments: List[Attachment]
+    ) -> dict:
+        """
+        Sends through a resumable upload session, like `GmailService._send_upload`:
+        the message is written to a temporary file and PUT one `UPLOAD_CHUNK_SIZE`
+        chunk at a time, so no more than a chunk of it is held in memory.
+        """
+        fd, path = tempfile.mkstemp(suffix=".eml")
+        try:
+            def write():
+                with os.fdopen(fd, "wb") as f:
+                    self._write_message(f, to, subject, body, attachments)
+            await asyncio.to_thread(write)
+            size = os.path.getsize(path)
+            # Opening a session sends nothing yet, so it's retried like any idempotent call.
+            session = await self.fetch(
+                "POST",
+                f"{self.api_endpoint}/upload/gmail/v1/users/me/messages/send",
+                params={"uploadType": "resumable"},
+                headers={"X-Upload-Content-Type": "message/rfc822", "X-Upload-Content-Length": str(size)},
+                json={}
+            )
+            with open(path, "rb") as f:
+                return await self._upload_chunks(session.headers["Location"], f, size)
+        finally:
+            os.remove(path)
+
+    async def _upload_chunks(self, session_url: str, f: BinaryIO, size: int) -> dict:
+        """
+        PUTs the chunks of `f` to an upload session. After a failed chunk the
+        session is asked how much it has (`bytes */size`) and the upload resumes
+        from there; if the last chunk went through, that answer is the sent message.
+        """
+        offset = 0
+        failures = 0
+        resuming = False
+        while True:
+            if resuming:
+                length = 0
+                headers = {"Content-Range": f"bytes */{size}", "Content-Length": "0"}
+            else:
+                length = min(self.UPLOAD_CHUNK_SIZE, size - offset)
+                headers = {"Content-Range": f"bytes {offset}-{offset + length - 1}/{size}", "Content-Length": str(length)}
+            try:
+                response = await self.fetch(
+                    "PUT",
+                    session_url,
+                    headers=headers,
+                    content=self._chunk(f, offset, length) if length else b"",
+                    retry=False
+                )
+            except (GoogleAPIError, httpx.TransportError) as e:
+                failures += 1
+                if failures > self.max_retries or not self._is_retryable(e):
+                    raise
+                delay = self._backoff_delay(failures)
+                self.logger.info(f"Resuming upload at byte {offset} of {size} in {delay:.1f}s after: {e}")
+                await asyncio.sleep(delay)
+                resuming = True
+                continue
+            if response.status_code != 308:
+                return response.json()
+            # 308 Resume Incomplete: `Range: bytes=0-N` is what the session has stored.
+            received = response.headers.get("Range")
+            offset = int(received.rsplit("-", 1)[1]) + 1 if received else 0
+            resuming = False
+
+    async def send_email(
+        self,
+        recipient_email: Union[str, List[str]],
+        subject: str,
+        body: str,
+        attachments: Optional[List[Attachment]] = None
+    ) -> str:
+        await self.sender()
+        if attachments and await asyncio.to_thread(self._needs_upload, attachments):
+            result = await self._send_upload(recipient_email, subject, body, attachments)
+        else:
+            if attachments:
+                message = await asyncio.to_thread(self._create_message, recipient_email, subject, body, attachments)
+            else:
+                message = self._create_message(recipient_email, subject, body)
+            result = await self.request(
+                "POST",
+                f"{self.api_endpoint}/gmail/v1/users/me/messages/send",
+                json=message,
+                idempotent=False
+            )
+        message_id = result["id"]
+        self.logger.info(f"Email sent to {self._format_recipients(recipient_email)}! Message ID: {message_id}")
+        return message_id
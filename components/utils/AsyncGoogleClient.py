@@ -0,0 +1,153 @@
+from components.utils.CredentialManager import CredentialManager
+from google.auth.transport.requests import Request
+from google.auth.credentials import Credentials
+from typing import Any, Optional, Union
+import asyncio
+import logging
+import random
+import httpx
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class GoogleAPIError(RuntimeError):
+    """Non-2xx answer from a Google REST API, with its HTTP status and error `reason`."""
+    def __init__(self, status: int, reason: str = "", message: str = ""):
+        super().__init__(f"HTTP {status} {reason}: {message}".strip())
+        self.status = status
+        self.reason = reason
+
+    @classmethod
+    def from_response(cls, response: httpx.Response) -> "GoogleAPIError":
+        reason, message = "", response.text[:500]
+        try:
+            details = response.json()["error"]
+            reason = (details.get("errors") or [{}])[0].get("reason", "") or details.get("status", "")
+            message = details.get("message", message)
+        except (ValueError, KeyError, TypeError, AttributeError):
+            pass
+        return cls(response.status_code, reason, message)
+
+class AsyncGoogleClient:
+    """
+    Base for asyncio Google REST clients: one pooled `httpx.AsyncClient` per
+    instance (created on first use, so it binds to the serving event loop) and
+    bearer auth from shared `google-auth` credentials.
+
+    Given a `CredentialManager` instead of bare credentials, its token is used as
+    it is kept fresh, and an expired or rejected token is refreshed through the
+    manager, under the same lock as its background thread and the sync clients.
+    Either way a token is refreshed once, off the event loop, however many
+    requests notice it.
+    Requests are retried on 429/5xx and transport errors with exponential backoff,
+    and once after a 401 with a refreshed token. Non-idempotent requests (sends)
+    are only retried when the connection was never made.
+    """
+    RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+    RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+    # The request provably never reached the server.
+    NOT_SENT_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout)
+
+    def __init__(
+        self,
+        credentials: Union[Credentials, CredentialManager],
+        max_connections: int = 100,
+        timeout: float = 60,
+        max_retries: int = 3,
+        backoff: float = 0.5
+    ):
+        self.logger = logging.getLogger(__name__)
+        if isinstance(credentials, CredentialManager):
+            self.credential_manager: Optional[CredentialManager] = credentials
+            self.creds = credentials.credentials
+        else:
+            self.credential_manager = None
+            self.creds = credentials
+        self.max_connections = max_connections
+        self.timeout = timeout
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self._client: Optional[httpx.AsyncClient] = None
+        self._refresh_lock = asyncio.Lock()
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(
+                    max_connections=self.max_connections,
+                    max_keepalive_connections=self.max_connections
+                ),
+                timeout=self.timeout
+            )
+        return self._client
+
+    async def aclose(self):
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    async def _token(self, rejected_token: str = None) -> str:
+        """The current token, refreshed first if it expired or is `rejected_token`."""
+        def due() -> bool:
+            return self.creds.token == rejected_token if rejected_token else not self.creds.valid
+
+        if due():
+            async with self._refresh_lock:
+                if due():
+                    if self.credential_manager:
+                        await asyncio.to_thread(self.credential_manager.refresh, rejected_token=rejected_token)
+                    else:
+                        await asyncio.to_thread(self.creds.refresh, Request())
+        return self.creds.token
+
+    def is_rate_limited(self, error: Exception) -> bool:
+        return isinstance(error, GoogleAPIError) and (error.status == 429 or error.reason in self.RATE_LIMIT_REASONS)
+
+    def _is_retryable(self, error: Exception, idempotent: bool = True) -> bool:
+        if not idempotent:
+            return isinstance(error, self.NOT_SENT_ERRORS)
+        if isinstance(error, GoogleAPIError):
+            return error.status in self.RETRYABLE_STATUSES or self.is_rate_limited(error)
+        return isinstance(error, httpx.TransportError)
+
+    def _backoff_delay(self, attempt: int) -> float:
+        return self.backoff * 2 ** (attempt - 1) + random.uniform(0, self.backoff)
+
+    async def fetch(self, method: str, url: str, *, retry: bool = True, idempotent: bool = True, **kwargs) -> httpx.Response:
+        """
+        Sends one API call and returns its response; answers from 400 up raise
+        `GoogleAPIError`. Pass `retry=False` for bodies that can't be replayed
+        (streamed uploads) or that the caller resumes itself, and `idempotent=False`
+        for calls that must not run twice (sends): those are only retried on
+        connection errors, and error answers are left to the caller.
+        """
+        extra_headers = kwargs.pop("headers", {})
+        attempt = 0
+        reauthorized = False
+        while True:
+            try:
+                token = await self._token()
+                headers = {**extra_headers, "Authorization": f"Bearer {token}"}
+                response = await self.client.request(method, url, headers=headers, **kwargs)
+                if response.status_code == 401 and not reauthorized and retry:
+                    reauthorized = True
+                    await self._token(rejected_token=token)
+                    continue
+                if response.status_code >= 400:
+                    raise GoogleAPIError.from_response(response)
+                return response
+            except (GoogleAPIError, httpx.TransportError) as e:
+                attempt += 1
+                if not retry or attempt > self.max_retries or not self._is_retryable(e, idempotent):
+                    raise
+                delay = self._backoff_delay(attempt)
+                self.logger.info(f"Retrying {method} {url} in {delay:.1f}s after: {e}")
+                await asyncio.sleep(delay)
+
+    async def request(self, method: str, url: str, **kwargs) -> Any:
+        """`fetch` that returns the decoded JSON body (`None` if empty)."""
+        response = await self.fetch(method, url, **kwargs)
+        return response.json() if response.content else None
@@ -0,0 +1,103 @@
+from google.auth.transport.requests import Request
+from google_auth_httplib2 import AuthorizedHttp
+from components.utils.CredentialManager import CredentialManager
+from google.auth.credentials import Credentials
+from contextlib import contextmanager
+from typing import Iterator, Optional, Union
+import threading
+import httplib2
+import logging
+import queue
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class AuthorizedHttpPool:
+    """
+    Bounded pool of authorized `httplib2` transports sharing one set of credentials.
+
+    `httplib2.Http` isn't thread-safe, so a googleapiclient service shared across
+    FastAPI's threadpool must not use its built-in transport. Each `lease()` hands
+    out a transport that only the current thread uses until it is returned; the
+    transports keep their connections alive between leases. Transports are
+    created lazily, up to `size`; further borrowers wait up to `timeout` seconds.
+
+    Expired credentials are refreshed once, before a transport is lent, rather
+    than by every transport that notices at the same time; given a
+    `CredentialManager`, through the manager, so its background refresh and the
+    async clients on the same credentials take the same lock.
+
+    ```python
+    with pool.lease() as http:
+        service.users().getProfile(userId="me").execute(http=http)
+    ```
+    """
+    def __init__(
+        self,
+        credentials: Union[Credentials, CredentialManager],
+        size: int = 8,
+        timeout: float = 30,
+        request_timeout: float = 60
+    ):
+        if size < 1:
+            raise ValueError("Pool size must be at least 1.")
+        self.logger = logging.getLogger(__name__)
+        if isinstance(credentials, CredentialManager):
+            self.credential_manager: Optional[CredentialManager] = credentials
+            self.credentials = credentials.credentials
+        else:
+            self.credential_manager = None
+            self.credentials = credentials
+        self.size = size
+        self.timeout = timeout
+        self.request_timeout = request_timeout
+        self._idle: queue.LifoQueue[AuthorizedHttp] = queue.LifoQueue()
+        self._created = 0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+
+    def _new_http(self) -> AuthorizedHttp:
+        return AuthorizedHttp(self.credentials, http=httplib2.Http(timeout=self.request_timeout))
+
+    def _acquire(self) -> AuthorizedHttp:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._created < self.size:
+                self._created += 1
+                return self._new_http()
+        try:
+            return self._idle.get(timeout=self.timeout)
+        except queue.Empty:
+            raise TimeoutError(f"No HTTP transport free after {self.timeout}s (pool size {self.size}).")
+
+    def _ensure_valid(self):
+        if self.credentials.valid:
+            return
+        with self._refresh_lock:
+            if not self.credentials.valid:
+                self.logger.info("Shared credentials expired; refreshing")
+                if self.credential_manager:
+                    self.credential_manager.refresh()
+                else:
+                    self.credentials.refresh(Request())
+
+    @contextmanager
+    def lease(self) -> Iterator[AuthorizedHttp]:
+        self._ensure_valid()
+        http = self._acquire()
+        try:
+            yield http
+        except (httplib2.HttpLib2Error, OSError):
+            # The connection may be half-read; start the next borrower on a fresh one.
+            http = self._new_http()
+            raise
+        finally:
+            self._idle.put(http)
+
+    def stats(self) -> dict:
+        return {"size": self.size, "created": self._created, "idle": self._idle.qsize()}
@@ -0,0 +1,189 @@
+from google.oauth2.credentials import Credentials as UserCredentials
+from google_auth_oauthlib.flow import InstalledAppFlow
+from google.auth.transport.requests import Request
+from google.auth.credentials import Credentials
+from google.oauth2 import service_account
+from datetime import datetime, timezone
+from typing import Optional, Union
+import threading
+import tempfile
+import logging
+import json
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class CredentialsUnavailable(RuntimeError):
+    """No usable credentials and no way to get them without a person in the loop."""
+
+class CredentialManager:
+    """
+    Owns one set of Google credentials shared by every client built on it, and
+    refreshes them in a background thread `refresh_margin` seconds before they
+    expire, so requests never pay for (or block on) a token refresh.
+
+    Refreshed user tokens are written back to `token_file` atomically. The
+    manager never starts an interactive OAuth flow; that only happens through
+    `authorize()`, from the command line (`python -m components.authorize`).
+    """
+    def __init__(
+        self,
+        credentials: Credentials,
+        token_file: str = None,
+        refresh_margin: float = 300,
+        check_interval: float = 60,
+        name: str = "google"
+    ):
+        self.logger = logging.getLogger(__name__)
+        self._credentials = credentials
+        self.token_file = token_file
+        self.refresh_margin = refresh_margin
+        self.check_interval = check_interval
+        self.name = name
+        self.last_refresh: Optional[datetime] = None
+        self.last_error: Optional[str] = None
+
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @classmethod
+    def from_user_token(
+        cls,
+        token_file: str,
+        token_key: str,
+        scopes: list[str],
+        **kwargs
+    ) -> "CredentialManager":
+        """Loads an authorized-user token from the `token_key` env var or `token_file`."""
+        if token_key in os.environ:
+            info = json.loads(os.environ[token_key])
+        elif token_file and os.path.exists(token_file):
+            with open(token_file, "r") as f:
+                info = json.load(f)
+        else:
+            raise CredentialsUnavailable(
+                "User token not found. Run `python -m components.authorize` to create one."
+            )
+        credentials = UserCredentials.from_authorized_user_info(info, scopes)
+        if not credentials.refresh_token and not credentials.valid:
+            raise CredentialsUnavailable("User token expired and has no refresh token; re-authorize.")
+        manager = cls(credentials, token_file=token_file, **kwargs)
+        if manager.needs_refresh():
+            manager.refresh()
+        return manager
+
+    @classmethod
+    def from_service_account(cls, info: Union[str, dict], scopes: list[str], **kwargs) -> "CredentialManager":
+        """Expects a `service_account.json` path or its parsed contents."""
+        if isinstance(info, str) and info.endswith(".json"):
+            credentials = service_account.Credentials.from_service_account_file(info, scopes=scopes)
+        elif isinstance(info, dict):
+            credentials = service_account.Credentials.from_service_account_info(info, scopes=scopes)
+        else:
+            raise ValueError("Invalid service account information.")
+        return cls(credentials, **kwargs)
+
+    @staticmethod
+    def authorize(client_config: dict, scopes: list[str], token_file: str) -> UserCredentials:
+        """Runs the interactive OAuth consent flow and saves the token. Command line only."""
+        flow = InstalledAppFlow.from_client_config(client_config, scopes)
+        credentials = flow.run_local_server(port=0)
+        CredentialManager(credentials, token_file=token_file)._persist()
+        return credentials
+
+    @property
+    def credentials(self) -> Credentials:
+        return self._credentials
+
+    def _seconds_left(self) -> Optional[float]:
+        expiry = self._credentials.expiry
+        if not expiry:
+            return None
+        # google-auth keeps `expiry` as a naive UTC datetime.
+        return (expiry - datetime.now(timezone.utc).replace(tzinfo=None)).total_seconds()
+
+    def needs_refresh(self) -> bool:
+        if not self._credentials.token:
+            return True
+        seconds_left = self._seconds_left()
+        return seconds_left is not None and seconds_left < self.refresh_margin
+
+    def _persist(self):
+        if not self.token_file or not isinstance(self._credentials, UserCredentials):
+            return
+        directory = os.path.dirname(self.token_file) or "."
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".part")
+        try:
+            with os.fdopen(fd, "w") as f:
+                f.write(self._credentials.to_json())
+            os.replace(tmp_path, self.token_file)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+
+    def refresh(self, force: bool = False, rejected_token: str = None):
+        """
+        Refreshes the token (if due, or always with `force`) and persists it. With
+        a `rejected_token` (one an API answered 401 to) it only refreshes if the
+        credentials still hold that token, so callers that all saw the same
+        rejection refresh once.
+        """
+        with self._lock:
+            if rejected_token is not None:
+                if self._credentials.token != rejected_token:
+                    return
+            elif not force and not self.needs_refresh():
+                return
+            try:
+                self._credentials.refresh(Request())
+            except Exception as e:
+                self.last_error = str(e)
+                self.logger.error(f"Failed to refresh {self.name} credentials: {e}")
+                raise
+            self.last_refresh = datetime.now(timezone.utc)
+            self.last_error = None
+            self._persist()
+        self.logger.info(f"Refreshed {self.name} credentials (valid for {self._seconds_left() or 0:.0f}s)")
+
+    def start(self):
+        """Refreshes now if due, then keeps refreshing in the background."""
+        if self._thread and self._thread.is_alive():
+            return
+        try:
+            self.refresh()
+        except Exception:
+            pass
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, name=f"{self.name}-credential-refresh", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = None):
+        self._stopping.set()
+        if self._thread:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        while not self._stopping.wait(self.check_interval):
+            try:
+                self.refresh()
+            except Exception:
+                # Logged in `refresh`; try again on the next tick while the current token lasts.
+                pass
+
+    def status(self) -> dict:
+        seconds_left = self._seconds_left()
+        return {
+            "name": self.name,
+            "valid": self._credentials.valid,
+            "expires_in": round(seconds_left) if seconds_left is not None else None,
+            "last_refresh": self.last_refresh.isoformat() if self.last_refresh else None,
+            "last_error": self.last_error,
+            "refreshing": bool(self._thread and self._thread.is_alive())
+        }
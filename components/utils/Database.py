@@ -0,0 +1,85 @@
+from contextlib import contextmanager
+from typing import Any, Iterator, Sequence
+import sqlite3
+import os
+
+class Connection:
+    """One transaction on a `Database`; rows support both `row["column"]` and `dict(row)`."""
+    def __init__(self, conn: Any, placeholder: str):
+        self.conn = conn
+        self.placeholder = placeholder
+
+    def _sql(self, sql: str) -> str:
+        return sql if self.placeholder == "?" else sql.replace("?", self.placeholder)
+
+    def execute(self, sql: str, params: Sequence = ()) -> Any:
+        return self.conn.execute(self._sql(sql), params)
+
+    def executemany(self, sql: str, rows: list[Sequence]) -> Any:
+        cursor = self.conn.cursor()
+        cursor.executemany(self._sql(sql), rows)
+        return cursor
+
+class Database:
+    """
+    SQL database behind the shared stores (`WorkQueue`, `JobStore`, `RunManifest`).
+
+    `url` is either a SQLite file path, for processes on one host, or a
+    `postgresql://` DSN, so workers on several hosts can share one database.
+    PostgreSQL needs `psycopg`, which is only imported when a DSN is given.
+
+    Statements are written once with `?` placeholders in the SQL both databases
+    accept (so no literal `?` or `%` in them). Claims lock the rows they pick
+    with `skip_locked`: `FOR UPDATE SKIP LOCKED` on PostgreSQL; SQLite instead
+    serializes writers on the file lock of an `immediate` transaction.
+    """
+    POSTGRES_SCHEMES = ("postgres://", "postgresql://")
+
+    def __init__(self, url: str):
+        self.url = url
+        self.dialect = "postgres" if url.startswith(self.POSTGRES_SCHEMES) else "sqlite"
+        if self.dialect == "postgres":
+            try:
+                import psycopg
+                from psycopg.rows import dict_row
+            except ImportError as e:
+                raise ImportError("A PostgreSQL database requires psycopg: pip install 'psycopg[binary]'") from e
+            self._psycopg, self._dict_row = psycopg, dict_row
+        else:
+            directory = os.path.dirname(url)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+
+    @property
+    def skip_locked(self) -> str:
+        return " FOR UPDATE SKIP LOCKED" if self.dialect == "postgres" else ""
+
+    def columns(self, conn: Connection, table: str) -> set[str]:
+        """Column names of `table`, for adding columns to stores created by older versions."""
+        if self.dialect == "postgres":
+            rows = conn.execute(
+                "SELECT column_name FROM information_schema.columns WHERE table_name = ?", (table,)
+            ).fetchall()
+            return {row["column_name"] for row in rows}
+        return {row["name"] for row in conn.execute(f"PRAGMA table_info({table})").fetchall()}
+
+    @contextmanager
+    def transaction(self, immediate: bool = False) -> Iterator[Connection]:
+        """
+        Commits on success and rolls back on error. `immediate` takes SQLite's write
+        lock up front, for read-then-write claims; PostgreSQL relies on row locks.
+        """
+        if self.dialect == "postgres":
+            with self._psycopg.connect(self.url, row_factory=self._dict_row) as conn:
+                yield Connection(conn, "%s")
+            return
+
+        conn = sqlite3.connect(self.url, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                if immediate:
+                    conn.execute("BEGIN IMMEDIATE")
+                yield Connection(conn, "?")
+        finally:
+            conn.close()
@@ -0,0 +1,329 @@
+from components.utils.GmailSendEngine import GmailSendEngine
+from components.utils.GmailService import Attachment, GmailService
+from components.storage import ObjectStore
+from typing import Iterator, Literal, Optional
+from contextlib import contextmanager
+import asyncio
+import logging
+import sqlite3
+import time
+import json
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+SendStrategy = Literal["batch", "concurrent", "async"]
+
+class EmailOutbox:
+    """
+    Durable outbox for branch emails, one row per `(branch, recipient, year, month, template)`.
+
+    Entry status goes `pending -> sending -> sent | failed`. An entry is claimed
+    (`sending`) before it is handed to Gmail and is never claimed again on its own,
+    so a crash mid-send can't email anyone twice. Sends whose outcome is unknown
+    (no answer from Gmail) stay `sending` as well, with their error; only an
+    explicit `redrive(statuses=("sending",))` puts them back. `failed` is kept
+    for definite rejections. Re-queueing a period refreshes and retries
+    `pending`/`failed` entries and skips everything else.
+
+    `template` names the kind of email, so different emails to the same recipient
+    and period (e.g. an SC-links email and a GRM digest) are separate entries.
+    """
+    STATUSES = ("pending", "sending", "sent", "failed")
+    FILTERS = ("branch", "recipient", "year", "month", "template")
+
+    def __init__(self, path: str):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS outbox (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    branch TEXT NOT NULL,
+                    recipient TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    month INTEGER NOT NULL,
+                    template TEXT NOT NULL,
+                    subject TEXT NOT NULL,
+                    body TEXT NOT NULL,
+                    attachments TEXT NOT NULL DEFAULT '[]',
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    message_id TEXT,
+                    error TEXT,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    created_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    sent_at REAL,
+                    UNIQUE (branch, recipient, year, month, template)
+                )
+                """
+            )
+            columns = {row["name"] for row in conn.execute("PRAGMA table_info(outbox)")}
+            if "attachments" not in columns:
+                conn.execute("ALTER TABLE outbox ADD COLUMN attachments TEXT NOT NULL DEFAULT '[]'")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def _to_dict(row: sqlite3.Row) -> dict:
+        entry = dict(row)
+        entry["attachments"] = json.loads(entry["attachments"])
+        return entry
+
+    def _where(self, statuses: tuple[str, ...] = (), ids: list[int] = None, **filters) -> tuple[str, list]:
+        clauses, params = [], []
+        if statuses:
+            clauses.append(f"status IN ({', '.join('?' for _ in statuses)})")
+            params.extend(statuses)
+        if ids is not None:
+            clauses.append(f"id IN ({', '.join('?' for _ in ids)})")
+            params.extend(ids)
+        for column in self.FILTERS:
+            if filters.get(column) is not None:
+                clauses.append(f"{column} = ?")
+                params.append(filters[column].lower() if column == "recipient" else filters[column])
+        return (f"WHERE {' AND '.join(clauses)}" if clauses else ""), params
+
+    def enqueue(
+        self,
+        branch: str,
+        year: int,
+        month: int,
+        template: str,
+        messages: list[dict]
+    ) -> dict[str, int]:
+        """
+        Queues `messages` (`{"to": ..., "subject": ..., "body": ..., "attachments": [...]}`)
+        for one branch and period. Attachments are stored as references
+        (`{"filename": ..., "key": ...}` or `{"filename": ..., "path": ...}`), not content.
+
+        Returns how many entries are now pending, already sent, or stuck in `sending`.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.executemany(
+                """
+                INSERT INTO outbox (
+                    branch, recipient, year, month, template, subject, body, attachments, created_at, updated_at
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (branch, recipient, year, month, template) DO UPDATE
+                SET subject = excluded.subject, body = excluded.body, attachments = excluded.attachments,
+                    status = 'pending', error = NULL, updated_at = excluded.updated_at
+                WHERE status IN ('pending', 'failed')
+                """,
+                [
+                    (
+                        branch, message["to"].lower(), year, month, template, message["subject"], message["body"],
+                        json.dumps(message.get("attachments") or []), now, now
+                    )
+                    for message in messages
+                ]
+            )
+        counts = self.counts(branch=branch, year=year, month=month, template=template)
+        return {
+            "pending": counts.get("pending", 0),
+            "already_sent": counts.get("sent", 0),
+            "in_doubt": counts.get("sending", 0)
+        }
+
+    def claim(self, limit: int = None, ids: list[int] = None, **filters) -> list[dict]:
+        """Marks up to `limit` pending entries (only those in `ids`, if given) as `sending` and returns them."""
+        if ids is not None and not ids:
+            return []
+        where, params = self._where(("pending",), ids, **filters)
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            rows = conn.execute(
+                f"SELECT id FROM outbox {where} ORDER BY id LIMIT ?",
+                (*params, limit if limit else -1)
+            ).fetchall()
+            ids = [row["id"] for row in rows]
+            if not ids:
+                return []
+            placeholders = ", ".join("?" for _ in ids)
+            conn.execute(
+                f"UPDATE outbox SET status = 'sending', attempts = attempts + 1, updated_at = ? WHERE id IN ({placeholders})",
+                (time.time(), *ids)
+            )
+            entries = conn.execute(f"SELECT * FROM outbox WHERE id IN ({placeholders}) ORDER BY id", ids).fetchall()
+        return [self._to_dict(entry) for entry in entries]
+
+    def mark_sent(self, entry_id: int, message_id: str):
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE outbox SET status = 'sent', message_id = ?, error = NULL, sent_at = ?, updated_at = ? WHERE id = ?",
+                (message_id, now, now, entry_id)
+            )
+
+    def mark_failed(self, entry_id: int, error: str):
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE outbox SET status = 'failed', error = ?, updated_at = ? WHERE id = ?",
+                (error, time.time(), entry_id)
+            )
+
+    def mark_in_doubt(self, entry_id: int, error: str):
+        """Records the error of a send that may have gone out; the entry stays `sending`."""
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE outbox SET error = ?, updated_at = ? WHERE id = ? AND status = 'sending'",
+                (error, time.time(), entry_id)
+            )
+
+    def redrive(self, statuses: tuple[str, ...] = ("failed",), **filters) -> list[int]:
+        """
+        Puts `failed` (and, if asked, stuck `sending`) entries back to `pending`.
+        Never touches `sent`. Returns the IDs of the re-queued entries.
+        """
+        statuses = tuple(status for status in statuses if status in ("failed", "sending"))
+        if not statuses:
+            return []
+        where, params = self._where(statuses, **filters)
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            ids = [row["id"] for row in conn.execute(f"SELECT id FROM outbox {where} ORDER BY id", params)]
+            if ids:
+                conn.execute(
+                    f"UPDATE outbox SET status = 'pending', updated_at = ? WHERE id IN ({', '.join('?' for _ in ids)})",
+                    (time.time(), *ids)
+                )
+        self.logger.info(f"Re-drove {len(ids)} outbox entr{'y' if len(ids) == 1 else 'ies'}")
+        return ids
+
+    def entries(self, status: str = None, limit: int = 200, **filters) -> list[dict]:
+        where, params = self._where((status,) if status else (), **filters)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT * FROM outbox {where} ORDER BY updated_at DESC LIMIT ?",
+                (*params, limit)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def counts(self, **filters) -> dict[str, int]:
+        where, params = self._where(**filters)
+        with self._connect() as conn:
+            rows = conn.execute(
+                f"SELECT status, COUNT(*) AS count FROM outbox {where} GROUP BY status",
+                params
+            ).fetchall()
+        return {row["status"]: row["count"] for row in rows}
+
+class OutboxDispatcher:
+    """
+    Drains pending `EmailOutbox` entries through Gmail, either as batch requests
+    (`GmailService.send_many`) or through the rate-limited `GmailSendEngine`
+    (on worker threads, or on the event loop with `adrain`).
+    Attachment keys are resolved against `store`.
+    """
+    def __init__(
+        self,
+        outbox: EmailOutbox,
+        gmail: GmailService,
+        engine: GmailSendEngine = None,
+        store: ObjectStore = None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.outbox = outbox
+        self.gmail = gmail
+        self.engine = engine
+        self.store = store
+
+    def _attachments(self, entry: dict) -> list[Attachment]:
+        return [
+            Attachment(filename=ref["filename"], path=ref.get("path"), key=ref.get("key"), store=self.store)
+            for ref in entry["attachments"]
+        ]
+
+    def _messages(self, entries: list[dict]) -> list[dict]:
+        return [
+            {
+                "to": entry["recipient"],
+                "subject": entry["subject"],
+                "body": entry["body"],
+                "attachments": self._attachments(entry)
+            }
+            for entry in entries
+        ]
+
+    def _record(self, entries: list[dict], results: list[dict], stats: Optional[dict]) -> dict:
+        sent, failed, in_doubt = [], [], []
+        for entry, result in zip(entries, results):
+            if result["id"]:
+                self.outbox.mark_sent(entry["id"], result["id"])
+                sent.append({"email": entry["recipient"], "message_id": result["id"]})
+            elif result.get("in_doubt"):
+                self.outbox.mark_in_doubt(entry["id"], result["error"])
+                in_doubt.append({"email": entry["recipient"], "error": result["error"]})
+            else:
+                self.outbox.mark_failed(entry["id"], result["error"])
+                failed.append({"email": entry["recipient"], "error": result["error"]})
+        if in_doubt:
+            self.logger.warning(f"{len(in_doubt)} send(s) got no answer from Gmail; left in 'sending' for review")
+        return {"sent": sent, "failed": failed, "in_doubt": in_doubt, "stats": stats}
+
+    def drain(self, strategy: SendStrategy = "batch", limit: int = None, **filters) -> dict:
+        """
+        Sends every pending entry matching `filters` (branch/recipient/year/month/template,
+        or `ids`).
+
+        Returns `{"sent": [...], "failed": [...], "in_doubt": [...], "stats": ...}`;
+        `in_doubt` sends stay `sending` (see `EmailOutbox`), and `stats` is only set
+        for the `concurrent` strategy.
+        """
+        entries = self.outbox.claim(limit=limit, **filters)
+        if not entries:
+            return {"sent": [], "failed": [], "in_doubt": [], "stats": None}
+
+        messages = self._messages(entries)
+        self.logger.info(f"Dispatching {len(messages)} outbox entr{'y' if len(messages) == 1 else 'ies'} ({strategy})...")
+        stats: Optional[dict] = None
+        try:
+            if strategy == "concurrent" and self.engine:
+                report = self.engine.send(messages)
+                results, stats = report["results"], report["stats"]
+            else:
+                results = self.gmail.send_many(messages)
+        except Exception as e:
+            # Nothing came back, so we can't tell what went out: leave the entries `sending`.
+            self.logger.error(f"Dispatch failed; {len(entries)} entries left in 'sending' for review: {e}")
+            raise
+        return self._record(entries, results, stats)
+
+    async def adrain(self, strategy: SendStrategy = "async", limit: int = None, **filters) -> dict:
+        """
+        `drain` for async endpoints. With an engine that has an async Gmail client,
+        messages are sent from the event loop (`GmailSendEngine.asend`); outbox
+        reads and writes, and every other strategy, run in a worker thread.
+        """
+        if strategy != "async" or not (self.engine and self.engine.async_gmail):
+            return await asyncio.to_thread(self.drain, "batch" if strategy == "async" else strategy, limit, **filters)
+
+        entries = await asyncio.to_thread(self.outbox.claim, limit, **filters)
+        if not entries:
+            return {"sent": [], "failed": [], "in_doubt": [], "stats": None}
+
+        messages = self._messages(entries)
+        self.logger.info(f"Dispatching {len(messages)} outbox entr{'y' if len(messages) == 1 else 'ies'} (async)...")
+        try:
+            report = await self.engine.asend(messages)
+        except Exception as e:
+            self.logger.error(f"Dispatch failed; {len(entries)} entries left in 'sending' for review: {e}")
+            raise
+        return await asyncio.to_thread(self._record, entries, report["results"], report["stats"])
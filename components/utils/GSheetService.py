@@ -1,6 +1,9 @@
+from components.utils.AuthorizedHttpPool import AuthorizedHttpPool
+from components.utils.CredentialManager import CredentialManager
 from google.auth.credentials import Credentials
 from googleapiclient.discovery import build
 from google.oauth2 import service_account
+from typing import Iterable, Iterator
 import logging
 
 logging.basicConfig(
@@ -8,16 +11,54 @@ logging.basicConfig(
     format='%(asctime)s - %(levelname)s - %(message)s'
 )
 
+def column_letter(index: int) -> str:
+    """1-based column index to its A1 letter, e.g. `1 -> "A"`, `28 -> "AB"`."""
+    letters = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+def a1_range(tab: str, first_row: int, last_row: int, columns: int) -> str:
+    quoted = tab.replace("'", "''")
+    return f"'{quoted}'!A{first_row}:{column_letter(columns)}{last_row}"
+
 class GSheetService:
-    SCOPES = ["https://www.googleapis.com/auth/spreadsheets.readonly"]
+    """
+    Reads a spreadsheet's tabs as streams of `{header: value}` rows.
 
-    def __init__(self, service_account_file: str, spreadsheet_id: str, spreadsheet_range: str):
+    `spreadsheet_range` names the default tab (an A1 range like `Sheet1!A1:G136`
+    is accepted, but only its tab name is used). The used grid size of each tab is
+    read from the sheet metadata and the rows are fetched `chunk_rows` at a time
+    with `values.batchGet`; when several tabs are read together, every round trip
+    fetches the next chunk of each of them. A tab ends at its grid size or at the
+    first chunk that comes back empty.
+    """
+    CHUNK_ROWS = 1000
+    SCOPES = [
+        "https://www.googleapis.com/auth/spreadsheets.readonly",
+        "https://www.googleapis.com/auth/drive.metadata.readonly"
+    ]
+
+    def __init__(
+        self,
+        service_account_file: str,
+        spreadsheet_id: str,
+        spreadsheet_range: str,
+        pool_size: int = 8,
+        credential_manager: CredentialManager = None,
+        chunk_rows: int = CHUNK_ROWS
+    ):
         self.logger = logging.getLogger(__name__)
         self.service_account_file = service_account_file
-        self.creds = self._authenticate()
+        self.creds = credential_manager.credentials if credential_manager else self._authenticate()
+        self.http_pool = AuthorizedHttpPool(credential_manager or self.creds, size=pool_size)
         self.service = build("sheets", "v4", credentials=self.creds, cache_discovery=False)
+        self.drive = build("drive", "v3", credentials=self.creds, cache_discovery=False)
         self.spreadsheet_id = spreadsheet_id
         self.spreadsheet_range = spreadsheet_range
+        self.tab = spreadsheet_range.split("!")[0].strip("'")
+        self.chunk_rows = chunk_rows
 
     def _authenticate(self) -> Credentials:
         """
@@ -36,17 +77,90 @@ class GSheetService:
         else:
             raise ValueError("Invalid service account information.")
 
+    def modified_time(self) -> str:
+        """The spreadsheet's Drive `modifiedTime`: a cheap probe for whether the roster changed."""
+        with self.http_pool.lease() as http:
+            result = self.drive.files().get(
+                fileId=self.spreadsheet_id,
+                fields="modifiedTime",
+                supportsAllDrives=True
+            ).execute(http=http)
+        return result["modifiedTime"]
+
+    def grid_sizes(self, tabs: Iterable[str] = None) -> dict[str, tuple[int, int]]:
+        """`{tab: (rows, columns)}` from the spreadsheet metadata, for `tabs` or every tab."""
+        with self.http_pool.lease() as http:
+            result = self.service.spreadsheets().get(
+                spreadsheetId=self.spreadsheet_id,
+                fields="sheets.properties(title,gridProperties(rowCount,columnCount))"
+            ).execute(http=http)
+        sizes = {
+            sheet["properties"]["title"]: (
+                sheet["properties"]["gridProperties"].get("rowCount", 0),
+                sheet["properties"]["gridProperties"].get("columnCount", 0)
+            )
+            for sheet in result.get("sheets", [])
+        }
+        if tabs is None:
+            return sizes
+        missing = [tab for tab in tabs if tab not in sizes]
+        if missing:
+            raise ValueError(f"Tabs not found in spreadsheet: {', '.join(missing)}")
+        return {tab: sizes[tab] for tab in tabs}
+
+    def iter_tabs(self, tabs: Iterable[str]) -> Iterator[tuple[str, dict]]:
+        """
+        Streams `(tab, row)` pairs from several tabs, one `batchGet` per chunk of rows
+        across all of them. The first row of each tab is its header; blank rows are skipped.
+        """
+        sizes = self.grid_sizes(list(tabs))
+        headers: dict[str, list[str]] = {}
+        next_row = {tab: 1 for tab, (rows, columns) in sizes.items() if rows and columns}
+
+        while next_row:
+            ranges = {
+                tab: a1_range(tab, first, min(first + self.chunk_rows - 1, sizes[tab][0]), sizes[tab][1])
+                for tab, first in next_row.items()
+            }
+            with self.http_pool.lease() as http:
+                result = self.service.spreadsheets().values().batchGet(
+                    spreadsheetId=self.spreadsheet_id,
+                    ranges=list(ranges.values()),
+                    majorDimension="ROWS"
+                ).execute(http=http)
+
+            for tab, value_range in zip(ranges, result.get("valueRanges", [])):
+                values = value_range.get("values", [])
+                first = next_row[tab]
+                if tab not in headers and values:
+                    headers[tab] = [str(column).strip() for column in values[0]]
+                    values = values[1:]
+                for row in values:
+                    if any(str(cell).strip() for cell in row):
+                        yield tab, dict(zip(headers[tab], row))
+
+                last = first + self.chunk_rows - 1
+                if not value_range.get("values") or last >= sizes[tab][0]:
+                    del next_row[tab]
+                else:
+                    next_row[tab] = last + 1
+
+    def iter_rows(self, tab: str = None) -> Iterator[dict]:
+        """Streams the rows of `tab` (the default tab if not given) as `{header: value}` dicts."""
+        for _, row in self.iter_tabs([tab or self.tab]):
+            yield row
+
+    def fetch_tabs(self, tabs: Iterable[str]) -> dict[str, list[dict]]:
+        """Reads several tabs (e.g. one per department) in shared round trips."""
+        tabs = list(tabs)
+        rows: dict[str, list[dict]] = {tab: [] for tab in tabs}
+        for tab, row in self.iter_tabs(tabs):
+            rows[tab].append(row)
+        return rows
+
     def fetch_emails(self, filter_by: dict = None) -> list[dict]:
         self.logger.info("Fetching emails...")
-        sheet = self.service.spreadsheets()
-        result = sheet.values().get(
-            spreadsheetId=self.spreadsheet_id,
-            range=self.spreadsheet_range
-        ).execute()
-        values = result.get("values", [])
-        col = values[0]
-        rows = values[1:]
-        employees = [dict(zip(col, row)) for row in rows]
+        employees = self.iter_rows()
 
         if filter_by:
             filtered = []
@@ -59,4 +173,4 @@ class GSheetService:
                     filtered.append(employee)
             return filtered
 
-        return employees
\ No newline at end of file
+        return list(employees)
@@ -0,0 +1,263 @@
+from components.utils.AsyncGmailService import AsyncGmailService
+from components.utils.GmailService import GmailService
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import threading
+import asyncio
+import logging
+import random
+import time
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class TokenBucket:
+    """
+    Thread-safe token bucket: `rate` units refill per second, up to `capacity`.
+
+    The rate can be changed on the fly, which `GmailSendEngine` uses to back off.
+    """
+    def __init__(self, rate: float, capacity: float = None):
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        self.rate = rate
+        self.capacity = capacity or rate
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def set_rate(self, rate: float):
+        with self._lock:
+            self._refill()
+            self.rate = rate
+
+    def acquire(self, units: float = 1) -> float:
+        """Blocks until `units` tokens are available and takes them. Returns the seconds waited."""
+        if units > self.capacity:
+            raise ValueError(f"Cannot acquire {units} units from a bucket of {self.capacity}.")
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= units:
+                    self._tokens -= units
+                    return waited
+                delay = (units - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+    async def acquire_async(self, units: float = 1) -> float:
+        """`acquire` for coroutines: waits with `asyncio.sleep` instead of blocking the thread."""
+        if units > self.capacity:
+            raise ValueError(f"Cannot acquire {units} units from a bucket of {self.capacity}.")
+        waited = 0.0
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= units:
+                    self._tokens -= units
+                    return waited
+                delay = (units - self._tokens) / self.rate
+            await asyncio.sleep(delay)
+            waited += delay
+
+@dataclass
+class SendStats:
+    """Pacing figures of one `send`/`asend` call; the bucket and pauses are shared by all calls."""
+    min_rate: float
+    backoffs: int = 0
+    backoff_seconds: float = 0.0
+    throttled_seconds: float = 0.0
+
+class GmailSendEngine:
+    """
+    Sends messages through `GmailService.send_email` from a pool of `workers`
+    threads, paced by a shared `TokenBucket` in Gmail quota units.
+
+    Gmail charges 100 units per `messages.send` and allows 250 units per user per
+    second, so the default pace is 2.5 sends/s with a one-second burst. On
+    `rateLimitExceeded`/`userRateLimitExceeded` (or a 429) every worker pauses
+    with exponential backoff and the rate is halved; each success afterwards
+    nudges it back up towards the quota.
+
+    ```python
+    engine = GmailSendEngine(gmail, workers=4)
+    report = engine.send([{"to": "juan@example.com", "subject": "...", "body": "..."}, ...])
+    report["stats"]  # {"sent": 40, "failed": 0, "throughput": 2.4, "backoffs": 1, ...}
+    ```
+
+    With an `async_gmail` client, `asend` does the same from the event loop, with
+    up to `async_concurrency` sends in flight instead of a thread per send.
+    """
+    SEND_COST = 100
+    USER_QUOTA_PER_SECOND = 250
+
+    def __init__(
+        self,
+        gmail: GmailService,
+        workers: int = 4,
+        quota_per_second: float = USER_QUOTA_PER_SECOND,
+        max_retries: int = 5,
+        backoff: float = 1.0,
+        max_backoff: float = 64.0,
+        async_gmail: AsyncGmailService = None,
+        async_concurrency: int = 50
+    ):
+        if workers < 1:
+            raise ValueError("workers must be at least 1.")
+        self.logger = logging.getLogger(__name__)
+        self.gmail = gmail
+        self.workers = workers
+        self.quota_per_second = quota_per_second
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.async_gmail = async_gmail
+        self.async_concurrency = async_concurrency
+        self.bucket = TokenBucket(rate=quota_per_second, capacity=max(quota_per_second, self.SEND_COST))
+
+        self._lock = threading.Lock()
+        self._paused_until = 0.0
+        self._consecutive_limits = 0
+
+    def _wait_if_paused(self):
+        while True:
+            with self._lock:
+                delay = self._paused_until - time.monotonic()
+            if delay <= 0:
+                return
+            time.sleep(delay)
+
+    async def _wait_if_paused_async(self):
+        while True:
+            with self._lock:
+                delay = self._paused_until - time.monotonic()
+            if delay <= 0:
+                return
+            await asyncio.sleep(delay)
+
+    def _on_rate_limited(self, stats: SendStats):
+        with self._lock:
+            self._consecutive_limits += 1
+            delay = min(self.max_backoff, self.backoff * 2 ** (self._consecutive_limits - 1))
+            delay += random.uniform(0, self.backoff)
+            self._paused_until = max(self._paused_until, time.monotonic() + delay)
+            rate = max(self.quota_per_second / 10, self.bucket.rate / 2)
+            self.bucket.set_rate(rate)
+            stats.backoffs += 1
+            stats.backoff_seconds += delay
+            stats.min_rate = min(stats.min_rate, rate)
+        self.logger.warning(f"Gmail rate limit hit; pausing {delay:.1f}s at {rate:.0f} units/s")
+
+    def _on_success(self):
+        with self._lock:
+            self._consecutive_limits = 0
+            if self.bucket.rate < self.quota_per_second:
+                self.bucket.set_rate(min(self.quota_per_second, self.bucket.rate + self.quota_per_second / 20))
+
+    def _failed(self, result: dict, error: Exception, in_doubt: bool) -> dict:
+        result["in_doubt"] = in_doubt
+        if in_doubt:
+            self.logger.error(f"Send to {result['to']} got no answer and may have gone out: {error}")
+        else:
+            self.logger.error(f"Failed to send to {result['to']}: {error}")
+        return result
+
+    def _send_one(self, message: dict, stats: SendStats) -> dict:
+        result = {
+            "to": self.gmail._format_recipients(message["to"]), "id": None, "error": None, "attempts": 0, "in_doubt": False
+        }
+        while True:
+            self._wait_if_paused()
+            waited = self.bucket.acquire(self.SEND_COST)
+            with self._lock:
+                stats.throttled_seconds += waited
+            result["attempts"] += 1
+            try:
+                result["id"] = self.gmail.send_email(
+                    message["to"], message["subject"], message["body"], attachments=message.get("attachments")
+                )
+                result["error"] = None
+                self._on_success()
+                return result
+            except Exception as e:
+                result["error"] = str(e)
+                if not self.gmail.is_rate_limited(e) or result["attempts"] > self.max_retries:
+                    return self._failed(result, e, self.gmail.is_in_doubt(e))
+                self._on_rate_limited(stats)
+
+    async def _send_one_async(self, message: dict, stats: SendStats, semaphore: asyncio.Semaphore) -> dict:
+        result = {
+            "to": self.async_gmail._format_recipients(message["to"]), "id": None, "error": None, "attempts": 0,
+            "in_doubt": False
+        }
+        async with semaphore:
+            while True:
+                await self._wait_if_paused_async()
+                waited = await self.bucket.acquire_async(self.SEND_COST)
+                with self._lock:
+                    stats.throttled_seconds += waited
+                result["attempts"] += 1
+                try:
+                    result["id"] = await self.async_gmail.send_email(
+                        message["to"], message["subject"], message["body"], attachments=message.get("attachments")
+                    )
+                    result["error"] = None
+                    self._on_success()
+                    return result
+                except Exception as e:
+                    result["error"] = str(e)
+                    if not self.async_gmail.is_rate_limited(e) or result["attempts"] > self.max_retries:
+                        return self._failed(result, e, self.async_gmail.is_in_doubt(e))
+                    self._on_rate_limited(stats)
+
+    def _report(self, results: list[dict], stats: SendStats, duration: float) -> dict:
+        sent = sum(1 for result in results if result["id"])
+        in_doubt = sum(1 for result in results if result["in_doubt"])
+        report = {
+            "messages": len(results),
+            "sent": sent,
+            "failed": len(results) - sent - in_doubt,
+            "in_doubt": in_doubt,
+            "retries": sum(max(0, result["attempts"] - 1) for result in results),
+            "duration": round(duration, 2),
+            "throughput": round(sent / duration, 2) if duration else 0.0,
+            "backoffs": stats.backoffs,
+            "backoff_seconds": round(stats.backoff_seconds, 2),
+            "throttled_seconds": round(stats.throttled_seconds, 2),
+            "min_rate": stats.min_rate,
+            "final_rate": self.bucket.rate
+        }
+        self.logger.info(f"Concurrent send done: {report}")
+        return {"results": results, "stats": report}
+
+    def send(self, messages: list[dict]) -> dict:
+        """
+        Sends `messages` (`{"to": ..., "subject": ..., "body": ...}`) concurrently.
+
+        Returns `{"results": [...], "stats": {...}}`; results are in `messages` order,
+        in the same shape as `GmailService.send_many`. Stats cover this call only,
+        even while other calls share the engine.
+        """
+        stats = SendStats(min_rate=self.bucket.rate)
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="gmail-send") as executor:
+            results = list(executor.map(lambda message: self._send_one(message, stats), messages))
+        return self._report(results, stats, time.perf_counter() - started)
+
+    async def asend(self, messages: list[dict]) -> dict:
+        """`send` through `async_gmail`; same pacing, backoff and report."""
+        if self.async_gmail is None:
+            raise RuntimeError("No async Gmail client configured.")
+        stats = SendStats(min_rate=self.bucket.rate)
+        started = time.perf_counter()
+        semaphore = asyncio.Semaphore(self.async_concurrency)
+        results = await asyncio.gather(*(self._send_one_async(message, stats, semaphore) for message in messages))
+        return self._report(list(results), stats, time.perf_counter() - started)
@@ -1,13 +1,26 @@
 from google.oauth2.credentials import Credentials
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from googleapiclient.http import BatchHttpRequest, MediaFileUpload
+from email.mime.application import MIMEApplication
 from email.mime.multipart import MIMEMultipart
+from components.utils.AuthorizedHttpPool import AuthorizedHttpPool
+from components.utils.CredentialManager import CredentialManager
+from typing import BinaryIO, Optional, Union, List
+from email.utils import encode_rfc2231
 from googleapiclient.discovery import build
-from typing import Optional, Union, List
+from googleapiclient.errors import HttpError
+from components.storage import ObjectStore
 from email.mime.text import MIMEText
+from dataclasses import dataclass
+from email.header import Header
+import tempfile
 import logging
+import random
 import base64
 import json
+import time
+import uuid
 import os
 
 logging.basicConfig(
@@ -15,17 +28,175 @@ logging.basicConfig(
     format="%(asctime)s - %(levelname)s - %(message)s"
 )
 
-class GmailService:
+@dataclass
+class Attachment:
+    """A file to attach, read from `path` on disk or from `key` in an `ObjectStore`."""
+    filename: str
+    path: str = None
+    key: str = None
+    store: ObjectStore = None
+    content_type: str = "application/pdf"
+
+    def open(self) -> BinaryIO:
+        if self.path:
+            return open(self.path, "rb")
+        if self.key and self.store:
+            return self.store.open(self.key)
+        raise ValueError(f"Attachment {self.filename!r} has neither a path nor a store key.")
+
+    def size(self) -> int:
+        if self.path:
+            return os.path.getsize(self.path)
+        head = self.store.head(self.key) if self.key and self.store else None
+        if not head:
+            raise FileNotFoundError(f"Attachment {self.filename!r} not found in the object store.")
+        return head["size"]
+
+class MessageUnavailable(RuntimeError):
+    """The message couldn't be built (e.g. an attachment can't be read), so nothing was sent."""
+
+class MessageBuilder:
+    """MIME message building shared by `GmailService` and `AsyncGmailService`."""
+    # Multiple of 57 bytes, so every chunk base64-encodes to whole 76-character lines.
+    ENCODE_CHUNK_SIZE = 57 * 1024
+
+    sender_email: str
+    upload_threshold: int
+
+    def _format_recipients(self, recipients: Union[str, List[str]]) -> str:
+        """Convert recipients to comma-separated string."""
+        if isinstance(recipients, str):
+            return recipients
+        elif isinstance(recipients, list):
+            return ', '.join(recipients)
+        else:
+            raise TypeError("Recipients must be a string or list of strings")
+
+    def _create_message(
+        self,
+        to: Union[str, List[str]],
+        subject: str,
+        body: str,
+        attachments: List[Attachment] = None
+    ) -> dict:
+        """Create an email message for the inline `raw` path; attachments are read into memory."""
+        message = MIMEMultipart()
+        message['To'] = self._format_recipients(to)
+        message['From'] = self.sender_email
+        message['Subject'] = subject
+        message.attach(MIMEText(body, 'plain'))
+        for attachment in attachments or []:
+            try:
+                with attachment.open() as f:
+                    part = MIMEApplication(f.read(), _subtype=attachment.content_type.split("/")[-1])
+            except (OSError, ValueError) as e:
+                raise MessageUnavailable(f"Attachment unavailable: {e}") from e
+            part.add_header('Content-Disposition', 'attachment', filename=attachment.filename)
+            message.attach(part)
+
+        return {'raw': base64.urlsafe_b64encode(message.as_bytes()).decode()}
+
+    def _needs_upload(self, attachments: Optional[List[Attachment]]) -> bool:
+        try:
+            return bool(attachments) and sum(attachment.size() for attachment in attachments) >= self.upload_threshold
+        except (OSError, ValueError) as e:
+            raise MessageUnavailable(f"Attachment unavailable: {e}") from e
+
+    def _write_message(
+        self,
+        f: BinaryIO,
+        to: Union[str, List[str]],
+        subject: str,
+        body: str,
+        attachments: List[Attachment]
+    ):
+        """Writes the MIME message to `f`, base64-encoding attachments one chunk at a time."""
+        boundary = f"==============={uuid.uuid4().hex}=="
+        headers = [
+            "MIME-Version: 1.0",
+            f"To: {self._format_recipients(to)}",
+            f"From: {self.sender_email}",
+            f"Subject: {Header(subject, 'utf-8').encode()}",
+            f'Content-Type: multipart/mixed; boundary="{boundary}"'
+        ]
+        f.write(("\r\n".join(headers) + "\r\n\r\n").encode())
+        f.write(
+            f'--{boundary}\r\nContent-Type: text/plain; charset="utf-8"\r\n'
+            f"Content-Transfer-Encoding: base64\r\n\r\n".encode()
+        )
+        f.write(base64.encodebytes(body.encode()).replace(b"\n", b"\r\n"))
+        for attachment in attachments:
+            filename = encode_rfc2231(attachment.filename, "utf-8")
+            f.write(
+                f"--{boundary}\r\nContent-Type: {attachment.content_type}\r\n"
+                f"Content-Disposition: attachment; filename*={filename}\r\n"
+                f"Content-Transfer-Encoding: base64\r\n\r\n".encode()
+            )
+            try:
+                with attachment.open() as source:
+                    while chunk := source.read(self.ENCODE_CHUNK_SIZE):
+                        f.write(base64.encodebytes(chunk).replace(b"\n", b"\r\n"))
+            except (OSError, ValueError) as e:
+                raise MessageUnavailable(f"Attachment unavailable: {e}") from e
+        f.write(f"--{boundary}--\r\n".encode())
+
+class GmailService(MessageBuilder):
     SCOPES = [
         "https://www.googleapis.com/auth/gmail.send",
         "https://www.googleapis.com/auth/gmail.readonly"
     ]
+    DEFAULT_API_ENDPOINT = "https://gmail.googleapis.com"
+    BATCH_PATH = "batch/gmail/v1"
+    # Gmail accepts up to 100 calls per batch but starts rate limiting well before that.
+    MAX_BATCH_SIZE = 100
+    RETRYABLE_STATUSES = (429, 500, 502, 503, 504)
+    RATE_LIMIT_REASONS = ("rateLimitExceeded", "userRateLimitExceeded")
+    UPLOAD_CHUNK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        *,
+        token_file: str = None,
+        token_key: str = None,
+        oauth_file: str = None,
+        oauth_key: str = None,
+        credential_manager: CredentialManager = None,
+        api_endpoint: str = None,
+        batch_size: int = 25,
+        upload_threshold: int = 1024 * 1024,
+        pool_size: int = 8
+    ):
+        """
+        Initialize Gmail client with authentication.
+
+        `api_endpoint` points the client (and its batch requests) somewhere other
+        than Gmail, e.g. a local fake server in tests. Messages whose attachments
+        add up to `upload_threshold` bytes or more are streamed through a resumable
+        media upload instead of the inline `raw` field.
+
+        Every API call runs on a transport leased from a bounded `AuthorizedHttpPool`,
+        so one instance can be shared by all request threads.
 
-    def __init__(self, *, token_file: str, token_key: str, oauth_file: str, oauth_key: str):
-        """Initialize Gmail client with authentication."""
+        With a `credential_manager` the token is shared with it and kept fresh in
+        the background, and no OAuth flow is ever started; the token/OAuth file
+        arguments are only used without one (scripts).
+        """
         self.logger = logging.getLogger(__name__)
-        self.creds = self._authenticate(token_file, token_key, oauth_file, oauth_key)
-        self.service = build('gmail', 'v1', credentials=self.creds, cache_discovery=False)
+        self.api_endpoint = (api_endpoint or self.DEFAULT_API_ENDPOINT).rstrip("/")
+        self.batch_size = batch_size
+        self.upload_threshold = upload_threshold
+        if credential_manager:
+            self.creds = credential_manager.credentials
+        else:
+            self.creds = self._authenticate(token_file, token_key, oauth_file, oauth_key)
+        self.http_pool = AuthorizedHttpPool(credential_manager or self.creds, size=pool_size)
+        self.service = build(
+            'gmail',
+            'v1',
+            credentials=self.creds,
+            cache_discovery=False,
+            client_options={"api_endpoint": self.api_endpoint} if api_endpoint else None
+        )
         self.sender_email = self._get_sender_email()
         self.logger.info(f"Gmail service authenticated as {self.sender_email!r}")
 
@@ -100,34 +271,190 @@ class GmailService:
 
     def _get_sender_email(self) -> str:
         """Get authenticated user's email address."""
-        profile = self.service.users().getProfile(userId='me').execute()
+        with self.http_pool.lease() as http:
+            profile = self.service.users().getProfile(userId='me').execute(http=http)
         return profile['emailAddress']
 
-    def _format_recipients(self, recipients: Union[str, List[str]]) -> str:
-        """Convert recipients to comma-separated string."""
-        if isinstance(recipients, str):
-            return recipients
-        elif isinstance(recipients, list):
-            return ', '.join(recipients)
-        else:
-            raise TypeError("Recipients must be a string or list of strings")
-
-    def _create_message(self, to: Union[str, List[str]], subject: str, body: str) -> dict:
-        """Create basic email message."""
-        message = MIMEMultipart()
-        message['To'] = self._format_recipients(to)
-        message['From'] = self.sender_email
-        message['Subject'] = subject
-        message.attach(MIMEText(body, 'plain'))
-
-        return {'raw': base64.urlsafe_b64encode(message.as_bytes()).decode()}
+    def _send_upload(
+        self,
+        to: Union[str, List[str]],
+        subject: str,
+        body: str,
+        attachments: List[Attachment]
+    ) -> dict:
+        """Sends through a resumable `media_body` upload so the message is never held in memory."""
+        fd, path = tempfile.mkstemp(suffix=".eml")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                self._write_message(f, to, subject, body, attachments)
+            media = MediaFileUpload(path, mimetype="message/rfc822", chunksize=self.UPLOAD_CHUNK_SIZE, resumable=True)
+            request = self.service.users().messages().send(userId='me', body={}, media_body=media)
+            response = None
+            with self.http_pool.lease() as http:
+                while response is None:
+                    _, response = request.next_chunk(http=http)
+            return response
+        finally:
+            os.remove(path)
 
-    def send_email(self, recipient_email: Union[str, List[str]], subject: str, body: str) -> str:
-        """Send a basic email."""
-        message = self._create_message(recipient_email, subject, body)
-        result = self.service.users().messages().send(userId='me', body=message).execute()
+    def send_email(
+        self,
+        recipient_email: Union[str, List[str]],
+        subject: str,
+        body: str,
+        attachments: List[Attachment] = None
+    ) -> str:
+        """Send an email, optionally with attachments. Safe to call from several threads at once."""
+        if self._needs_upload(attachments):
+            result = self._send_upload(recipient_email, subject, body, attachments)
+        else:
+            message = self._create_message(recipient_email, subject, body, attachments)
+            with self.http_pool.lease() as http:
+                result = self.service.users().messages().send(userId='me', body=message).execute(http=http)
         message_id = result['id']
 
         recipients = self._format_recipients(recipient_email)
         self.logger.info(f"Email sent to {recipients}! Message ID: {message_id}")
-        return message_id
\ No newline at end of file
+        return message_id
+
+    def _error_reason(self, error: Exception) -> str:
+        """Gmail's `reason` for an `HttpError` (e.g. `userRateLimitExceeded`), if it sent one."""
+        if not isinstance(error, HttpError):
+            return ""
+        try:
+            details = json.loads(error.content.decode())["error"]
+            return (details.get("errors") or [{}])[0].get("reason", "") or details.get("status", "")
+        except (ValueError, KeyError, AttributeError):
+            return ""
+
+    def is_rate_limited(self, error: Exception) -> bool:
+        """True for Gmail's 429 / `rateLimitExceeded` / `userRateLimitExceeded` errors."""
+        if not isinstance(error, HttpError):
+            return False
+        return error.resp.status == 429 or self._error_reason(error) in self.RATE_LIMIT_REASONS
+
+    def _is_retryable(self, error: Exception) -> bool:
+        """Only definite answers from Gmail: a 429/5xx means the send was not accepted."""
+        if not isinstance(error, HttpError):
+            return False
+        return error.resp.status in self.RETRYABLE_STATUSES or self.is_rate_limited(error)
+
+    def is_in_doubt(self, error: Exception) -> bool:
+        """
+        True when a send failed without an answer from Gmail (timeout, dropped
+        connection, ...): the message may have gone out, so it must not be re-sent
+        automatically.
+        """
+        return not isinstance(error, (HttpError, MessageUnavailable))
+
+    def _send_batch(self, messages: dict[str, dict]) -> dict[str, Union[str, Exception]]:
+        """Sends one batch request. Returns each request ID's message ID or exception."""
+        outcomes: dict[str, Union[str, Exception]] = {}
+
+        def callback(request_id: str, response: dict, exception: Exception):
+            outcomes[request_id] = exception if exception else response["id"]
+
+        batch = BatchHttpRequest(callback=callback, batch_uri=f"{self.api_endpoint}/{self.BATCH_PATH}")
+        added = []
+        for request_id, message in messages.items():
+            try:
+                body = self._create_message(message["to"], message["subject"], message["body"], message.get("attachments"))
+            except MessageUnavailable as e:
+                outcomes[request_id] = e
+                continue
+            batch.add(self.service.users().messages().send(userId='me', body=body), request_id=request_id)
+            added.append(request_id)
+        if not added:
+            return outcomes
+        try:
+            with self.http_pool.lease() as http:
+                batch.execute(http=http)
+        except Exception as e:
+            # The batch itself failed; every sub-request without an answer failed with it.
+            self.logger.warning(f"Batch request failed: {e}")
+            for request_id in added:
+                outcomes.setdefault(request_id, e)
+        return outcomes
+
+    def send_many(
+        self,
+        messages: list[dict],
+        batch_size: int = None,
+        max_retries: int = 3,
+        backoff: float = 1.0
+    ) -> list[dict]:
+        """
+        Sends `messages` (`{"to": ..., "subject": ..., "body": ...}`) through Gmail
+        batch requests of `batch_size` sends each.
+
+        Batch requests can't carry media uploads, so messages whose `attachments`
+        cross the upload threshold are sent one by one through the resumable path.
+        Sends that Gmail answered with a rate-limit or 5xx error are retried up to
+        `max_retries` times with exponential backoff. Sends that got no answer
+        (timeouts, dropped connections) may have gone out: they are reported as
+        `in_doubt` and never re-sent. Returns one result per message, in order:
+
+        ```python
+        [{"to": "juan@example.com", "id": "18c1...", "error": None, "attempts": 1, "in_doubt": False}, ...]
+        ```
+        """
+        batch_size = min(batch_size or self.batch_size, self.MAX_BATCH_SIZE)
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1.")
+
+        results = [
+            {"to": self._format_recipients(message["to"]), "id": None, "error": None, "attempts": 0, "in_doubt": False}
+            for message in messages
+        ]
+        pending = []
+        uploads = set()
+        for index, message in enumerate(messages):
+            try:
+                if self._needs_upload(message.get("attachments")):
+                    uploads.add(index)
+                pending.append(index)
+            except MessageUnavailable as e:
+                results[index]["error"] = str(e)
+        attempt = 0
+
+        while pending:
+            if attempt:
+                delay = backoff * 2 ** (attempt - 1) + random.uniform(0, backoff)
+                self.logger.info(f"Retrying {len(pending)} failed send(s) in {delay:.1f}s (attempt {attempt + 1})")
+                time.sleep(delay)
+            inline = [index for index in pending if index not in uploads]
+            outcomes: dict[str, Union[str, Exception]] = {}
+            for start in range(0, len(inline), batch_size):
+                chunk = inline[start:start + batch_size]
+                outcomes.update(self._send_batch({str(index): messages[index] for index in chunk}))
+            for index in pending:
+                if index not in uploads:
+                    continue
+                message = messages[index]
+                try:
+                    outcomes[str(index)] = self._send_upload(
+                        message["to"], message["subject"], message["body"], message["attachments"]
+                    )["id"]
+                except Exception as e:
+                    outcomes[str(index)] = e
+
+            retry = []
+            for index in pending:
+                outcome = outcomes.get(str(index), RuntimeError("No response for batch sub-request"))
+                result = results[index]
+                result["attempts"] += 1
+                if isinstance(outcome, Exception):
+                    result["error"] = str(outcome)
+                    result["in_doubt"] = self.is_in_doubt(outcome)
+                    if self._is_retryable(outcome):
+                        retry.append(index)
+                else:
+                    result["id"] = outcome
+                    result["error"] = None
+            attempt += 1
+            pending = retry if attempt <= max_retries else []
+
+        sent = sum(1 for result in results if result["id"])
+        in_doubt = sum(1 for result in results if result["in_doubt"])
+        self.logger.info(f"Batch send done: {sent}/{len(results)} sent, {in_doubt} in doubt")
+        return results
@@ -9,14 +9,22 @@ class GoogleServiceFactory:
             return GSheetService(
                 service_account_file=config["service_account_file"],
                 spreadsheet_id=config["spreadsheet_id"],
-                spreadsheet_range=config["spreadsheet_range"]
+                spreadsheet_range=config["spreadsheet_range"],
+                pool_size=config.get("pool_size", 8),
+                credential_manager=config.get("credential_manager"),
+                chunk_rows=config.get("chunk_rows", GSheetService.CHUNK_ROWS)
             )
         elif service == "gmail":
             return GmailService(
+                credential_manager=config.get("credential_manager"),
                 token_file=config["gmail_token_file"],
                 token_key="GMAIL_TOKEN_LICAHR",
                 oauth_key="LICAHR_EMAIL_OAUTH",
-                oauth_file=config["oauth_file"]
+                oauth_file=config["oauth_file"],
+                api_endpoint=config.get("api_endpoint"),
+                batch_size=config.get("batch_size", 25),
+                upload_threshold=config.get("upload_threshold", 1024 * 1024),
+                pool_size=config.get("pool_size", 8)
             )
         else:
             raise ValueError(f"Unsupported service type: {service}")
\ No newline at end of file
@@ -0,0 +1,302 @@
+from components.utils.Database import Database
+from typing import Any, Callable, Optional
+from datetime import datetime, timezone
+import threading
+import logging
+import socket
+import uuid
+import time
+import json
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+def _now() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+class JobStore:
+    """
+    Job table in a SQLite file or a PostgreSQL database (see `Database`), so
+    queued and interrupted jobs survive restarts.
+
+    Job status goes `queued -> running -> succeeded | failed | cancelled`. A
+    running job is leased to its `owner` process like a `WorkQueue` item: the
+    owner `heartbeat`s it, and only a job whose lease expired (its process died)
+    is claimed again, so several app processes can share one store.
+    """
+    FINAL_STATUSES = ("succeeded", "failed", "cancelled")
+
+    def __init__(self, path: str):
+        self.path = path
+        self.db = Database(path)
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS jobs (
+                    id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    status TEXT NOT NULL,
+                    done INTEGER NOT NULL DEFAULT 0,
+                    total INTEGER,
+                    result TEXT,
+                    error TEXT,
+                    cancel_requested INTEGER NOT NULL DEFAULT 0,
+                    created_at TEXT NOT NULL,
+                    started_at TEXT,
+                    finished_at TEXT,
+                    owner TEXT,
+                    lease_expires DOUBLE PRECISION
+                )
+                """
+            )
+            columns = self.db.columns(conn, "jobs")
+            if "owner" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN owner TEXT")
+            if "lease_expires" not in columns:
+                conn.execute("ALTER TABLE jobs ADD COLUMN lease_expires DOUBLE PRECISION")
+
+    @staticmethod
+    def _to_dict(row) -> dict:
+        job = dict(row)
+        job["params"] = json.loads(job["params"])
+        job["result"] = json.loads(job["result"]) if job["result"] else None
+        job["cancel_requested"] = bool(job["cancel_requested"])
+        return job
+
+    def create(self, kind: str, params: dict) -> dict:
+        job_id = uuid.uuid4().hex
+        with self.db.transaction() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, kind, params, status, created_at) VALUES (?, ?, ?, 'queued', ?)",
+                (job_id, kind, json.dumps(params), _now())
+            )
+        return self.get(job_id)
+
+    def get(self, job_id: str) -> Optional[dict]:
+        with self.db.transaction() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return self._to_dict(row) if row else None
+
+    def list(self, status: str = None, limit: int = 50) -> list[dict]:
+        query = "SELECT * FROM jobs"
+        args: tuple = ()
+        if status:
+            query += " WHERE status = ?"
+            args = (status,)
+        query += " ORDER BY created_at DESC LIMIT ?"
+        with self.db.transaction() as conn:
+            rows = conn.execute(query, args + (limit,)).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def claim_next(self, owner: str, lease_seconds: float = 60) -> Optional[dict]:
+        """
+        Leases the oldest queued job, or a running one whose owner stopped
+        heartbeating, to `owner` and returns it.
+        """
+        now = time.time()
+        with self.db.transaction(immediate=True) as conn:
+            row = conn.execute(
+                f"""
+                SELECT id FROM jobs
+                WHERE status = 'queued' OR (status = 'running' AND COALESCE(lease_expires, 0) < ?)
+                ORDER BY created_at
+                LIMIT 1{self.db.skip_locked}
+                """,
+                (now,)
+            ).fetchone()
+            if not row:
+                return None
+            conn.execute(
+                "UPDATE jobs SET status = 'running', owner = ?, lease_expires = ?, started_at = ? WHERE id = ?",
+                (owner, now + lease_seconds, _now(), row["id"])
+            )
+        return self.get(row["id"])
+
+    def heartbeat(self, job_id: str, owner: str, lease_seconds: float = 60) -> bool:
+        """Extends the lease. Returns `False` if `owner` no longer runs the job."""
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE jobs SET lease_expires = ? WHERE id = ? AND status = 'running' AND owner = ?",
+                (time.time() + lease_seconds, job_id, owner)
+            )
+        return cursor.rowcount == 1
+
+    def requeue_expired(self) -> int:
+        """Puts running jobs whose owner stopped heartbeating (a dead process) back in the queue."""
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE jobs SET status = 'queued', owner = NULL, lease_expires = NULL, started_at = NULL
+                WHERE status = 'running' AND COALESCE(lease_expires, 0) < ?
+                """,
+                (time.time(),)
+            )
+        return cursor.rowcount
+
+    def update_progress(self, job_id: str, done: int, total: int):
+        with self.db.transaction() as conn:
+            conn.execute("UPDATE jobs SET done = ?, total = ? WHERE id = ?", (done, total, job_id))
+
+    def finish(self, job_id: str, status: str, result: Any = None, error: str = None, owner: str = None) -> bool:
+        """Records the outcome; with an `owner`, only if that process still holds the job."""
+        query = """
+            UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, owner = NULL, lease_expires = NULL
+            WHERE id = ?
+        """
+        args: tuple = (status, json.dumps(result) if result is not None else None, error, _now(), job_id)
+        if owner:
+            query += " AND status = 'running' AND owner = ?"
+            args += (owner,)
+        with self.db.transaction() as conn:
+            cursor = conn.execute(query, args)
+        return cursor.rowcount == 1
+
+    def request_cancel(self, job_id: str) -> Optional[dict]:
+        """Cancels a queued job outright; flags a running one so its handler can stop."""
+        with self.db.transaction() as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'cancelled', cancel_requested = 1, finished_at = ? WHERE id = ? AND status = 'queued'",
+                (_now(), job_id)
+            )
+            conn.execute(
+                "UPDATE jobs SET cancel_requested = 1 WHERE id = ? AND status = 'running'",
+                (job_id,)
+            )
+        return self.get(job_id)
+
+    def is_cancel_requested(self, job_id: str) -> bool:
+        with self.db.transaction() as conn:
+            row = conn.execute("SELECT cancel_requested FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return bool(row and row["cancel_requested"])
+
+class JobContext:
+    """Handed to job handlers to report progress and check for cancellation."""
+    def __init__(self, store: JobStore, job_id: str):
+        self.store = store
+        self.job_id = job_id
+
+    def progress(self, done: int, total: int):
+        self.store.update_progress(self.job_id, done, total)
+
+    def cancelled(self) -> bool:
+        return self.store.is_cancel_requested(self.job_id)
+
+JobHandler = Callable[[dict, JobContext], Any]
+
+class JobQueue:
+    """
+    Runs jobs from a `JobStore` on a pool of worker threads.
+
+    ```python
+    queue = JobQueue(JobStore("./tmp/jobs.sqlite3"), workers=1)
+    queue.register("report-card", lambda params, ctx: run(**params, progress=ctx.progress))
+    queue.start()
+    job = queue.submit("report-card", {"dept": "SC", ...})
+    ```
+
+    Handlers return a JSON-serializable result. A handler that returns after its
+    job was cancelled finishes as `cancelled` instead of `succeeded`.
+
+    Running jobs are heartbeated every `lease_seconds / 3` under this queue's
+    `owner` id. On start, and whenever a worker looks for work, only jobs whose
+    lease expired are taken over, so another live process's jobs (extra uvicorn
+    workers, a rolling restart) are never run twice.
+    """
+    def __init__(
+        self,
+        store: JobStore,
+        workers: int = 1,
+        poll_interval: float = 1.0,
+        lease_seconds: float = 60,
+        owner: str = None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.store = store
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.owner = owner or f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex[:8]}"
+        self._handlers: dict[str, JobHandler] = {}
+        self._threads: list[threading.Thread] = []
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+
+    def register(self, kind: str, handler: JobHandler):
+        self._handlers[kind] = handler
+
+    def submit(self, kind: str, params: dict) -> dict:
+        if kind not in self._handlers:
+            raise ValueError(f"Unknown job kind: {kind}")
+        job = self.store.create(kind, params)
+        self.logger.info(f"Queued {kind} job {job['id']}")
+        self._wakeup.set()
+        return job
+
+    def cancel(self, job_id: str) -> Optional[dict]:
+        return self.store.request_cancel(job_id)
+
+    def start(self):
+        if self._threads:
+            return
+        requeued = self.store.requeue_expired()
+        if requeued:
+            self.logger.info(f"Requeued {requeued} job(s) of processes that stopped heartbeating")
+        self._stopping.clear()
+        for index in range(self.workers):
+            thread = threading.Thread(target=self._work, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = None):
+        self._stopping.set()
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def _work(self):
+        while not self._stopping.is_set():
+            job = self.store.claim_next(self.owner, lease_seconds=self.lease_seconds)
+            if not job:
+                self._wakeup.wait(self.poll_interval)
+                self._wakeup.clear()
+                continue
+            self._execute(job)
+
+    def _execute(self, job: dict):
+        handler = self._handlers.get(job["kind"])
+        if not handler:
+            self.store.finish(job["id"], "failed", error=f"Unknown job kind: {job['kind']}", owner=self.owner)
+            return
+        self.logger.info(f"Running {job['kind']} job {job['id']}")
+        context = JobContext(self.store, job["id"])
+        stop_heartbeat = threading.Event()
+
+        def heartbeat():
+            while not stop_heartbeat.wait(self.lease_seconds / 3):
+                if not self.store.heartbeat(job["id"], self.owner, lease_seconds=self.lease_seconds):
+                    self.logger.warning(f"Lost the lease on job {job['id']}")
+                    return
+
+        heartbeat_thread = threading.Thread(target=heartbeat, name=f"job-heartbeat-{job['id'][:8]}", daemon=True)
+        heartbeat_thread.start()
+        try:
+            try:
+                result = handler(job["params"], context)
+            except Exception as e:
+                self.logger.error(f"Job {job['id']} failed: {e}", exc_info=True)
+                status, result, error = "failed", None, str(e)
+            else:
+                status = "cancelled" if context.cancelled() else "succeeded"
+                error = None
+        finally:
+            stop_heartbeat.set()
+            heartbeat_thread.join()
+        if self.store.finish(job["id"], status, result=result, error=error, owner=self.owner):
+            self.logger.info(f"Job {job['id']} {status}")
+        else:
+            self.logger.warning(f"Job {job['id']} was taken over by another process; dropping this run's outcome")
@@ -0,0 +1,184 @@
+from typing import Generic, Hashable, Iterable, Optional, TypeVar
+from dataclasses import dataclass, field
+from collections import Counter
+import unicodedata
+import re
+
+T = TypeVar("T")
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+def fold_name(name: Optional[str]) -> str:
+    """Accent-folded, lowercased name with punctuation as spaces: `"José  Dela-Cruz"` -> `"jose dela cruz"`."""
+    if not name:
+        return ""
+    decomposed = unicodedata.normalize("NFKD", name)
+    stripped = "".join(char for char in decomposed if not unicodedata.combining(char))
+    return " ".join(_NON_ALNUM.sub(" ", stripped.lower()).split())
+
+def token_set(name: Optional[str]) -> str:
+    """`fold_name` with the words deduplicated and sorted, so word order doesn't matter."""
+    return " ".join(sorted(set(fold_name(name).split())))
+
+def trigrams(key: str) -> set[str]:
+    padded = f"  {key} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+@dataclass
+class NameMatch(Generic[T]):
+    query: str
+    status: str  # matched | ambiguous | unmatched
+    name: Optional[str] = None
+    value: Optional[T] = None
+    score: float = 0.0
+    alternatives: list[tuple[str, float]] = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            "query": self.query,
+            "status": self.status,
+            "name": self.name,
+            "score": round(self.score, 3),
+            "alternatives": [{"name": name, "score": round(score, 3)} for name, score in self.alternatives]
+        }
+
+@dataclass
+class MatchReport(Generic[T]):
+    matched: dict[Hashable, NameMatch[T]] = field(default_factory=dict)
+    ambiguous: dict[Hashable, NameMatch[T]] = field(default_factory=dict)
+    unmatched: dict[Hashable, NameMatch[T]] = field(default_factory=dict)
+
+    def to_dict(self) -> dict:
+        return {
+            "matched": len(self.matched),
+            "ambiguous": [{"id": key, **match.to_dict()} for key, match in self.ambiguous.items()],
+            "unmatched": [{"id": key, **match.to_dict()} for key, match in self.unmatched.items()]
+        }
+
+class NameMatcher(Generic[T]):
+    """
+    Fuzzy name index over a batch of `(name, value)` candidates, e.g. Looker links.
+
+    Names are compared as accent-folded token sets, so spacing, accents, hyphens
+    and word order don't matter. A query is scored only against candidates that
+    share trigrams with it (through an inverted index), keeping a batch close to
+    linear instead of comparing every query with every candidate.
+
+    The score is the trigram Dice coefficient of the two token sets, or, when one
+    name's words are all contained in the other's (a missing middle name), 0.9.
+    A best match below `threshold` is `unmatched`; one within `margin` of a
+    different runner-up is `ambiguous`.
+    """
+    CONTAINED_SCORE = 0.9
+
+    def __init__(
+        self,
+        candidates: Iterable[tuple[str, T]],
+        threshold: float = 0.85,
+        margin: float = 0.05,
+        shortlist: int = 10
+    ):
+        self.threshold = threshold
+        self.margin = margin
+        self.shortlist = shortlist
+        self.names: list[str] = []
+        self.values: list[T] = []
+        self._keys: list[str] = []
+        self._grams: list[set[str]] = []
+        self._exact: dict[str, list[int]] = {}
+        self._postings: dict[str, list[int]] = {}
+        for position, (name, value) in enumerate(candidates):
+            key = token_set(name)
+            grams = trigrams(key)
+            self.names.append(name)
+            self.values.append(value)
+            self._keys.append(key)
+            self._grams.append(grams)
+            self._exact.setdefault(key, []).append(position)
+            for gram in grams:
+                self._postings.setdefault(gram, []).append(position)
+
+    def _score(self, key: str, grams: set[str], position: int) -> float:
+        other = self._grams[position]
+        dice = 2 * len(grams & other) / (len(grams) + len(other))
+        words, other_words = set(key.split()), set(self._keys[position].split())
+        if min(len(words), len(other_words)) >= 2 and (words <= other_words or other_words <= words):
+            return max(dice, self.CONTAINED_SCORE)
+        return dice
+
+    def scores(self, name: str) -> list[tuple[int, float]]:
+        """`(candidate position, score)` pairs for `name`, best first."""
+        key = token_set(name)
+        if not key:
+            return []
+        if key in self._exact:
+            return [(position, 1.0) for position in self._exact[key]]
+        grams = trigrams(key)
+        shared = Counter(position for gram in grams for position in self._postings.get(gram, ()))
+        scored = [(position, self._score(key, grams, position)) for position, _ in shared.most_common(self.shortlist)]
+        return sorted(scored, key=lambda item: item[1], reverse=True)
+
+    def _best(self, names: Iterable[str]) -> tuple[list[tuple[int, float]], str]:
+        best: dict[int, float] = {}
+        query = ""
+        for name in names:
+            query = query or name
+            for position, score in self.scores(name):
+                if score > best.get(position, 0.0):
+                    best[position] = score
+        return sorted(best.items(), key=lambda item: item[1], reverse=True), query
+
+    def _classify(self, query: str, ranked: list[tuple[int, float]]) -> tuple[NameMatch[T], Optional[int]]:
+        alternatives = [(self.names[position], score) for position, score in ranked[1:4]]
+        if not ranked or ranked[0][1] < self.threshold:
+            position, score = ranked[0] if ranked else (None, 0.0)
+            match = NameMatch(
+                query=query, status="unmatched", name=self.names[position] if position is not None else None,
+                score=score, alternatives=alternatives
+            )
+            return match, None
+        position, score = ranked[0]
+        runner_up = next((s for p, s in ranked[1:] if self._keys[p] != self._keys[position]), 0.0)
+        status = "ambiguous" if score < 1.0 and score - runner_up < self.margin else "matched"
+        match = NameMatch(
+            query=query, status=status, name=self.names[position], value=self.values[position],
+            score=score, alternatives=alternatives
+        )
+        return match, position
+
+    def match(self, *names: str) -> NameMatch[T]:
+        """Best candidate for a person known by any of `names`."""
+        ranked, query = self._best(names)
+        return self._classify(query, ranked)[0]
+
+    def reconcile(self, queries: Iterable[tuple[Hashable, list[str]]]) -> MatchReport[T]:
+        """
+        One-to-one matching of `(id, names)` queries to candidates, most confident
+        queries first. A query whose best candidate was already assigned to
+        another query is reported as `ambiguous` rather than given its runner-up.
+        """
+        ranked = {query_id: self._best(names) for query_id, names in queries}
+        order = sorted(
+            ranked,
+            key=lambda query_id: ranked[query_id][0][0][1] if ranked[query_id][0] else 0.0,
+            reverse=True
+        )
+
+        report: MatchReport[T] = MatchReport()
+        taken: set[int] = set()
+        for query_id in order:
+            candidates, query = ranked[query_id]
+            match, position = self._classify(query, candidates)
+            if match.status == "matched" and position in taken:
+                match.status = "ambiguous"
+            if match.status == "matched":
+                taken.add(position)
+                report.matched[query_id] = match
+            elif match.status == "ambiguous":
+                report.ambiguous[query_id] = match
+            else:
+                report.unmatched[query_id] = match
+        return report
+
+    def __len__(self) -> int:
+        return len(self.names)
@@ -0,0 +1,200 @@
+from typing import Any, Callable, Iterable, Iterator, Optional
+from collections import Counter, defaultdict
+from dataclasses import astuple, dataclass
+import hashlib
+
+def normalize_name(name: Optional[str]) -> str:
+    """Lowercases and collapses whitespace, e.g. `"  JUAN  Dela Cruz"` -> `"juan dela cruz"`."""
+    if not name:
+        return ""
+    return " ".join(name.split()).lower()
+
+@dataclass(frozen=True, slots=True)
+class Employee:
+    """One row of the email masterlist: an SC and the GRM they report to."""
+    sc_firstname: str = ""
+    sc_lastname: str = ""
+    sc_email_address: str = ""
+    grm_name: str = ""
+    grm_email_address: str = ""
+    branch: str = ""
+
+    @classmethod
+    def from_row(cls, row: dict) -> "Employee":
+        return cls(
+            sc_firstname=(row.get("sc_firstname") or "").strip(),
+            sc_lastname=(row.get("sc_lastname") or "").strip(),
+            sc_email_address=(row.get("sc_email_address") or "").strip(),
+            grm_name=(row.get("grm_name") or "").strip(),
+            grm_email_address=(row.get("grm_email_address") or "").strip(),
+            branch=(row.get("branch") or "").strip()
+        )
+
+    @property
+    def sc_name(self) -> str:
+        return f"{self.sc_firstname} {self.sc_lastname}".strip()
+
+    @property
+    def key(self) -> str:
+        """Normalized SC full name; the key `Roster.by_name` and the link tables use."""
+        return normalize_name(self.sc_name)
+
+class Roster:
+    """
+    Immutable, indexed view of the email masterlist.
+
+    Indexes are built once per load, so lookups by branch, GRM email, SC email or
+    normalized SC name are dictionary hits instead of scans over the sheet rows.
+    Branch and email keys are case-insensitive.
+
+    `patched` derives the next roster from a sync diff by touching only the
+    affected index entries; the result carries that `diff`, so link tables built
+    for the previous `version` can be patched the same way.
+
+    ```python
+    roster = Roster.from_rows(gsheet.iter_rows())
+    roster.in_branch("HYUNDAI SHAW")        # (Employee(...), ...)
+    roster.under_grm("grm@example.com")     # the GRM's team
+    roster.find("Juan  DELA CRUZ")          # Employee(...) or None
+    ```
+    """
+    __slots__ = ("employees", "version", "diff", "by_branch", "by_grm_email", "by_sc_email", "by_name")
+
+    def __init__(self, employees: list[Employee], version: str = "", diff: Any = None):
+        self.employees = tuple(employees)
+        self.version = version
+        self.diff = diff
+
+        by_branch: dict[str, list[Employee]] = defaultdict(list)
+        by_grm_email: dict[str, list[Employee]] = defaultdict(list)
+        by_sc_email: dict[str, Employee] = {}
+        by_name: dict[str, Employee] = {}
+        for employee in self.employees:
+            if employee.branch:
+                by_branch[employee.branch.upper()].append(employee)
+            if employee.grm_email_address:
+                by_grm_email[employee.grm_email_address.lower()].append(employee)
+            if employee.sc_email_address:
+                by_sc_email.setdefault(employee.sc_email_address.lower(), employee)
+            if employee.key:
+                by_name.setdefault(employee.key, employee)
+
+        self.by_branch = {branch: tuple(members) for branch, members in by_branch.items()}
+        self.by_grm_email = {email: tuple(members) for email, members in by_grm_email.items()}
+        self.by_sc_email = by_sc_email
+        self.by_name = by_name
+
+    @staticmethod
+    def _without(members: Iterable[Employee], outgoing: Iterable[Employee]) -> list[Employee]:
+        remaining = Counter(outgoing)
+        kept = []
+        for employee in members:
+            if remaining[employee]:
+                remaining[employee] -= 1
+                continue
+            kept.append(employee)
+        return kept
+
+    @classmethod
+    def _patch_groups(
+        cls,
+        index: dict[str, tuple[Employee, ...]],
+        key: Callable[[Employee], str],
+        outgoing: list[Employee],
+        incoming: list[Employee]
+    ) -> dict[str, tuple[Employee, ...]]:
+        index = dict(index)
+        for group in {key(employee) for employee in outgoing + incoming} - {""}:
+            members = cls._without(index.get(group, ()), (e for e in outgoing if key(e) == group))
+            members.extend(e for e in incoming if key(e) == group)
+            if members:
+                index[group] = tuple(members)
+            else:
+                index.pop(group, None)
+        return index
+
+    @staticmethod
+    def _patch_unique(
+        index: dict[str, Employee],
+        key: Callable[[Employee], str],
+        outgoing: list[Employee],
+        incoming: list[Employee],
+        employees: tuple[Employee, ...]
+    ) -> dict[str, Employee]:
+        index = dict(index)
+        vacated = set()
+        for employee in outgoing:
+            if key(employee) and index.get(key(employee)) == employee:
+                del index[key(employee)]
+                vacated.add(key(employee))
+        for employee in incoming:
+            if key(employee):
+                index.setdefault(key(employee), employee)
+        vacated -= index.keys()
+        if vacated:
+            # A duplicate of a removed record may still be on the roster.
+            for employee in employees:
+                if key(employee) in vacated:
+                    index.setdefault(key(employee), employee)
+        return index
+
+    def patched(
+        self,
+        outgoing: list[Employee],
+        incoming: list[Employee],
+        version: str = "",
+        diff: Any = None
+    ) -> "Roster":
+        """A new roster with `outgoing` records replaced by `incoming`, re-indexing only what they touch."""
+        roster = object.__new__(Roster)
+        roster.employees = tuple(self._without(self.employees, outgoing) + list(incoming))
+        roster.version = version
+        roster.diff = diff
+        roster.by_branch = self._patch_groups(self.by_branch, lambda e: e.branch.upper(), outgoing, incoming)
+        roster.by_grm_email = self._patch_groups(
+            self.by_grm_email, lambda e: e.grm_email_address.lower(), outgoing, incoming
+        )
+        roster.by_sc_email = self._patch_unique(
+            self.by_sc_email, lambda e: e.sc_email_address.lower(), outgoing, incoming, roster.employees
+        )
+        roster.by_name = self._patch_unique(self.by_name, lambda e: e.key, outgoing, incoming, roster.employees)
+        return roster
+
+    @staticmethod
+    def fingerprint(employees: Iterable[Employee]) -> str:
+        """Content hash of `employees`; the same rows give the same value in every process."""
+        digest = hashlib.sha1()
+        for employee in employees:
+            digest.update("\x1f".join(astuple(employee)).encode("utf-8") + b"\n")
+        return digest.hexdigest()[:16]
+
+    @staticmethod
+    def read(rows: Iterable[dict]) -> list[Employee]:
+        """Consumes a row stream (e.g. `GSheetService.iter_rows()`) without keeping the raw rows."""
+        return [Employee.from_row(row) for row in rows]
+
+    @classmethod
+    def from_rows(cls, rows: Iterable[dict], version: str = "") -> "Roster":
+        return cls(cls.read(rows), version=version)
+
+    def __iter__(self) -> Iterator[Employee]:
+        return iter(self.employees)
+
+    def __len__(self) -> int:
+        return len(self.employees)
+
+    def in_branch(self, branch: str) -> tuple[Employee, ...]:
+        return self.by_branch.get(branch.strip().upper(), ())
+
+    def under_grm(self, grm_email: str) -> tuple[Employee, ...]:
+        return self.by_grm_email.get(grm_email.strip().lower(), ())
+
+    def by_email(self, sc_email: str) -> Optional[Employee]:
+        return self.by_sc_email.get(sc_email.strip().lower())
+
+    def find(self, name: str) -> Optional[Employee]:
+        """The SC whose full name matches `name` after normalization."""
+        return self.by_name.get(normalize_name(name))
+
+    def branches(self) -> list[str]:
+        return list(self.by_branch)
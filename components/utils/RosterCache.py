@@ -0,0 +1,235 @@
+from components.utils.AsyncGSheetService import AsyncGSheetService
+from components.utils.GSheetService import GSheetService
+from components.utils.RosterSync import RosterDiff, RosterSync
+from components.utils.Roster import Roster
+from concurrent.futures import Future
+from typing import Optional
+import threading
+import asyncio
+import logging
+import time
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class RosterCache:
+    """
+    In-process cache of the email masterlist (as an indexed `Roster`), shared by
+    every roster reader.
+
+    Within `ttl` seconds of the last fetch or check the cached roster is served
+    as is. After that, the sheet's Drive `modifiedTime` is probed: if it hasn't
+    changed the roster is kept for another `ttl`, otherwise (or if the probe
+    fails) the sheet is fetched again. Concurrent callers share one fetch.
+
+    `version` is a content hash of the roster (`Roster.fingerprint`), so anything
+    derived from it (link tables, stored link indexes, ...) can be keyed on it and
+    still matches after a restart.
+
+    With a `sync`, every fetch is diffed against the local snapshot; the new roster
+    is then patched from the previous one (see `Roster.patched`) and `last_diff`
+    says what changed.
+
+    `aget` is the coroutine version for async endpoints: with an `async_gsheet`
+    client the probe and fetch don't hold a thread. Threads and coroutines share
+    one in-flight refresh, so a `get` and an `aget` never fetch at the same time.
+    """
+    def __init__(
+        self,
+        gsheet: GSheetService,
+        ttl: float = 300,
+        revalidate: bool = True,
+        sync: RosterSync = None,
+        async_gsheet: AsyncGSheetService = None
+    ):
+        self.logger = logging.getLogger(__name__)
+        self.gsheet = gsheet
+        self.ttl = ttl
+        self.revalidate = revalidate
+        self.sync = sync
+        self.async_gsheet = async_gsheet
+        self.last_diff: Optional[RosterDiff] = None
+
+        self._roster: Optional[Roster] = None
+        self._modified_time: Optional[str] = None
+        self._checked_at = 0.0
+        self._fetched_at: Optional[float] = None
+        # `_lock` only guards state swaps and is never held across I/O. The refresh
+        # in flight, if any, is `_refresh`; every other caller waits on it.
+        self._lock = threading.Lock()
+        self._refresh: Optional[Future] = None
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.invalidations = 0
+
+    def _probe(self) -> Optional[str]:
+        if not self.revalidate:
+            return None
+        try:
+            return self.gsheet.modified_time()
+        except Exception as e:
+            self.logger.warning(f"Roster modifiedTime probe failed; refetching: {e}")
+            return None
+
+    def _fresh(self) -> Optional[Roster]:
+        with self._lock:
+            if self._roster is not None and time.monotonic() - self._checked_at < self.ttl:
+                self.hits += 1
+                return self._roster
+        return None
+
+    def _revalidated(self, modified_time: Optional[str]) -> Optional[Roster]:
+        """The cached roster if the sheet hasn't changed since it was fetched; counts a miss otherwise."""
+        with self._lock:
+            if self._roster is not None and modified_time and modified_time == self._modified_time:
+                self.hits += 1
+                self.revalidations += 1
+                self._checked_at = time.monotonic()
+                return self._roster
+            self.misses += 1
+        return None
+
+    def _join_or_lead(self) -> tuple[Future, bool]:
+        """The refresh in flight to wait for, or a new one the caller must run (`True`)."""
+        with self._lock:
+            if self._refresh is not None:
+                return self._refresh, False
+            self._refresh = Future()
+            return self._refresh, True
+
+    def _finish_refresh(self, refresh: Future, roster: Roster = None, error: BaseException = None):
+        with self._lock:
+            self._refresh = None
+        if error is None:
+            refresh.set_result(roster)
+        else:
+            # A cancelled leader mustn't look like a cancellation to the callers waiting on it.
+            refresh.set_exception(error if isinstance(error, Exception) else RuntimeError("Roster refresh was cancelled"))
+
+    def _refresh_now(self) -> Roster:
+        roster = self._fresh()
+        if roster is not None:
+            return roster
+        modified_time = self._probe()
+        roster = self._revalidated(modified_time)
+        if roster is not None:
+            return roster
+        self.logger.info("Fetching roster from Google Sheets...")
+        employees = Roster.read(self.gsheet.iter_rows())
+        return self._store(employees, modified_time)
+
+    def get(self) -> Roster:
+        """Returns the roster, fetching the sheet only when it may have changed."""
+        roster = self._fresh()
+        if roster is not None:
+            return roster
+        refresh, leader = self._join_or_lead()
+        if not leader:
+            return refresh.result()
+        try:
+            roster = self._refresh_now()
+        except BaseException as e:
+            self._finish_refresh(refresh, error=e)
+            raise
+        self._finish_refresh(refresh, roster)
+        return roster
+
+    async def _aprobe(self) -> Optional[str]:
+        if not self.revalidate:
+            return None
+        try:
+            return await self.async_gsheet.modified_time()
+        except Exception as e:
+            self.logger.warning(f"Roster modifiedTime probe failed; refetching: {e}")
+            return None
+
+    async def _arefresh_now(self) -> Roster:
+        if self.async_gsheet is None:
+            return await asyncio.to_thread(self._refresh_now)
+        roster = self._fresh()
+        if roster is not None:
+            return roster
+        modified_time = await self._aprobe()
+        roster = self._revalidated(modified_time)
+        if roster is not None:
+            return roster
+        self.logger.info("Fetching roster from Google Sheets...")
+        employees = Roster.read([row async for row in self.async_gsheet.iter_rows()])
+        return await asyncio.to_thread(self._store, employees, modified_time)
+
+    async def aget(self) -> Roster:
+        """`get` without blocking the event loop."""
+        roster = self._fresh()
+        if roster is not None:
+            return roster
+        refresh, leader = self._join_or_lead()
+        if not leader:
+            # Shielded: a cancelled waiter must not cancel the refresh everyone shares.
+            return await asyncio.shield(asyncio.wrap_future(refresh))
+        try:
+            roster = await self._arefresh_now()
+        except BaseException as e:
+            self._finish_refresh(refresh, error=e)
+            raise
+        self._finish_refresh(refresh, roster)
+        return roster
+
+    def _store(self, employees: list, modified_time: Optional[str]) -> Roster:
+        """Builds (and syncs) the new roster outside `_lock`, then swaps it in."""
+        with self._lock:
+            previous = self._roster
+        roster = self._load(employees, Roster.fingerprint(employees), previous)
+        with self._lock:
+            self._roster = roster
+            self._modified_time = modified_time
+            self._checked_at = self._fetched_at = time.monotonic()
+        return roster
+
+    def peek(self) -> Optional[Roster]:
+        """The cached roster if it is still within its TTL, without fetching or probing anything."""
+        with self._lock:
+            if self._roster is not None and time.monotonic() - self._checked_at < self.ttl:
+                return self._roster
+        return None
+
+    def _load(self, employees: list, version: str, previous: Optional[Roster]) -> Roster:
+        if not self.sync:
+            return Roster(employees, version=version)
+        diff = self.sync.sync(employees, version=version)
+        self.last_diff = diff
+        if previous is None or previous.version != diff.base_version:
+            return Roster(employees, version=version, diff=diff)
+        return previous.patched(diff.outgoing, diff.incoming, version=version, diff=diff)
+
+    def invalidate(self):
+        """Marks the cached roster stale; the next `get` fetches the sheet (and syncs it)."""
+        with self._lock:
+            self._checked_at = float("-inf")
+            self._modified_time = None
+            self.invalidations += 1
+        self.logger.info("Roster cache invalidated")
+
+    @property
+    def version(self) -> str:
+        roster = self._roster
+        return roster.version if roster is not None else ""
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "cached": self._roster is not None,
+            "rows": len(self._roster) if self._roster is not None else 0,
+            "version": self.version,
+            "modified_time": self._modified_time,
+            "age": round(time.monotonic() - self._fetched_at, 1) if self._fetched_at else None,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "revalidations": self.revalidations,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else None
+        }
@@ -0,0 +1,193 @@
+from components.utils.Roster import Employee
+from dataclasses import asdict, astuple, dataclass, field, fields
+from typing import Iterator, Optional
+from contextlib import contextmanager
+import hashlib
+import logging
+import sqlite3
+import time
+import json
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+@dataclass
+class RosterDiff:
+    """What changed in the masterlist between two syncs (`base_version` -> `version`)."""
+    base_version: str
+    version: str
+    added: list[Employee] = field(default_factory=list)
+    removed: list[Employee] = field(default_factory=list)
+    changed: list[tuple[Employee, Employee]] = field(default_factory=list)
+    initial: bool = False
+    synced_at: float = field(default_factory=time.time)
+
+    @property
+    def empty(self) -> bool:
+        return not (self.added or self.removed or self.changed)
+
+    @property
+    def outgoing(self) -> list[Employee]:
+        """Records to drop from anything derived from the previous roster."""
+        return self.removed + [before for before, _ in self.changed]
+
+    @property
+    def incoming(self) -> list[Employee]:
+        """Records to add to anything derived from the previous roster."""
+        return self.added + [after for _, after in self.changed]
+
+    def to_dict(self) -> dict:
+        return {
+            "base_version": self.base_version,
+            "version": self.version,
+            "initial": self.initial,
+            "synced_at": self.synced_at,
+            "counts": {"added": len(self.added), "removed": len(self.removed), "changed": len(self.changed)},
+            "added": [asdict(employee) for employee in self.added],
+            "removed": [asdict(employee) for employee in self.removed],
+            "changed": [
+                {
+                    "before": asdict(before),
+                    "after": asdict(after),
+                    "fields": [f.name for f in fields(Employee) if getattr(before, f.name) != getattr(after, f.name)]
+                }
+                for before, after in self.changed
+            ]
+        }
+
+class RosterSync:
+    """
+    Local snapshot of the masterlist, one hashed row per employee.
+
+    Each `sync` compares a freshly read roster with the snapshot, stores the new
+    rows and returns the `RosterDiff`. Employees are matched by SC email (or
+    normalized name when the email is blank), so an edited row shows up as
+    `changed` rather than as a removal plus an addition. The last `keep` diffs are
+    kept for `history`.
+    """
+    def __init__(self, path: str, keep: int = 50):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.keep = keep
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS roster_rows (
+                    row_key TEXT PRIMARY KEY,
+                    row_hash TEXT NOT NULL,
+                    data TEXT NOT NULL
+                )
+                """
+            )
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS roster_syncs (
+                    id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    base_version TEXT NOT NULL,
+                    version TEXT NOT NULL,
+                    synced_at REAL NOT NULL,
+                    added INTEGER NOT NULL,
+                    removed INTEGER NOT NULL,
+                    changed INTEGER NOT NULL,
+                    diff TEXT NOT NULL
+                )
+                """
+            )
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def row_hash(employee: Employee) -> str:
+        return hashlib.sha1("\x1f".join(astuple(employee)).encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def row_keys(employees: list[Employee]) -> list[str]:
+        """Stable per-employee keys; repeated rows get `#2`, `#3`, ... suffixes."""
+        keys, seen = [], {}
+        for employee in employees:
+            key = employee.sc_email_address.lower() or employee.key
+            seen[key] = seen.get(key, 0) + 1
+            keys.append(key if seen[key] == 1 else f"{key}#{seen[key]}")
+        return keys
+
+    def sync(self, employees: list[Employee], version: str = "") -> RosterDiff:
+        """Diffs `employees` against the snapshot, then makes them the new snapshot."""
+        current = dict(zip(self.row_keys(employees), employees))
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            previous = {
+                row["row_key"]: (row["row_hash"], row["data"])
+                for row in conn.execute("SELECT row_key, row_hash, data FROM roster_rows")
+            }
+            last = conn.execute("SELECT version FROM roster_syncs ORDER BY id DESC LIMIT 1").fetchone()
+            diff = RosterDiff(base_version=last["version"] if last else "", version=version, initial=not previous)
+
+            upserts = []
+            for key, employee in current.items():
+                row_hash = self.row_hash(employee)
+                if key not in previous:
+                    diff.added.append(employee)
+                elif previous[key][0] != row_hash:
+                    diff.changed.append((Employee(**json.loads(previous[key][1])), employee))
+                else:
+                    continue
+                upserts.append((key, row_hash, json.dumps(asdict(employee))))
+            removed_keys = [key for key in previous if key not in current]
+            diff.removed = [Employee(**json.loads(previous[key][1])) for key in removed_keys]
+
+            conn.executemany(
+                """
+                INSERT INTO roster_rows (row_key, row_hash, data) VALUES (?, ?, ?)
+                ON CONFLICT (row_key) DO UPDATE SET row_hash = excluded.row_hash, data = excluded.data
+                """,
+                upserts
+            )
+            conn.executemany("DELETE FROM roster_rows WHERE row_key = ?", [(key,) for key in removed_keys])
+            conn.execute(
+                """
+                INSERT INTO roster_syncs (base_version, version, synced_at, added, removed, changed, diff)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    diff.base_version, version, diff.synced_at, len(diff.added), len(diff.removed),
+                    len(diff.changed), json.dumps(diff.to_dict())
+                )
+            )
+            conn.execute(
+                "DELETE FROM roster_syncs WHERE id NOT IN (SELECT id FROM roster_syncs ORDER BY id DESC LIMIT ?)",
+                (self.keep,)
+            )
+        self.logger.info(
+            f"Roster synced: {len(diff.added)} added, {len(diff.removed)} removed, {len(diff.changed)} changed"
+        )
+        return diff
+
+    def last_diff(self) -> Optional[dict]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT diff FROM roster_syncs ORDER BY id DESC LIMIT 1").fetchone()
+        return json.loads(row["diff"]) if row else None
+
+    def history(self, limit: int = 20) -> list[dict]:
+        with self._connect() as conn:
+            rows = conn.execute(
+                """
+                SELECT base_version, version, synced_at, added, removed, changed
+                FROM roster_syncs ORDER BY id DESC LIMIT ?
+                """,
+                (limit,)
+            ).fetchall()
+        return [dict(row) for row in rows]
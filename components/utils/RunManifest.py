@@ -0,0 +1,157 @@
+from components.utils.Database import Database
+from components.storage import ObjectStore
+from datetime import datetime, timezone
+from typing import Literal, Optional
+import hashlib
+import logging
+import os
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+RerunMode = Literal["missing", "only-failed", "force"]
+
+class RunManifest:
+    """
+    Record of every report card a run has produced, keyed by
+    `(dept, branch, employee, year, month)`, in a SQLite file or, for workers on
+    several hosts, a PostgreSQL database (`path` is then a DSN, see `Database`).
+
+    A rerun only redoes what is not provably done: an entry counts as complete
+    when its status is `success` and the stored PDF still has the recorded
+    size and SHA-256. With an `ObjectStore`, `path` is the object key and the
+    check uses the store's metadata; otherwise `path` is a file on disk.
+
+    - `missing` (default): everything not complete
+    - `only-failed`: only entries recorded as `failed`/`timeout`
+    - `force`: everything
+    """
+    FAILED_STATUSES = ("failed", "timeout")
+
+    def __init__(self, path: str, store: ObjectStore = None):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.store = store
+        self.db = Database(path)
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS report_cards (
+                    dept TEXT NOT NULL,
+                    branch TEXT NOT NULL,
+                    employee TEXT NOT NULL,
+                    year INTEGER NOT NULL,
+                    month INTEGER NOT NULL,
+                    status TEXT NOT NULL,
+                    path TEXT,
+                    size INTEGER,
+                    checksum TEXT,
+                    duration DOUBLE PRECISION,
+                    error TEXT,
+                    updated_at TEXT NOT NULL,
+                    PRIMARY KEY (dept, branch, employee, year, month)
+                )
+                """
+            )
+
+    @staticmethod
+    def checksum(path: str) -> str:
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for chunk in iter(lambda: f.read(1024 * 1024), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def get(self, dept: str, branch: str, employee: str, year: int, month: int) -> Optional[dict]:
+        with self.db.transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM report_cards WHERE dept = ? AND branch = ? AND employee = ? AND year = ? AND month = ?",
+                (dept, branch, employee, year, month)
+            ).fetchone()
+        return dict(row) if row else None
+
+    def entries(self, dept: str, year: int, month: int) -> list[dict]:
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                "SELECT * FROM report_cards WHERE dept = ? AND year = ? AND month = ? ORDER BY branch, employee",
+                (dept, year, month)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def is_complete(self, entry: Optional[dict]) -> bool:
+        if not entry or entry["status"] != "success" or not entry["path"]:
+            return False
+        if self.store:
+            stored = self.store.head(entry["path"])
+            return bool(stored) and stored["size"] == entry["size"] and stored["checksum"] == entry["checksum"]
+        try:
+            if os.path.getsize(entry["path"]) != entry["size"]:
+                return False
+            return self.checksum(entry["path"]) == entry["checksum"]
+        except OSError:
+            return False
+
+    def select(
+        self,
+        links: dict[str, dict],
+        dept: str,
+        year: int,
+        month: int,
+        rerun: RerunMode = "missing"
+    ) -> tuple[dict[str, dict], dict[str, dict]]:
+        """Splits `links` into `(to_render, skipped)` according to `rerun`."""
+        if rerun == "force":
+            return dict(links), {}
+
+        to_render: dict[str, dict] = {}
+        skipped: dict[str, dict] = {}
+        for name, data in links.items():
+            entry = self.get(dept, data["branch"] or "Unassigned", name, year, month)
+            if rerun == "only-failed":
+                selected = bool(entry) and entry["status"] in self.FAILED_STATUSES
+            else:
+                selected = not self.is_complete(entry)
+            if selected:
+                to_render[name] = data
+            else:
+                skipped[name] = data
+        self.logger.info(f"Manifest ({rerun}): {len(to_render)} to render, {len(skipped)} skipped")
+        return to_render, skipped
+
+    def record(self, dept: str, year: int, month: int, result: dict):
+        """Upserts the entry for one result returned by `components.run`."""
+        size = result.get("size")
+        checksum = result.get("checksum")
+        status = result["status"]
+        if status == "success" and not checksum:
+            try:
+                size = os.path.getsize(result["path"])
+                checksum = self.checksum(result["path"])
+            except OSError as e:
+                status = "failed"
+                result = {**result, "error": f"Downloaded file unreadable: {e}"}
+
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                INSERT INTO report_cards
+                    (dept, branch, employee, year, month, status, path, size, checksum, duration, error, updated_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (dept, branch, employee, year, month) DO UPDATE SET
+                    status = excluded.status,
+                    path = excluded.path,
+                    size = excluded.size,
+                    checksum = excluded.checksum,
+                    duration = excluded.duration,
+                    error = excluded.error,
+                    updated_at = excluded.updated_at
+                """,
+                (
+                    dept, result["branch"] or "Unassigned", result["employee"], year, month,
+                    status, result.get("path"), size, checksum,
+                    result.get("duration"), result.get("error"),
+                    datetime.now(timezone.utc).isoformat()
+                )
+            )
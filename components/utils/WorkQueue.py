@@ -0,0 +1,176 @@
+from components.utils.Database import Database
+from typing import Optional
+import logging
+import time
+import json
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(levelname)s - %(message)s'
+)
+
+class WorkQueue:
+    """
+    Lease-based work queue shared by report-card worker processes.
+
+    Items are keyed by `(run_id, item_key)`. A worker `claim`s an item for
+    `lease_seconds` and must `heartbeat` before the lease runs out; an item
+    whose lease expired (crashed or stuck worker) is handed to the next
+    claimer. An item is retried until it has been claimed `max_attempts` times.
+
+    Item status goes `pending -> leased -> done | failed`, or `cancelled` for
+    items still pending when the run is cancelled.
+
+    `path` is a SQLite file, for workers on one host, or a `postgresql://` DSN
+    for workers on several (see `Database`). On PostgreSQL concurrent claims
+    skip each other's locked rows (`FOR UPDATE SKIP LOCKED`); a SQLite file
+    must stay on a local disk, as its locking isn't reliable over NFS.
+    """
+    def __init__(self, path: str, max_attempts: int = 3):
+        self.logger = logging.getLogger(__name__)
+        self.path = path
+        self.max_attempts = max_attempts
+        self.db = Database(path)
+        with self.db.transaction() as conn:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS work_items (
+                    run_id TEXT NOT NULL,
+                    item_key TEXT NOT NULL,
+                    payload TEXT NOT NULL,
+                    status TEXT NOT NULL DEFAULT 'pending',
+                    lease_owner TEXT,
+                    lease_expires DOUBLE PRECISION,
+                    attempts INTEGER NOT NULL DEFAULT 0,
+                    result TEXT,
+                    error TEXT,
+                    updated_at DOUBLE PRECISION NOT NULL,
+                    PRIMARY KEY (run_id, item_key)
+                )
+                """
+            )
+
+    @staticmethod
+    def _to_dict(row) -> dict:
+        item = dict(row)
+        item["payload"] = json.loads(item["payload"])
+        item["result"] = json.loads(item["result"]) if item["result"] else None
+        return item
+
+    def enqueue(self, run_id: str, items: dict[str, dict]) -> int:
+        """Adds `{item_key: payload}` to the run; keys already queued are left alone."""
+        now = time.time()
+        with self.db.transaction() as conn:
+            cursor = conn.executemany(
+                """
+                INSERT INTO work_items (run_id, item_key, payload, updated_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (run_id, item_key) DO NOTHING
+                """,
+                [(run_id, key, json.dumps(payload), now) for key, payload in items.items()]
+            )
+        return cursor.rowcount
+
+    def claim(self, run_id: str, worker_id: str, lease_seconds: float = 300) -> Optional[dict]:
+        """Leases the next pending or expired item to `worker_id`, or returns `None` if there is none."""
+        now = time.time()
+        with self.db.transaction(immediate=True) as conn:
+            # Expired leases that already used up their attempts are given up on.
+            conn.execute(
+                """
+                UPDATE work_items SET status = 'failed', lease_owner = NULL, updated_at = ?,
+                    error = COALESCE(error, 'Lease expired')
+                WHERE run_id = ? AND status = 'leased' AND lease_expires < ? AND attempts >= ?
+                """,
+                (now, run_id, now, self.max_attempts)
+            )
+            row = conn.execute(
+                f"""
+                SELECT item_key FROM work_items
+                WHERE run_id = ?
+                  AND (status = 'pending' OR (status = 'leased' AND lease_expires < ?))
+                ORDER BY attempts, updated_at
+                LIMIT 1{self.db.skip_locked}
+                """,
+                (run_id, now)
+            ).fetchone()
+            if not row:
+                return None
+            conn.execute(
+                """
+                UPDATE work_items
+                SET status = 'leased', lease_owner = ?, lease_expires = ?, attempts = attempts + 1, updated_at = ?
+                WHERE run_id = ? AND item_key = ?
+                """,
+                (worker_id, now + lease_seconds, now, run_id, row["item_key"])
+            )
+            item = conn.execute(
+                "SELECT * FROM work_items WHERE run_id = ? AND item_key = ?",
+                (run_id, row["item_key"])
+            ).fetchone()
+        return self._to_dict(item)
+
+    def heartbeat(self, run_id: str, item_key: str, worker_id: str, lease_seconds: float = 300) -> bool:
+        """Extends the lease. Returns `False` if the worker no longer owns the item."""
+        now = time.time()
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE work_items SET lease_expires = ?, updated_at = ?
+                WHERE run_id = ? AND item_key = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                (now + lease_seconds, now, run_id, item_key, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, run_id: str, item_key: str, worker_id: str, result: dict) -> bool:
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE work_items SET status = 'done', result = ?, error = NULL, lease_owner = NULL, updated_at = ?
+                WHERE run_id = ? AND item_key = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                (json.dumps(result), time.time(), run_id, item_key, worker_id)
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, run_id: str, item_key: str, worker_id: str, error: str, result: dict = None) -> bool:
+        """Releases the item for a retry, or marks it `failed` once it is out of attempts."""
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                """
+                UPDATE work_items
+                SET status = CASE WHEN attempts >= ? THEN 'failed' ELSE 'pending' END,
+                    result = ?, error = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE run_id = ? AND item_key = ? AND status = 'leased' AND lease_owner = ?
+                """,
+                (
+                    self.max_attempts, json.dumps(result) if result else None, error, time.time(),
+                    run_id, item_key, worker_id
+                )
+            )
+        return cursor.rowcount == 1
+
+    def cancel_pending(self, run_id: str) -> int:
+        with self.db.transaction() as conn:
+            cursor = conn.execute(
+                "UPDATE work_items SET status = 'cancelled', updated_at = ? WHERE run_id = ? AND status = 'pending'",
+                (time.time(), run_id)
+            )
+        return cursor.rowcount
+
+    def counts(self, run_id: str) -> dict[str, int]:
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                "SELECT status, COUNT(*) AS total FROM work_items WHERE run_id = ? GROUP BY status",
+                (run_id,)
+            ).fetchall()
+        return {row["status"]: row["total"] for row in rows}
+
+    def items(self, run_id: str) -> list[dict]:
+        with self.db.transaction() as conn:
+            rows = conn.execute(
+                "SELECT * FROM work_items WHERE run_id = ? ORDER BY item_key",
+                (run_id,)
+            ).fetchall()
+        return [self._to_dict(row) for row in rows]
@@ -1,9 +1,52 @@
+from components.utils.AsyncGoogleClient import AsyncGoogleClient, GoogleAPIError
+from components.utils.AsyncGSheetService import AsyncGSheetService
+from components.utils.AsyncGmailService import AsyncGmailService
+from components.utils.AuthorizedHttpPool import AuthorizedHttpPool
+from components.utils.CredentialManager import CredentialManager, CredentialsUnavailable
+from components.utils.Database import Database
 from components.utils.GoogleService import GoogleServiceFactory
 from components.utils.GSheetService import GSheetService
-from components.utils.GmailService import GmailService
+from components.utils.EmailOutbox import EmailOutbox, OutboxDispatcher
+from components.utils.GmailSendEngine import GmailSendEngine, TokenBucket
+from components.utils.GmailService import Attachment, GmailService, MessageBuilder, MessageUnavailable
+from components.utils.JobQueue import JobQueue, JobStore
+from components.utils.NameMatcher import MatchReport, NameMatch, NameMatcher
+from components.utils.Roster import Employee, Roster, normalize_name
+from components.utils.RosterCache import RosterCache
+from components.utils.RosterSync import RosterDiff, RosterSync
+from components.utils.RunManifest import RunManifest
+from components.utils.WorkQueue import WorkQueue
 
 __all__ = [
+    "AsyncGSheetService",
+    "AsyncGmailService",
+    "AsyncGoogleClient",
+    "Attachment",
+    "AuthorizedHttpPool",
+    "CredentialManager",
+    "CredentialsUnavailable",
+    "Database",
+    "Employee",
+    "GoogleAPIError",
     "GoogleServiceFactory",
+    "OutboxDispatcher",
+    "EmailOutbox",
     "GSheetService",
-    "GmailService"
+    "GmailSendEngine",
+    "GmailService",
+    "JobQueue",
+    "JobStore",
+    "MessageBuilder",
+    "MessageUnavailable",
+    "MatchReport",
+    "NameMatch",
+    "NameMatcher",
+    "Roster",
+    "RosterCache",
+    "RosterDiff",
+    "RosterSync",
+    "RunManifest",
+    "TokenBucket",
+    "WorkQueue",
+    "normalize_name"
 ]
\ No newline at end of file
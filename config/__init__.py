@@ -1,5 +1,27 @@
 from config.config import (
+    LOOKER_SESSION_MAX_AGE,
+    LOOKER_REQUEST_PROFILE,
+    LOOKER_REQUEST_AUDIT,
+    LOOKER_SESSION_FILE,
+    REPORT_CARD_STORAGE,
+    LOOKER_CACHE_DIR,
+    RUN_MANIFEST_FILE,
+    WORK_QUEUE_FILE,
+    GMAIL_API_ENDPOINT,
+    GMAIL_QUOTA_PER_SECOND,
+    GMAIL_UPLOAD_THRESHOLD,
+    GMAIL_SEND_WORKERS,
+    GMAIL_BATCH_SIZE,
     GMAIL_TOKEN_FILE,
+    GOOGLE_HTTP_POOL_SIZE,
+    ASYNC_HTTP_MAX_CONNECTIONS,
+    ROSTER_SNAPSHOT_FILE,
+    LINK_INDEX_FILE,
+    ROSTER_CACHE_TTL,
+    SHEETS_CHUNK_ROWS,
+    EMAIL_OUTBOX_FILE,
+    JOB_STORE_FILE,
+    JOB_WORKERS,
     SERVICE_FILE,
     GRM_BASE_URL,
     SC_BASE_URL,
@@ -10,7 +32,29 @@ from config.config import (
 )
 
 __all__ = [
+    "LOOKER_SESSION_MAX_AGE",
+    "LOOKER_REQUEST_PROFILE",
+    "LOOKER_REQUEST_AUDIT",
+    "LOOKER_SESSION_FILE",
+    "REPORT_CARD_STORAGE",
+    "LOOKER_CACHE_DIR",
+    "RUN_MANIFEST_FILE",
+    "WORK_QUEUE_FILE",
+    "GMAIL_API_ENDPOINT",
+    "GMAIL_QUOTA_PER_SECOND",
+    "GMAIL_UPLOAD_THRESHOLD",
+    "GMAIL_SEND_WORKERS",
+    "GMAIL_BATCH_SIZE",
     "GMAIL_TOKEN_FILE",
+    "GOOGLE_HTTP_POOL_SIZE",
+    "ASYNC_HTTP_MAX_CONNECTIONS",
+    "ROSTER_SNAPSHOT_FILE",
+    "LINK_INDEX_FILE",
+    "ROSTER_CACHE_TTL",
+    "SHEETS_CHUNK_ROWS",
+    "EMAIL_OUTBOX_FILE",
+    "JOB_STORE_FILE",
+    "JOB_WORKERS",
     "SERVICE_FILE",
     "GRM_BASE_URL",
     "SC_BASE_URL",
@@ -9,8 +9,21 @@ class Spreadsheet:
     id: str
     range: str
 
+@dataclass(frozen=True)
+class ObjectStorage:
+    backend: str
+    root: str
+    bucket: str
+    prefix: str
+    endpoint_url: str
+    region: str = None
+    # Unset: boto3 falls back to its own credential chain (env, profile, instance role).
+    access_key_id: str = None
+    secret_access_key: str = None
+
 class Sheets:
-    EMAIL_MASTERLIST = Spreadsheet(os.getenv("EMAIL_MASTERLIST_ID"), "Sheet1!A1:G136")
+    # Tab name only: the used range is read from the sheet metadata.
+    EMAIL_MASTERLIST = Spreadsheet(os.getenv("EMAIL_MASTERLIST_ID"), os.getenv("EMAIL_MASTERLIST_TAB", "Sheet1"))
 
 SC_BASE_URL = os.getenv("SC_LOOKER_STUDIO_URL")
 GRM_BASE_URL = os.getenv("GRM_LOOKER_STUDIO_URL")
@@ -18,6 +31,42 @@ GRM_BASE_URL = os.getenv("GRM_LOOKER_STUDIO_URL")
 SERVICE_FILE = os.getenv("LICA_HR_SERVICE_ACCOUNT_FILE")
 OAUTH_FILE = os.getenv("LICA_HR_OAUTH_FILE")
 GMAIL_TOKEN_FILE = os.getenv("GMAIL_TOKEN_FILE")
+GOOGLE_HTTP_POOL_SIZE = int(os.getenv("GOOGLE_HTTP_POOL_SIZE", "8"))
+ASYNC_HTTP_MAX_CONNECTIONS = int(os.getenv("ASYNC_HTTP_MAX_CONNECTIONS", "100"))
+ROSTER_CACHE_TTL = float(os.getenv("ROSTER_CACHE_TTL", "300"))
+ROSTER_SNAPSHOT_FILE = os.getenv("ROSTER_SNAPSHOT_FILE", "./tmp/roster_snapshot.sqlite3")
+LINK_INDEX_FILE = os.getenv("LINK_INDEX_FILE", "./tmp/link_index.sqlite3")
+SHEETS_CHUNK_ROWS = int(os.getenv("SHEETS_CHUNK_ROWS", "1000"))
+GMAIL_API_ENDPOINT = os.getenv("GMAIL_API_ENDPOINT")
+GMAIL_BATCH_SIZE = int(os.getenv("GMAIL_BATCH_SIZE", "25"))
+GMAIL_UPLOAD_THRESHOLD = int(os.getenv("GMAIL_UPLOAD_THRESHOLD", str(1024 * 1024)))
+GMAIL_SEND_WORKERS = int(os.getenv("GMAIL_SEND_WORKERS", "4"))
+GMAIL_QUOTA_PER_SECOND = float(os.getenv("GMAIL_QUOTA_PER_SECOND", "250"))
+
+REPORT_CARD_STORAGE = ObjectStorage(
+    backend=os.getenv("REPORT_CARD_STORE", "local"),
+    root=os.getenv("REPORT_CARD_DIR", "./tmp/report_cards"),
+    bucket=os.getenv("REPORT_CARD_BUCKET"),
+    prefix=os.getenv("REPORT_CARD_PREFIX", ""),
+    endpoint_url=os.getenv("REPORT_CARD_STORE_ENDPOINT"),
+    region=os.getenv("REPORT_CARD_STORE_REGION"),
+    access_key_id=os.getenv("REPORT_CARD_STORE_ACCESS_KEY_ID"),
+    secret_access_key=os.getenv("REPORT_CARD_STORE_SECRET_ACCESS_KEY")
+)
+
+LOOKER_SESSION_FILE = os.getenv("LOOKER_SESSION_FILE", "./tmp/looker/session_state.json")
+LOOKER_CACHE_DIR = os.getenv("LOOKER_CACHE_DIR", "./tmp/looker/cache")
+LOOKER_SESSION_MAX_AGE = float(os.getenv("LOOKER_SESSION_MAX_AGE", str(12 * 3600)))
+LOOKER_REQUEST_PROFILE = os.getenv("LOOKER_REQUEST_PROFILE", "safe")
+# Let blocked requests through and measure them, so `bytes_saved` gets real figures (unknown until measured).
+LOOKER_REQUEST_AUDIT = os.getenv("LOOKER_REQUEST_AUDIT", "false").lower() in ("1", "true", "yes")
+
+# Run manifest, work queue and job store: SQLite files, or a postgresql:// DSN shared by workers on several hosts (see `Database`).
+RUN_MANIFEST_FILE = os.getenv("RUN_MANIFEST_FILE", "./tmp/run_manifest.sqlite3")
+WORK_QUEUE_FILE = os.getenv("WORK_QUEUE_FILE", "./tmp/work_queue.sqlite3")
+JOB_STORE_FILE = os.getenv("JOB_STORE_FILE", "./tmp/jobs.sqlite3")
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+EMAIL_OUTBOX_FILE = os.getenv("EMAIL_OUTBOX_FILE", "./tmp/email_outbox.sqlite3")
 
 TEST_EMAIL1 = os.getenv("TEST_EMAIL1")
 TEST_EMAIL2 = os.getenv("TEST_EMAIL2")
\ No newline at end of file
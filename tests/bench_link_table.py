@@ -0,0 +1,109 @@
+"""
+Link table of a 10k-employee roster: `build_links`/`LinkTable` against the round
+trip they replaced, inlined below as the baseline (a `LookerStudioURLBuilder`
+per employee, names parsed back out of the URLs, branches looked up by name).
+
+    python -m tests.bench_link_table --employees 10000
+"""
+from components.looker.LookerStudioURLBuilder import LookerStudioURLBuilder
+from components.looker.LinkTable import LinkTable, build_links
+from components.utils.Roster import Employee, Roster
+from components.utils.RosterSync import RosterDiff
+from urllib.parse import parse_qs, unquote, urlparse
+from collections import defaultdict
+from dataclasses import replace
+import argparse
+import logging
+import time
+import json
+
+BASE_URL = "https://lookerstudio.google.com/reporting/abc/page/p_1"
+YEAR, MONTH = 2025, 7
+
+def roster_of(count: int) -> Roster:
+    return Roster([
+        Employee(
+            sc_firstname=f"Employee{index}",
+            sc_lastname=f"Surname{index % 97}",
+            sc_email_address=f"employee{index}@example.com",
+            grm_name=f"GRM {index % 150}",
+            grm_email_address=f"grm{index % 150}@example.com",
+            branch=f"BRANCH {index % 6}"
+        )
+        for index in range(count)
+    ], version="1")
+
+def baseline(roster: Roster) -> dict[str, dict]:
+    """The pre-`LinkTable` path: `generate_looker_urls` + `parse_employee_names` + `branch_of`."""
+    grouped = defaultdict(list)
+    for emp in roster:
+        grouped[emp.grm_email_address].append(emp)
+    looker_urls = []
+    for _, employees in grouped.items():
+        for emp in employees:
+            emp_name = f"{emp.sc_firstname} {emp.sc_lastname}"
+            url = LookerStudioURLBuilder(
+                base_url=BASE_URL,
+                year=YEAR,
+                month=MONTH,
+                employee_name=emp_name.upper(),
+                lang="en"
+            ).get_looker_url()
+            looker_urls.append(url)
+    names = []
+    for url in looker_urls:
+        parsed = parse_qs(urlparse(url).query)
+        params_encoded = parsed["params"][0]
+        params_decoded = unquote(params_encoded)
+        params_dict = json.loads(params_decoded)
+        names.append(params_dict["ds0.sc_employee_name"])
+
+    def branch_of(employee: str) -> str:
+        match = roster.find(employee)
+        return match.branch if match and match.branch else "Unassigned"
+
+    return {name: {"url": url, "branch": branch_of(name)} for name, url in zip(names, looker_urls)}
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--employees", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    logging.disable(logging.INFO)
+
+    roster = roster_of(args.employees)
+    links = build_links(BASE_URL, YEAR, MONTH, roster)
+    # Same table both ways.
+    assert {name: {"url": link.url, "branch": link.branch} for name, link in links.items()} == baseline(roster)
+
+    changed = list(roster)[:10]
+    diff = RosterDiff("1", "2", changed=[(employee, replace(employee, branch="MOVED")) for employee in changed])
+    patched = roster.patched(diff.outgoing, diff.incoming, version="2", diff=diff)
+
+    def table_with_version_1() -> LinkTable:
+        table = LinkTable()
+        table.get(BASE_URL, YEAR, MONTH, roster)
+        return table
+
+    warm = table_with_version_1()
+    cases = [
+        ("baseline round trip", lambda: None, lambda _: baseline(roster)),
+        ("build_links", lambda: None, lambda _: build_links(BASE_URL, YEAR, MONTH, roster)),
+        ("LinkTable patch (10 changed)", table_with_version_1, lambda table: table.get(BASE_URL, YEAR, MONTH, patched)),
+        ("LinkTable hit", lambda: warm, lambda table: table.get(BASE_URL, YEAR, MONTH, roster))
+    ]
+    print(f"{args.employees} employees, best of {args.repeat}")
+    reference = None
+    for label, setup, case in cases:
+        timings = []
+        for _ in range(args.repeat):
+            state = setup()
+            started = time.perf_counter()
+            case(state)
+            timings.append(time.perf_counter() - started)
+        best = min(timings)
+        reference = reference or best
+        print(f"{label:<30} {best * 1000:>9.3f} ms {reference / best:>10.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Load test of `POST /send/send-grm-email` with `--clients` concurrent clients:
+the `concurrent` strategy (`GmailService` on worker threads) against `async`
+(`AsyncGmailService` on the event loop). Requests go through httpx to the ASGI
+app in-process; Gmail is stubbed on both transports and answers every call
+after `--latency` seconds. Every request sends to a new period, so each one
+reaches Gmail.
+
+    python -m tests.bench_send_load --clients 200 --requests 5
+"""
+from components.utils import EmailOutbox, Employee, GmailSendEngine, OutboxDispatcher, Roster
+from components.utils.AsyncGmailService import AsyncGmailService
+from components.utils.AuthorizedHttpPool import AuthorizedHttpPool
+from components.utils.CredentialManager import CredentialManager
+from components.utils.GmailService import GmailService
+from app.dependencies import get_outbox_dispatcher, get_roster_cache
+from google_auth_httplib2 import AuthorizedHttp
+from tests.fakes import FakeCredentials, StubHttp
+from app.routes import send_email
+from app.app import app
+import statistics
+import itertools
+import argparse
+import tempfile
+import asyncio
+import logging
+import httpx
+import json
+import time
+import os
+
+GRM_EMAIL = "grm@example.com"
+ROSTER = Roster([
+    Employee("Juan", "Dela Cruz", "juan@example.com", "Pedro Reyes", GRM_EMAIL, "TEST BRANCH"),
+    Employee("Maria", "Santos", "maria@example.com", "Pedro Reyes", GRM_EMAIL, "TEST BRANCH")
+], version="1")
+
+class FakeRosterCache:
+    async def aget(self) -> Roster:
+        return ROSTER
+
+def dispatcher_for(path: str, latency: float, clients: int) -> OutboxDispatcher:
+    ids = itertools.count()
+
+    def answer(method, uri, headers, body):
+        time.sleep(latency)
+        payload = {"emailAddress": "me@example.com"} if "/profile" in uri else {"id": f"msg-{next(ids)}"}
+        return 200, {"content-type": "application/json"}, json.dumps(payload).encode()
+
+    async def answer_async(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(latency)
+        return httpx.Response(200, json={"id": f"msg-{next(ids)}"})
+
+    AuthorizedHttpPool._new_http = lambda pool: AuthorizedHttp(pool.credentials, http=StubHttp(answer))
+    gmail = GmailService(
+        credential_manager=CredentialManager(FakeCredentials()),
+        api_endpoint="https://gmail.test",
+        pool_size=clients
+    )
+    async_gmail = AsyncGmailService(
+        CredentialManager(FakeCredentials()),
+        sender_email="me@example.com",
+        api_endpoint="https://gmail.test",
+        max_connections=clients
+    )
+    async_gmail._client = httpx.AsyncClient(transport=httpx.MockTransport(answer_async))
+    # No quota pacing: the point is what the server can push, not Gmail's limit.
+    engine = GmailSendEngine(gmail, workers=1, quota_per_second=1e9, async_gmail=async_gmail, async_concurrency=clients)
+    return OutboxDispatcher(EmailOutbox(path), gmail, engine=engine)
+
+async def load(strategy: str, clients: int, requests: int) -> dict:
+    periods = itertools.count()
+    latencies: list[float] = []
+    errors = 0
+
+    async def client(http: httpx.AsyncClient):
+        nonlocal errors
+        for _ in range(requests):
+            period = next(periods)
+            started = time.perf_counter()
+            response = await http.post(
+                "/send/send-grm-email",
+                params={"year": 2000 + period // 12, "month": 2 + period % 12, "grm_email": GRM_EMAIL, "strategy": strategy},
+                json={"branch": "TEST BRANCH", "recipient_type": "GRM"}
+            )
+            latencies.append(time.perf_counter() - started)
+            errors += response.status_code != 200 or not response.json()["content"]["sent"]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://app", timeout=None) as http:
+        started = time.perf_counter()
+        await asyncio.gather(*(client(http) for _ in range(clients)))
+        duration = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "errors": errors,
+        "rps": len(latencies) / duration,
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--requests", type=int, default=5, help="Requests per client")
+    parser.add_argument("--latency", type=float, default=0.1, help="Seconds Gmail takes to answer")
+    args = parser.parse_args()
+    logging.disable(logging.ERROR)
+    send_email.SC_BASE_URL = "https://looker.test/sc"
+
+    print(f"{args.clients} clients x {args.requests} requests, Gmail latency {args.latency * 1000:.0f} ms")
+    print(f"{'strategy':<11} {'requests':>8} {'errors':>6} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8}")
+    for strategy, label in (("concurrent", "sync"), ("async", "async")):
+        with tempfile.TemporaryDirectory() as directory:
+            dispatcher = dispatcher_for(os.path.join(directory, "outbox.sqlite3"), args.latency, args.clients)
+            app.dependency_overrides[get_roster_cache] = FakeRosterCache
+            app.dependency_overrides[get_outbox_dispatcher] = lambda: dispatcher
+            result = asyncio.run(load(strategy, args.clients, args.requests))
+            app.dependency_overrides.clear()
+        print(
+            f"{label:<11} {result['requests']:>8} {result['errors']:>6} {result['rps']:>8.1f} "
+            f"{result['p50'] * 1000:>8.0f} {result['p99'] * 1000:>8.0f}"
+        )
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Peak memory of `AsyncGmailService.send_email` with 5 MB attachments: the inline
+`raw` path, which builds the whole message in memory, against the resumable
+upload, which holds about one chunk. Each case runs in a fresh process, so its
+peak RSS is its own.
+
+    python -m tests.bench_upload_memory
+"""
+from components.utils.GmailService import Attachment
+from tests.test_async_gmail_service import FakeUploadSession, send, service_for
+from concurrent.futures import ProcessPoolExecutor
+import multiprocessing
+import tracemalloc
+import resource
+import logging
+import tempfile
+import httpx
+import os
+
+ATTACHMENT_SIZE = 5 * 1024 * 1024
+
+def measure(path: str, count: int) -> tuple[int, int]:
+    """Sends `count` attachments by `path` ("inline" or "upload"); returns the tracemalloc and RSS peaks."""
+    logging.disable(logging.INFO)
+    with tempfile.TemporaryDirectory() as directory:
+        attachments = []
+        for index in range(count):
+            file = os.path.join(directory, f"card-{index}.pdf")
+            with open(file, "wb") as f:
+                f.write(os.urandom(ATTACHMENT_SIZE))
+            attachments.append(Attachment(f"card-{index}.pdf", path=file))
+        if path == "inline":
+            service = service_for(lambda request: httpx.Response(200, json={"id": "msg-1"}))
+            service.upload_threshold = float("inf")
+        else:
+            service = service_for(FakeUploadSession(keep=False))
+        rss_before = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        tracemalloc.start()
+        send(service, attachments=attachments)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        # ru_maxrss is in KiB on Linux.
+        return peak, (resource.getrusage(resource.RUSAGE_SELF).ru_maxrss - rss_before) * 1024
+
+def main():
+    print(f"{'path':<8} {'attachments':>11} {'tracemalloc peak':>17} {'RSS growth':>11}")
+    context = multiprocessing.get_context("spawn")
+    for count in (1, 3):
+        for path in ("inline", "upload"):
+            with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+                peak, rss = executor.submit(measure, path, count).result()
+            print(f"{path:<8} {f'{count} x 5 MB':>11} {peak / 2 ** 20:>14.1f} MB {rss / 2 ** 20:>8.1f} MB")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+from google.auth.credentials import Credentials
+import threading
+import httplib2
+import time
+
+class FakeCredentials(Credentials):
+    """Credentials whose `refresh` hands out `token-1`, `token-2`, ... and counts how often it ran."""
+    def __init__(self, token: str = "token-0", refresh_delay: float = 0.0):
+        super().__init__()
+        self.token = token
+        self.refresh_delay = refresh_delay
+        self.refreshes = 0
+        self._lock = threading.Lock()
+
+    def refresh(self, request):
+        with self._lock:
+            self.refreshes += 1
+            refreshes = self.refreshes
+        time.sleep(self.refresh_delay)
+        self.token = f"token-{refreshes}"
+
+class StubHttp:
+    """
+    Stands in for `httplib2.Http`: every request goes to `handler(method, uri,
+    headers, body)`, which returns `(status, headers, content)` or raises.
+    """
+    def __init__(self, handler):
+        self.handler = handler
+        self.timeout = None
+        self.connections = {}
+        self.requests = []
+
+    def request(self, uri, method="GET", body=None, headers=None, redirections=5, connection_type=None, **kwargs):
+        headers = headers or {}
+        self.requests.append((method, uri, headers))
+        status, response_headers, content = self.handler(method, uri, headers, body)
+        return httplib2.Response({"status": status, **response_headers}), content
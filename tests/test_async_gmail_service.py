@@ -0,0 +1,288 @@
+from components.utils.AsyncGoogleClient import GoogleAPIError
+from components.utils.AsyncGmailService import AsyncGmailService
+from components.utils.GmailService import Attachment, MessageUnavailable
+from components.utils.CredentialManager import CredentialManager
+from tests.fakes import FakeCredentials
+import tracemalloc
+import threading
+import asyncio
+import email
+import httpx
+import pytest
+import os
+
+PROFILE_URL = "https://gmail.test/gmail/v1/users/me/profile"
+SEND_PATH = "/gmail/v1/users/me/messages/send"
+
+def rate_limited(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(429, json={"error": {"code": 429, "errors": [{"reason": "rateLimitExceeded"}]}})
+
+def unavailable(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(503, json={"error": {"code": 503, "message": "backend error"}})
+
+def sent(request: httpx.Request) -> httpx.Response:
+    return httpx.Response(200, json={"id": "msg-1"})
+
+def timed_out(request: httpx.Request) -> httpx.Response:
+    raise httpx.ReadTimeout("timed out", request=request)
+
+def refused(request: httpx.Request) -> httpx.Response:
+    raise httpx.ConnectError("connection refused", request=request)
+
+class FakeGmail:
+    """Serves each request with the next of `answers` (the last one repeats) and records it."""
+    def __init__(self, *answers):
+        self.answers = list(answers)
+        self.requests: list[httpx.Request] = []
+
+    def __call__(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        answer = self.answers.pop(0) if len(self.answers) > 1 else self.answers[0]
+        return answer(request)
+
+class FakeUploadSession(httpx.AsyncBaseTransport):
+    """
+    Gmail's resumable upload endpoint: the POST opens a session, PUTs append
+    chunks. The answer to each PUT numbered in `lose` is lost after the chunk is
+    stored. Bodies are consumed as a network transport does, without keeping them
+    on the request, and with `keep=False` only byte counts are kept.
+    """
+    SESSION_URL = "https://gmail.test/upload/session-1"
+
+    def __init__(self, lose: tuple = (), keep: bool = True):
+        self.lose = set(lose)
+        self.keep = keep
+        self.received = bytearray()
+        self.size = None
+        self.stored = 0
+        self.puts = 0
+        self.sends = 0
+        self.content_ranges: list[str] = []
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        body = b"".join([part async for part in request.stream])
+        if request.method == "POST":
+            assert request.url.params["uploadType"] == "resumable"
+            self.size = int(request.headers["x-upload-content-length"])
+            return httpx.Response(200, headers={"Location": self.SESSION_URL})
+        assert str(request.url) == self.SESSION_URL
+        content_range = request.headers["content-range"]
+        self.content_ranges.append(content_range)
+        if not content_range.startswith("bytes */"):
+            start, end = map(int, content_range[len("bytes "):].split("/")[0].split("-"))
+            assert start == self.stored and end - start + 1 == len(body) <= AsyncGmailService.UPLOAD_CHUNK_SIZE
+            if self.keep:
+                self.received += body
+            self.stored = end + 1
+            self.puts += 1
+            if self.stored == self.size:
+                self.sends += 1
+            if self.puts in self.lose:
+                raise httpx.ReadTimeout("timed out", request=request)
+        if self.stored == self.size:
+            return httpx.Response(200, json={"id": "msg-1"})
+        return httpx.Response(308, headers={"Range": f"bytes=0-{self.stored - 1}"} if self.stored else {})
+
+def service_for(fake: FakeGmail | FakeUploadSession, credentials: FakeCredentials | CredentialManager = None) -> AsyncGmailService:
+    service = AsyncGmailService(
+        credentials or FakeCredentials(),
+        sender_email="me@example.com",
+        api_endpoint="https://gmail.test",
+        backoff=0
+    )
+    transport = fake if isinstance(fake, httpx.AsyncBaseTransport) else httpx.MockTransport(fake)
+    service._client = httpx.AsyncClient(transport=transport)
+    return service
+
+def send(service: AsyncGmailService, **kwargs) -> str:
+    async def main():
+        try:
+            return await service.send_email("sc@example.com", "Report", "Hi", **kwargs)
+        finally:
+            await service.aclose()
+    return asyncio.run(main())
+
+def test_send_succeeds_in_one_call():
+    fake = FakeGmail(sent)
+
+    assert send(service_for(fake)) == "msg-1"
+    assert len(fake.requests) == 1
+    assert fake.requests[0].url.path == SEND_PATH
+    assert fake.requests[0].headers["authorization"] == "Bearer token-0"
+
+@pytest.mark.parametrize("answer", [rate_limited, unavailable])
+def test_send_is_not_retried_after_an_error_answer(answer):
+    fake = FakeGmail(answer, sent)
+    service = service_for(fake)
+
+    with pytest.raises(GoogleAPIError) as error:
+        send(service)
+    assert len(fake.requests) == 1
+    assert not service.is_in_doubt(error.value)
+
+def test_send_without_an_answer_is_in_doubt_and_not_retried():
+    fake = FakeGmail(timed_out, sent)
+    service = service_for(fake)
+
+    with pytest.raises(httpx.ReadTimeout) as error:
+        send(service)
+    assert len(fake.requests) == 1
+    assert service.is_in_doubt(error.value)
+
+def test_send_is_retried_when_the_connection_was_never_made():
+    fake = FakeGmail(refused, refused, sent)
+
+    assert send(service_for(fake)) == "msg-1"
+    assert len(fake.requests) == 3
+
+def test_send_gives_up_on_connection_errors_after_max_retries():
+    fake = FakeGmail(refused)
+    service = service_for(fake)
+
+    with pytest.raises(httpx.ConnectError) as error:
+        send(service)
+    assert len(fake.requests) == service.max_retries + 1
+    assert not service.is_in_doubt(error.value)
+
+def test_unreadable_attachment_is_a_definite_failure(tmp_path):
+    fake = FakeGmail(sent)
+    service = service_for(fake)
+
+    with pytest.raises(MessageUnavailable) as error:
+        send(service, attachments=[Attachment("missing.pdf", path=str(tmp_path / "missing.pdf"))])
+    assert not fake.requests
+    assert not service.is_in_doubt(error.value)
+
+@pytest.mark.parametrize("answers, calls", [
+    ((unavailable, rate_limited, sent), 3),
+    ((timed_out, sent), 2)
+])
+def test_idempotent_requests_are_retried(answers, calls):
+    fake = FakeGmail(*answers)
+    service = service_for(fake)
+
+    async def main():
+        try:
+            return await service.request("GET", PROFILE_URL)
+        finally:
+            await service.aclose()
+
+    assert asyncio.run(main()) == {"id": "msg-1"}
+    assert len(fake.requests) == calls
+
+def test_rejected_token_is_refreshed_once_and_the_request_replayed():
+    fake = FakeGmail(lambda request: httpx.Response(401), sent)
+    credentials = FakeCredentials()
+
+    assert send(service_for(fake, credentials)) == "msg-1"
+    assert credentials.refreshes == 1
+    assert [request.headers["authorization"] for request in fake.requests] == ["Bearer token-0", "Bearer token-1"]
+
+def test_expired_token_is_refreshed_once_for_concurrent_requests():
+    fake = FakeGmail(sent)
+    credentials = FakeCredentials(token=None, refresh_delay=0.05)
+    service = service_for(fake, credentials)
+
+    async def main():
+        try:
+            return await asyncio.gather(*(service.request("GET", PROFILE_URL) for _ in range(20)))
+        finally:
+            await service.aclose()
+
+    asyncio.run(main())
+    assert credentials.refreshes == 1
+    assert {request.headers["authorization"] for request in fake.requests} == {"Bearer token-1"}
+    assert len(fake.requests) == 20
+
+def test_expired_token_is_refreshed_once_with_the_credential_manager_and_sync_threads():
+    fake = FakeGmail(sent)
+    credentials = FakeCredentials(token=None, refresh_delay=0.1)
+    manager = CredentialManager(credentials)
+    service = service_for(fake, manager)
+
+    async def main():
+        try:
+            return await asyncio.gather(*(service.request("GET", PROFILE_URL) for _ in range(20)))
+        finally:
+            await service.aclose()
+
+    # The manager's background refresh (or a sync client) gets there at the same time.
+    threads = [threading.Thread(target=manager.refresh) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    asyncio.run(main())
+    for thread in threads:
+        thread.join()
+
+    assert credentials.refreshes == 1
+    assert {request.headers["authorization"] for request in fake.requests} == {"Bearer token-1"}
+
+def test_rejected_token_is_refreshed_once_for_concurrent_requests():
+    def rejected_once(request: httpx.Request) -> httpx.Response:
+        if request.headers["authorization"] == "Bearer token-0":
+            return httpx.Response(401)
+        return sent(request)
+
+    credentials = FakeCredentials(refresh_delay=0.05)
+    fake = FakeGmail(rejected_once)
+    service = service_for(fake, CredentialManager(credentials))
+
+    async def main():
+        try:
+            return await asyncio.gather(*(service.request("GET", PROFILE_URL) for _ in range(20)))
+        finally:
+            await service.aclose()
+
+    asyncio.run(main())
+    assert credentials.refreshes == 1
+    assert len(fake.requests) == 40
+
+@pytest.fixture
+def report_card(tmp_path) -> tuple[Attachment, bytes]:
+    content = os.urandom(2 * 1024 * 1024 + 1000)
+    path = tmp_path / "card.pdf"
+    path.write_bytes(content)
+    return Attachment("card.pdf", path=str(path)), content
+
+def test_large_message_is_sent_through_a_resumable_session_in_chunks(report_card):
+    attachment, content = report_card
+    fake = FakeUploadSession()
+    service = service_for(fake)
+
+    assert send(service, attachments=[attachment]) == "msg-1"
+    assert fake.puts == 3
+    message = email.message_from_bytes(bytes(fake.received))
+    [part] = [part for part in message.walk() if part.get_filename() == "card.pdf"]
+    assert part.get_payload(decode=True) == content
+
+def test_upload_resumes_from_what_the_session_stored_after_a_lost_answer(report_card):
+    attachment, _ = report_card
+    # The answers to the second and the last chunk are lost.
+    fake = FakeUploadSession(lose=(2, 3))
+    service = service_for(fake)
+
+    assert send(service, attachments=[attachment]) == "msg-1"
+    assert fake.puts == 3
+    assert fake.sends == 1
+    assert [content_range.startswith("bytes */") for content_range in fake.content_ranges] == [
+        False, False, True, False, True
+    ]
+
+def test_upload_of_5mb_attachments_holds_about_one_chunk_in_memory(tmp_path):
+    paths = []
+    for index in range(3):
+        paths.append(tmp_path / f"card-{index}.pdf")
+        paths[-1].write_bytes(os.urandom(5 * 1024 * 1024))
+    fake = FakeUploadSession(keep=False)
+    service = service_for(fake)
+
+    tracemalloc.start()
+    try:
+        send(service, attachments=[Attachment(path.name, path=str(path)) for path in paths])
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert fake.sends == 1
+    # The message is over 20 MB once base64-encoded.
+    assert peak < 4 * service.UPLOAD_CHUNK_SIZE
@@ -0,0 +1,137 @@
+from components.utils.AuthorizedHttpPool import AuthorizedHttpPool
+from google_auth_httplib2 import AuthorizedHttp
+from tests.fakes import FakeCredentials, StubHttp
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import pytest
+import time
+
+def ok(method, uri, headers, body):
+    time.sleep(0.01)
+    return 200, {}, headers["authorization"].encode()
+
+@pytest.fixture
+def stub_transports(monkeypatch):
+    """Makes every pooled transport a `StubHttp` running `handler` (settable per test)."""
+    transports = []
+    state = {"handler": ok}
+
+    def new_http(pool):
+        http = StubHttp(lambda *request: state["handler"](*request))
+        transports.append(http)
+        return AuthorizedHttp(pool.credentials, http=http)
+
+    monkeypatch.setattr(AuthorizedHttpPool, "_new_http", new_http)
+    return transports, state
+
+def test_lease_never_shares_a_transport(stub_transports):
+    transports, _ = stub_transports
+    pool = AuthorizedHttpPool(FakeCredentials(), size=3)
+    in_use = set()
+    overlaps = []
+    lock = threading.Lock()
+
+    def work(_):
+        with pool.lease() as http:
+            with lock:
+                overlaps.append(id(http) in in_use)
+                in_use.add(id(http))
+            http.request("https://example.test/")
+            with lock:
+                in_use.discard(id(http))
+
+    with ThreadPoolExecutor(max_workers=10) as executor:
+        list(executor.map(work, range(50)))
+
+    assert not any(overlaps)
+    assert len(transports) == 3
+    assert pool.stats() == {"size": 3, "created": 3, "idle": 3}
+
+def test_expired_credentials_are_refreshed_once_across_transports(stub_transports):
+    credentials = FakeCredentials(token=None, refresh_delay=0.05)
+    pool = AuthorizedHttpPool(credentials, size=8)
+
+    def work(_):
+        with pool.lease() as http:
+            _, content = http.request("https://example.test/")
+            return content
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        tokens = list(executor.map(work, range(32)))
+
+    assert credentials.refreshes == 1
+    assert set(tokens) == {b"Bearer token-1"}
+
+def test_lease_replaces_a_transport_after_a_connection_error(stub_transports):
+    transports, state = stub_transports
+    pool = AuthorizedHttpPool(FakeCredentials(), size=1)
+
+    def broken(method, uri, headers, body):
+        raise ConnectionResetError("reset by peer")
+
+    state["handler"] = broken
+    with pytest.raises(ConnectionResetError):
+        with pool.lease() as http:
+            http.request("https://example.test/")
+    state["handler"] = ok
+    with pool.lease() as http:
+        _, content = http.request("https://example.test/")
+
+    assert content == b"Bearer token-0"
+    assert len(transports) == 2
+    assert pool.stats()["created"] == 1
+
+def test_lease_times_out_when_every_transport_is_busy(stub_transports):
+    pool = AuthorizedHttpPool(FakeCredentials(), size=1, timeout=0.05)
+    with pool.lease():
+        with pytest.raises(TimeoutError):
+            with pool.lease():
+                pass
+
+def test_200_threads_share_the_pool_without_losing_requests(stub_transports):
+    transports, state = stub_transports
+    credentials = FakeCredentials(token=None, refresh_delay=0.05)
+    pool = AuthorizedHttpPool(credentials, size=8)
+    lock = threading.Lock()
+    in_flight = {"now": 0, "peak": 0}
+    served: list[str] = []
+
+    def flaky(method, uri, headers, body):
+        with lock:
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+        try:
+            time.sleep(0.005)
+            request_id = uri.rsplit("/", 1)[1]
+            # Every seventh request's first attempt loses its connection.
+            if int(request_id) % 7 == 0 and not headers.get("x-retry"):
+                raise ConnectionResetError("reset by peer")
+            with lock:
+                served.append(request_id)
+            return 200, {}, headers["authorization"].encode()
+        finally:
+            with lock:
+                in_flight["now"] -= 1
+
+    state["handler"] = flaky
+    start = threading.Barrier(200)
+
+    def work(request_id: int) -> bytes:
+        start.wait()
+        try:
+            with pool.lease() as http:
+                return http.request(f"https://example.test/{request_id}")[1]
+        except ConnectionResetError:
+            with pool.lease() as http:
+                return http.request(f"https://example.test/{request_id}", headers={"x-retry": "1"})[1]
+
+    with ThreadPoolExecutor(max_workers=200) as executor:
+        tokens = list(executor.map(work, range(200)))
+
+    assert credentials.refreshes == 1
+    assert set(tokens) == {b"Bearer token-1"}
+    assert sorted(map(int, served)) == list(range(200))
+    assert in_flight["peak"] <= 8
+    # 29 broken transports were swapped for fresh ones; the pool still holds exactly `size`.
+    assert len(transports) == 8 + 29
+    assert pool.stats() == {"size": 8, "created": 8, "idle": 8}
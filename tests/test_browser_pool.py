@@ -0,0 +1,94 @@
+from components.looker.AsyncBrowserPool import AsyncBrowserPool
+from components.looker.BrowserPool import BrowserPool, _PooledPage
+from types import SimpleNamespace
+import asyncio
+import pytest
+
+class ContextFactory:
+    """Builds fake browser contexts for a pool's `_new_slot`; raises while `failing` is set."""
+    def __init__(self):
+        self.built = 0
+        self.failing = False
+
+    def slot(self) -> _PooledPage:
+        if self.failing:
+            raise RuntimeError("browser crashed")
+        self.built += 1
+        context = SimpleNamespace(close=lambda: None)
+        return _PooledPage(context=context, page=SimpleNamespace(name=f"page-{self.built}"))
+
+    async def aslot(self) -> _PooledPage:
+        slot = self.slot()
+        slot.context.close = self._aclose
+        return slot
+
+    @staticmethod
+    async def _aclose():
+        pass
+
+@pytest.fixture
+def pool(monkeypatch) -> tuple[BrowserPool, ContextFactory]:
+    factory = ContextFactory()
+    pool = BrowserPool(size=1, max_uses=1)
+    monkeypatch.setattr(pool, "_new_slot", factory.slot)
+    monkeypatch.setattr(pool, "_is_healthy", lambda slot: True)
+    pool.playwright = object()
+    pool._idle.append(factory.slot())
+    return pool, factory
+
+def test_failed_recycle_leaves_a_marker_that_the_next_borrow_rebuilds(pool):
+    pool, factory = pool
+    factory.failing = True
+    with pool.page():
+        pass
+    assert list(pool._idle) == [None]
+
+    with pytest.raises(RuntimeError):
+        with pool.page():
+            pass
+    assert list(pool._idle) == [None]
+
+    factory.failing = False
+    with pool.page() as page:
+        assert page.name == "page-2"
+    assert pool.idle == 1 and pool._idle[0] is not None
+
+def test_async_failed_recycle_leaves_a_marker_that_the_next_borrow_rebuilds(monkeypatch):
+    factory = ContextFactory()
+    pool = AsyncBrowserPool(size=1, max_uses=1)
+    monkeypatch.setattr(pool, "_new_slot", factory.aslot)
+
+    async def healthy(slot):
+        return True
+
+    monkeypatch.setattr(pool, "_is_healthy", healthy)
+
+    async def main():
+        pool.playwright = object()
+        pool._idle = asyncio.Queue()
+        pool._idle.put_nowait(await factory.aslot())
+
+        factory.failing = True
+        async with pool.page():
+            pass
+        assert await asyncio.wait_for(pool._idle.get(), 1) is None
+        pool._idle.put_nowait(None)
+
+        factory.failing = False
+        async with pool.page() as page:
+            assert page.name == "page-2"
+
+        # A borrower cancelled while its slot is recycled still returns the slot.
+        async def borrow():
+            async with pool.page():
+                await asyncio.sleep(10)
+
+        task = asyncio.ensure_future(borrow())
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        slot = await asyncio.wait_for(pool._idle.get(), 1)
+        assert slot.page.name == "page-4"
+
+    asyncio.run(main())
@@ -0,0 +1,123 @@
+from components.utils.AuthorizedHttpPool import AuthorizedHttpPool
+from components.utils.CredentialManager import CredentialManager
+from components.utils.GmailService import Attachment, GmailService
+from google_auth_httplib2 import AuthorizedHttp
+from tests.fakes import FakeCredentials, StubHttp
+from collections import Counter
+import pytest
+import json
+import re
+
+RATE_LIMITED = (429, {"error": {"code": 429, "errors": [{"reason": "rateLimitExceeded"}]}})
+BAD_REQUEST = (400, {"error": {"code": 400, "errors": [{"reason": "invalidArgument"}]}})
+
+class FakeGmail:
+    """
+    Answers the profile lookup and Gmail batch requests. `script[request_id]` lists
+    the `(status, body)` answers for that sub-request's successive attempts; once
+    it runs out the send succeeds. `down` makes the next batch call fail outright.
+    """
+    def __init__(self, script: dict = None):
+        self.script = {request_id: list(answers) for request_id, answers in (script or {}).items()}
+        self.attempts = Counter()
+        self.batches = 0
+        self.down = None
+
+    def __call__(self, method, uri, headers, body):
+        if "/users/me/profile" in uri:
+            return 200, {"content-type": "application/json"}, json.dumps({"emailAddress": "me@example.com"}).encode()
+        assert "/batch/" in uri, uri
+        self.batches += 1
+        if self.down:
+            error, self.down = self.down, None
+            raise error
+
+        if isinstance(body, bytes):
+            body = body.decode()
+        parts = []
+        for content_id in re.findall(r"Content-ID: <([^>]+)>", body):
+            request_id = content_id.rsplit(" + ", 1)[1]
+            self.attempts[request_id] += 1
+            answers = self.script.get(request_id)
+            status, payload = answers.pop(0) if answers else (200, {"id": f"msg-{request_id}"})
+            parts.append(
+                f"--batch\r\nContent-Type: application/http\r\nContent-ID: <response-{content_id}>\r\n\r\n"
+                f"HTTP/1.1 {status} X\r\nContent-Type: application/json\r\n\r\n{json.dumps(payload)}\r\n"
+            )
+        content = "".join(parts) + "--batch--\r\n"
+        return 200, {"content-type": "multipart/mixed; boundary=batch"}, content.encode()
+
+@pytest.fixture
+def gmail(monkeypatch):
+    fake = FakeGmail()
+    monkeypatch.setattr(
+        AuthorizedHttpPool, "_new_http", lambda pool: AuthorizedHttp(pool.credentials, http=StubHttp(fake))
+    )
+    service = GmailService(
+        credential_manager=CredentialManager(FakeCredentials()),
+        api_endpoint="https://gmail.test",
+        batch_size=2
+    )
+    return service, fake
+
+def messages(count: int) -> list[dict]:
+    return [{"to": f"sc{index}@example.com", "subject": "Report", "body": "Hi"} for index in range(count)]
+
+def test_send_many_sends_every_message_once(gmail):
+    service, fake = gmail
+    results = service.send_many(messages(5), backoff=0)
+
+    assert [result["id"] for result in results] == [f"msg-{index}" for index in range(5)]
+    assert all(result["attempts"] == 1 and not result["in_doubt"] for result in results)
+    assert fake.batches == 3
+    assert set(fake.attempts.values()) == {1}
+
+def test_send_many_retries_only_rate_limited_sends(gmail):
+    service, fake = gmail
+    fake.script = {"1": [RATE_LIMITED, RATE_LIMITED]}
+    results = service.send_many(messages(3), backoff=0)
+
+    assert [result["id"] for result in results] == ["msg-0", "msg-1", "msg-2"]
+    assert [result["attempts"] for result in results] == [1, 3, 1]
+    assert fake.attempts == {"0": 1, "1": 3, "2": 1}
+
+def test_send_many_gives_up_after_max_retries(gmail):
+    service, fake = gmail
+    fake.script = {"0": [RATE_LIMITED] * 5}
+    [result] = service.send_many(messages(1), max_retries=2, backoff=0)
+
+    assert result["id"] is None
+    assert "429" in result["error"]
+    assert result["attempts"] == 3
+    assert not result["in_doubt"]
+
+def test_send_many_does_not_retry_rejected_sends(gmail):
+    service, fake = gmail
+    fake.script = {"0": [BAD_REQUEST]}
+    [result] = service.send_many(messages(1), backoff=0)
+
+    assert result["id"] is None
+    assert result["attempts"] == 1
+    assert not result["in_doubt"]
+    assert fake.attempts == {"0": 1}
+
+def test_send_many_never_resends_a_batch_without_an_answer(gmail):
+    service, fake = gmail
+    fake.down = TimeoutError("timed out")
+    results = service.send_many(messages(2), backoff=0)
+
+    assert fake.batches == 1
+    assert all(result["id"] is None for result in results)
+    assert all(result["in_doubt"] and result["attempts"] == 1 for result in results)
+
+def test_send_many_reports_unreadable_attachments_as_failures(gmail, tmp_path):
+    service, fake = gmail
+    batch = messages(2)
+    batch[0]["attachments"] = [Attachment("missing.pdf", path=str(tmp_path / "missing.pdf"))]
+    results = service.send_many(batch, backoff=0)
+
+    assert results[0]["id"] is None
+    assert results[0]["error"]
+    assert not results[0]["in_doubt"]
+    assert results[1]["id"] == "msg-1"
+    assert "0" not in fake.attempts
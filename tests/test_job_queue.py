@@ -0,0 +1,73 @@
+from components.utils.JobQueue import JobQueue, JobStore
+import threading
+import pytest
+import time
+import os
+
+POSTGRES_DSN = os.getenv("TEST_POSTGRES_DSN")
+
+@pytest.fixture(params=[
+    "sqlite",
+    pytest.param("postgres", marks=pytest.mark.skipif(not POSTGRES_DSN, reason="TEST_POSTGRES_DSN not set"))
+])
+def store(request, tmp_path) -> JobStore:
+    store = JobStore(POSTGRES_DSN if request.param == "postgres" else str(tmp_path / "jobs.sqlite3"))
+    if request.param == "postgres":
+        with store.db.transaction() as conn:
+            conn.execute("DELETE FROM jobs")
+    return store
+
+def wait_for(predicate, timeout: float = 5):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.02)
+
+def test_startup_leaves_jobs_of_live_processes_alone(store):
+    job = store.create("report-card", {"dept": "SC"})
+    assert store.claim_next("process-a", lease_seconds=30)["id"] == job["id"]
+
+    # A second process (another uvicorn worker, or the new one in a rolling restart) starts.
+    assert store.requeue_expired() == 0
+    assert store.claim_next("process-b") is None
+    assert store.get(job["id"])["owner"] == "process-a"
+
+def test_jobs_of_a_process_that_stopped_heartbeating_are_requeued(store):
+    job = store.create("report-card", {"dept": "SC"})
+    store.claim_next("crashed", lease_seconds=0.05)
+    time.sleep(0.1)
+
+    assert store.requeue_expired() == 1
+    assert store.get(job["id"])["status"] == "queued"
+    assert store.claim_next("process-b")["owner"] == "process-b"
+
+def test_expired_job_is_reclaimed_and_its_old_owner_cannot_finish_it(store):
+    job = store.create("report-card", {"dept": "SC"})
+    store.claim_next("stalled", lease_seconds=0.05)
+    time.sleep(0.1)
+
+    assert store.claim_next("process-b")["id"] == job["id"]
+    assert not store.heartbeat(job["id"], "stalled")
+    assert not store.finish(job["id"], "succeeded", result={"ok": 1}, owner="stalled")
+    assert store.finish(job["id"], "succeeded", result={"ok": 2}, owner="process-b")
+    assert store.get(job["id"])["result"] == {"ok": 2}
+
+def test_queue_heartbeats_a_long_job_past_its_lease(store):
+    release = threading.Event()
+    queue = JobQueue(store, poll_interval=0.02, lease_seconds=0.15, owner="process-a")
+    queue.register("slow", lambda params, context: release.wait(5) and {"done": True})
+    queue.start()
+    try:
+        job = queue.submit("slow", {})
+        wait_for(lambda: store.get(job["id"])["status"] == "running")
+
+        time.sleep(0.4)
+        assert store.requeue_expired() == 0
+        assert store.claim_next("process-b") is None
+
+        release.set()
+        wait_for(lambda: store.get(job["id"])["status"] == "succeeded")
+    finally:
+        release.set()
+        queue.stop()
+    assert store.get(job["id"])["result"] == {"done": True}
@@ -0,0 +1,79 @@
+from components.looker.LookerStudioURLBuilder import LookerStudioURLBuilder
+from components.looker.LinkTable import LinkTable, build_links
+from components.utils.Roster import Employee, Roster
+from components.utils.RosterSync import RosterDiff
+import pytest
+
+BASE_URL = "https://lookerstudio.google.com/reporting/abc/page/p_1"
+
+def employee(first: str, last: str, grm: str = "grm1", branch: str = "NORTH") -> Employee:
+    return Employee(
+        sc_firstname=first,
+        sc_lastname=last,
+        sc_email_address=f"{first}.{last}@example.com".lower(),
+        grm_name=grm.upper(),
+        grm_email_address=f"{grm}@example.com",
+        branch=branch
+    )
+
+JUAN = employee("Juan", "Dela Cruz")
+MARIA = employee("Maria", "Santos", grm="grm2", branch="SOUTH")
+JOSE = employee("Jose", "Rizal")
+ANA = employee("Ana", "Reyes", grm="grm2", branch="SOUTH")
+JUAN_SOUTH = employee("Juan", "Dela Cruz", grm="grm2", branch="SOUTH")
+JUAN_EAST = employee("Juan", "Dela Cruz", branch="EAST")
+
+def patched_and_rebuilt(before: list[Employee], diff: RosterDiff) -> tuple[dict, dict, LinkTable]:
+    """The link table patched from `before`'s, and one built from scratch for the same roster."""
+    previous = Roster(before, version=diff.base_version)
+    roster = previous.patched(diff.outgoing, diff.incoming, version=diff.version, diff=diff)
+    table = LinkTable()
+    table.get(BASE_URL, 2025, 7, previous)
+    patched = table.get(BASE_URL, 2025, 7, roster)
+    rebuilt = LinkTable().get(BASE_URL, 2025, 7, Roster(list(roster), version=diff.version))
+    return patched, rebuilt, table
+
+@pytest.mark.parametrize("before, diff", [
+    ([JUAN, MARIA], RosterDiff("1", "2", added=[JOSE])),
+    ([JUAN, MARIA, JOSE], RosterDiff("1", "2", removed=[MARIA])),
+    ([JUAN, MARIA], RosterDiff("1", "2", changed=[(MARIA, employee("Maria", "Santos", branch="NORTH"))])),
+    ([JUAN, MARIA], RosterDiff("1", "2", changed=[(MARIA, employee("Mary", "Santos", grm="grm2"))])),
+    ([JUAN, MARIA, JOSE], RosterDiff("1", "2", added=[ANA], removed=[JOSE], changed=[(JUAN, JUAN_SOUTH)])),
+    ([JUAN, MARIA, JUAN_SOUTH], RosterDiff("1", "2", removed=[JUAN_SOUTH])),
+    ([JUAN, MARIA], RosterDiff("1", "2", added=[JUAN_SOUTH])),
+    ([JUAN, JUAN_SOUTH], RosterDiff("1", "2", added=[JUAN_EAST])),
+    ([MARIA, JOSE, JUAN_SOUTH, JUAN], RosterDiff("1", "2", changed=[(JOSE, employee("Jose", "Rizal", grm="grm3"))])),
+])
+def test_patched_table_matches_a_full_rebuild(before, diff):
+    patched, rebuilt, table = patched_and_rebuilt(before, diff)
+
+    assert patched == rebuilt
+    assert table.stats()["patches"] == 1
+
+def test_table_is_rebuilt_when_the_previous_version_is_unknown():
+    previous = Roster([JUAN, MARIA], version="1")
+    diff = RosterDiff("0", "2", added=[JOSE])
+    table = LinkTable()
+    table.get(BASE_URL, 2025, 7, previous)
+    links = table.get(BASE_URL, 2025, 7, previous.patched([], [JOSE], version="2", diff=diff))
+
+    assert set(links) == {"JUAN DELA CRUZ", "MARIA SANTOS", "JOSE RIZAL"}
+    assert table.stats() == {"tables": 2, "hits": 0, "builds": 2, "patches": 0}
+
+def test_tables_are_memoized_per_period_and_version():
+    roster = Roster([JUAN, MARIA], version="1")
+    table = LinkTable(max_tables=2)
+    first = table.get(BASE_URL, 2025, 7, roster)
+
+    assert table.get(BASE_URL, 2025, 7, roster) is first
+    table.get(BASE_URL, 2025, 8, roster)
+    table.get(BASE_URL, 2025, 9, roster)
+    assert table.get(BASE_URL, 2025, 7, roster) is not first
+    assert table.stats() == {"tables": 2, "hits": 1, "builds": 4, "patches": 0}
+
+def test_links_match_the_per_employee_urls():
+    links = build_links(BASE_URL, 2025, 7, [JUAN, MARIA, JOSE], lang="es")
+
+    for name, link in links.items():
+        assert link.url == LookerStudioURLBuilder(BASE_URL, 2025, 7, name, "es").get_looker_url()
+    assert links["MARIA SANTOS"].branch == "SOUTH"
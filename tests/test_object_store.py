@@ -0,0 +1,86 @@
+from components.storage import LocalObjectStore, ObjectStoreFactory, S3ObjectStore
+from config.config import ObjectStorage
+from dataclasses import asdict
+import hashlib
+import pytest
+import io
+
+mock_aws = pytest.importorskip("moto").mock_aws
+
+BUCKET = "report-cards"
+# Above boto3's 8 MB multipart threshold, so the S3 upload streams in parts.
+LARGE = bytes(range(256)) * (9 * 1024 * 4)
+
+@pytest.fixture(params=["local", "s3"])
+def store(request, tmp_path, monkeypatch):
+    if request.param == "local":
+        yield LocalObjectStore(str(tmp_path))
+        return
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        monkeypatch.setenv(name, "testing")
+    with mock_aws():
+        store = S3ObjectStore(BUCKET, prefix="cards/", region="us-east-1")
+        store.client.create_bucket(Bucket=BUCKET)
+        yield store
+
+def test_put_head_get_list_round_trip(store):
+    small = b"%PDF-1.7 small"
+    key = "SC-2025-08/HYUNDAI SHAW/JUAN DELA CRUZ.pdf"
+    record = store.put(key, io.BytesIO(LARGE), metadata={"dept": "SC"})
+    store.put("SC-2025-08/HYUNDAI LIPA/MARIA SANTOS.pdf", io.BytesIO(small))
+    store.put("GRM-2025-08/HYUNDAI SHAW/PEDRO REYES.pdf", io.BytesIO(small))
+
+    head = store.head(key)
+    assert head == record
+    assert head["size"] == len(LARGE)
+    assert head["checksum"] == hashlib.sha256(LARGE).hexdigest()
+    assert head["metadata"] == {"dept": "SC"}
+
+    with store.open(key) as f:
+        assert f.read() == LARGE
+
+    assert [entry["key"] for entry in store.list("SC-2025-08/")] == [
+        "SC-2025-08/HYUNDAI LIPA/MARIA SANTOS.pdf",
+        "SC-2025-08/HYUNDAI SHAW/JUAN DELA CRUZ.pdf"
+    ]
+    assert len(store.list()) == 3
+
+def test_missing_and_deleted_objects_have_no_head(store):
+    key = "SC-2025-08/HYUNDAI SHAW/JOSE RIZAL.pdf"
+    assert store.head(key) is None
+
+    store.put(key, io.BytesIO(b"%PDF"))
+    store.delete(key)
+
+    assert store.head(key) is None
+    assert store.list() == []
+
+def test_s3_objects_are_stored_under_the_prefix(monkeypatch):
+    for name in ("AWS_ACCESS_KEY_ID", "AWS_SECRET_ACCESS_KEY"):
+        monkeypatch.setenv(name, "testing")
+    with mock_aws():
+        store = S3ObjectStore(BUCKET, prefix="cards", region="us-east-1")
+        store.client.create_bucket(Bucket=BUCKET)
+        store.put("a.pdf", io.BytesIO(b"%PDF"))
+
+        keys = [obj["Key"] for obj in store.client.list_objects_v2(Bucket=BUCKET)["Contents"]]
+        assert keys == ["cards/a.pdf", "cards/a.pdf.meta.json"]
+
+def test_factory_passes_the_s3_settings_through():
+    config = ObjectStorage(
+        backend="s3",
+        root="",
+        bucket=BUCKET,
+        prefix="cards",
+        endpoint_url="http://minio.test:9000",
+        region="ap-southeast-1",
+        access_key_id="minio-key",
+        secret_access_key="minio-secret"
+    )
+    store = ObjectStoreFactory.create("s3", asdict(config))
+    credentials = store.client._request_signer._credentials
+
+    assert store.client.meta.endpoint_url == "http://minio.test:9000"
+    assert store.client.meta.region_name == "ap-southeast-1"
+    assert (credentials.access_key, credentials.secret_key) == ("minio-key", "minio-secret")
+    assert store.prefix == "cards"
@@ -0,0 +1,149 @@
+from components.looker.AsyncReportDownloader import AsyncReportDownloader
+from components.looker.ReportDownloader import ReportDownloader
+from components.storage import LocalObjectStore
+from contextlib import asynccontextmanager, contextmanager
+from types import SimpleNamespace
+import asyncio
+import pytest
+
+REPORT = "https://lookerstudio.google.com/reporting/abc/page/p_1"
+
+class FakePage:
+    """Stands in for a sync Playwright `Page`; logs every call and raises for the names in `failing`."""
+    def __init__(self, download_path: str, url: str = "about:blank", failing: tuple = ()):
+        self.download_path = download_path
+        self.url = url
+        self.failing = set(failing)
+        self.calls = []
+
+    def _call(self, name: str, *args):
+        self.calls.append((name, *args))
+        if name in self.failing:
+            raise TimeoutError(f"{name} timed out")
+
+    def goto(self, url, wait_until=None, timeout=None):
+        self._call("goto", url, wait_until)
+        self.url = url
+
+    def evaluate(self, script, url):
+        self._call("evaluate", url)
+        self.url = url
+
+    def wait_for_load_state(self, state, timeout=None):
+        self._call("wait_for_load_state", state)
+
+    def wait_for_selector(self, selector, state=None, timeout=None):
+        self._call("wait_for_selector", selector)
+
+    def wait_for_function(self, script, arg=None, timeout=None):
+        self._call("wait_for_function", arg)
+
+    def wait_for_timeout(self, timeout):
+        self._call("wait_for_timeout", timeout)
+
+    def click(self, selector):
+        self._call("click", selector)
+
+    def get_by_text(self, text, exact=None):
+        wait_for = lambda state=None, timeout=None: self._call("wait_for_text", text)
+        return SimpleNamespace(first=SimpleNamespace(wait_for=wait_for))
+
+    @contextmanager
+    def expect_download(self):
+        info = SimpleNamespace()
+        yield info
+        info.value = SimpleNamespace(path=lambda: self.download_path, delete=lambda: self._call("delete"))
+
+class FakeAsyncPage:
+    """`FakePage` behind the async Playwright API, logging into the same `calls`."""
+    def __init__(self, page: FakePage):
+        self.sync = page
+
+    @property
+    def url(self) -> str:
+        return self.sync.url
+
+    def __getattr__(self, name):
+        method = getattr(self.sync, name)
+
+        async def call(*args, **kwargs):
+            return method(*args, **kwargs)
+        return call
+
+    def get_by_text(self, text, exact=None):
+        async def wait_for(state=None, timeout=None):
+            self.sync._call("wait_for_text", text)
+        return SimpleNamespace(first=SimpleNamespace(wait_for=wait_for))
+
+    @asynccontextmanager
+    async def expect_download(self):
+        with self.sync.expect_download() as info:
+            download = asyncio.get_running_loop().create_future()
+            yield SimpleNamespace(value=download)
+        path, delete = info.value.path, info.value.delete
+
+        async def apath():
+            return path()
+
+        async def adelete():
+            delete()
+        download.set_result(SimpleNamespace(path=apath, delete=adelete))
+
+def pool_of(page):
+    @contextmanager
+    def borrow():
+        yield page
+
+    @asynccontextmanager
+    async def aborrow():
+        yield page
+    return SimpleNamespace(page=aborrow if isinstance(page, FakeAsyncPage) else borrow)
+
+@pytest.fixture
+def pdf(tmp_path) -> str:
+    path = tmp_path / "download.pdf"
+    path.write_bytes(b"%PDF-1.4 report")
+    return str(path)
+
+def run_both(tmp_path, pdf: str, **kwargs) -> tuple[dict, ReportDownloader, dict, AsyncReportDownloader]:
+    options = dict(url=f"{REPORT}?params=juan", branch="NORTH", dept="SC", employee_name="Juan Dela Cruz", run_id="run")
+    options.update(kwargs.pop("options", {}))
+    sync_page, async_page = FakePage(pdf, **kwargs), FakeAsyncPage(FakePage(pdf, **kwargs))
+    sync_downloader = ReportDownloader(
+        pool=pool_of(sync_page), store=LocalObjectStore(str(tmp_path / "sync")), **options
+    )
+    async_downloader = AsyncReportDownloader(
+        pool=pool_of(async_page), store=LocalObjectStore(str(tmp_path / "async")), **options
+    )
+    sync_record = sync_downloader.run_automation()
+    async_record = asyncio.run(async_downloader.run_automation())
+    assert sync_page.calls == async_page.sync.calls
+    return sync_record, sync_downloader, async_record, async_downloader
+
+def test_both_downloaders_make_the_same_calls_and_store_the_same_file(tmp_path, pdf):
+    sync_record, sync_downloader, async_record, async_downloader = run_both(
+        tmp_path, pdf, options={"mode": "fast"}
+    )
+
+    assert sync_record["key"] == async_record["key"] == "run/NORTH/Juan Dela Cruz.pdf"
+    assert sync_record["checksum"] == async_record["checksum"]
+    assert sync_downloader.navigated == async_downloader.navigated == "full"
+    assert set(sync_downloader.timer.timings) == set(async_downloader.timer.timings)
+
+def test_failed_in_place_switch_falls_back_to_a_full_load(tmp_path, pdf):
+    _, sync_downloader, _, async_downloader = run_both(
+        tmp_path, pdf, url=f"{REPORT}?params=maria", failing=("wait_for_text",),
+        options={"mode": "fast", "navigation": "in_place"}
+    )
+
+    assert sync_downloader.navigated == async_downloader.navigated == "fallback"
+
+def test_pooled_download_errors_are_raised_so_the_page_is_recycled(tmp_path, pdf):
+    page = FakePage(pdf, failing=("click",))
+    with pytest.raises(TimeoutError):
+        ReportDownloader(pool=pool_of(page), url=REPORT, dept="SC", employee_name="Juan").run_automation()
+    with pytest.raises(TimeoutError):
+        asyncio.run(
+            AsyncReportDownloader(pool=pool_of(FakeAsyncPage(page)), url=REPORT, dept="SC", employee_name="Juan")
+            .run_automation()
+        )
@@ -0,0 +1,53 @@
+from components.looker.RequestPolicy import BlockedSizes, RequestPolicy
+from types import SimpleNamespace
+
+ANALYTICS = "https://www.google-analytics.com/collect?v=2"
+TAG_MANAGER = "https://www.googletagmanager.com/gtag/js"
+
+class FakeRoute:
+    """Stands in for a sync Playwright `Route`; records what the policy did with it."""
+    def __init__(self, url: str, resource_type: str = "script", body: bytes = b""):
+        self.request = SimpleNamespace(url=url, resource_type=resource_type)
+        self.body = body
+        self.outcome = None
+
+    def fallback(self):
+        self.outcome = "fallback"
+
+    def abort(self, error_code: str = None):
+        self.outcome = "abort"
+
+    def fetch(self):
+        return SimpleNamespace(body=lambda: self.body)
+
+    def fulfill(self, response=None, body: bytes = None):
+        self.outcome = "fulfill"
+
+def test_policies_keep_their_own_sizes_unless_they_share_them():
+    shared = BlockedSizes()
+    auditor = RequestPolicy.profile("safe", audit=True, sizes=shared)
+    auditor.handle(FakeRoute(ANALYTICS, body=b"x" * 100))
+
+    assert len(shared) == 1
+    assert len(RequestPolicy.profile("safe").sizes) == 0
+
+    enforcer = RequestPolicy.profile("safe", sizes=shared)
+    route = FakeRoute(ANALYTICS)
+    enforcer.handle(route)
+    assert route.outcome == "abort"
+    assert enforcer.stats()["bytes_saved"] == 100
+
+def test_bytes_saved_is_unknown_while_a_blocked_request_is_unmeasured():
+    sizes = BlockedSizes()
+    sizes.record(ANALYTICS, 100)
+    policy = RequestPolicy.profile("safe", sizes=sizes)
+    policy.handle(FakeRoute(ANALYTICS))
+    policy.handle(FakeRoute(TAG_MANAGER))
+    policy.handle(FakeRoute("https://lookerstudio.google.com/app.js"))
+
+    stats = policy.stats()
+    assert stats["blocked"] == 2
+    assert stats["allowed"] == 1
+    assert stats["bytes_saved"] is None
+    assert stats["bytes_saved_at_least"] == 100
+    assert stats["unmeasured"] == 1
@@ -0,0 +1,114 @@
+from components.utils.RosterCache import RosterCache
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import asyncio
+import time
+
+ROWS = [
+    {"sc_firstname": "Juan", "sc_lastname": "Dela Cruz", "grm_email_address": "grm1@example.com", "branch": "NORTH"},
+    {"sc_firstname": "Maria", "sc_lastname": "Santos", "grm_email_address": "grm2@example.com", "branch": "SOUTH"}
+]
+
+class FakeSheet:
+    """Stands in for `GSheetService`: `release` gates every fetch, and fetches are counted."""
+    def __init__(self, modified_time: str = "t1"):
+        self.modified_time_value = modified_time
+        self.fetches = 0
+        self.release = threading.Event()
+        self.release.set()
+
+    def modified_time(self) -> str:
+        return self.modified_time_value
+
+    def iter_rows(self):
+        self.fetches += 1
+        self.release.wait(5)
+        yield from ROWS
+
+class FakeAsyncSheet:
+    """`FakeSheet` for the `async_gsheet` path, counting into the same sheet."""
+    def __init__(self, sheet: FakeSheet):
+        self.sheet = sheet
+
+    async def modified_time(self) -> str:
+        return self.sheet.modified_time_value
+
+    async def iter_rows(self):
+        self.sheet.fetches += 1
+        await asyncio.to_thread(self.sheet.release.wait, 5)
+        for row in ROWS:
+            yield row
+
+def test_concurrent_gets_share_one_fetch():
+    sheet = FakeSheet()
+    sheet.release.clear()
+    cache = RosterCache(sheet)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        futures = [executor.submit(cache.get) for _ in range(8)]
+        time.sleep(0.05)
+        sheet.release.set()
+        rosters = {id(future.result()) for future in futures}
+
+    assert sheet.fetches == 1
+    assert len(rosters) == 1
+
+def test_fetch_does_not_block_readers_of_the_cached_roster():
+    sheet = FakeSheet()
+    cache = RosterCache(sheet, ttl=0)
+    roster = cache.get()
+    sheet.release.clear()
+    sheet.modified_time_value = "t2"
+    refresh = threading.Thread(target=cache.get)
+    refresh.start()
+    time.sleep(0.05)
+
+    started = time.monotonic()
+    cache.stats()
+    cache.peek()
+    assert time.monotonic() - started < 0.05
+
+    sheet.release.set()
+    refresh.join()
+    assert sheet.fetches == 2
+    assert cache.get() is not roster
+
+def test_unchanged_sheet_is_revalidated_instead_of_fetched():
+    sheet = FakeSheet()
+    cache = RosterCache(sheet, ttl=0)
+    roster = cache.get()
+
+    assert cache.get() is roster
+    assert sheet.fetches == 1
+    assert cache.stats()["revalidations"] == 1
+
+def test_threads_and_coroutines_share_one_fetch():
+    sheet = FakeSheet()
+    sheet.release.clear()
+    cache = RosterCache(sheet, async_gsheet=FakeAsyncSheet(sheet))
+
+    async def race():
+        leader = asyncio.create_task(cache.aget())
+        await asyncio.sleep(0.05)
+        thread = asyncio.create_task(asyncio.to_thread(cache.get))
+        follower = asyncio.create_task(cache.aget())
+        await asyncio.sleep(0.05)
+        sheet.release.set()
+        return await asyncio.gather(leader, thread, follower)
+
+    rosters = asyncio.run(race())
+    assert sheet.fetches == 1
+    assert len({id(roster) for roster in rosters}) == 1
+
+def test_version_survives_a_restart_and_follows_the_content():
+    sheet = FakeSheet()
+    version = RosterCache(sheet).get().version
+
+    sheet.modified_time_value = "t2"
+    assert RosterCache(sheet).get().version == version
+
+    ROWS.append({"sc_firstname": "Jose", "sc_lastname": "Rizal", "branch": "NORTH"})
+    try:
+        assert RosterCache(sheet).get().version != version
+    finally:
+        ROWS.pop()
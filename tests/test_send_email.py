@@ -0,0 +1,109 @@
+from app.dependencies import get_outbox_dispatcher, get_roster_cache
+from components.utils import EmailOutbox, Employee, OutboxDispatcher, Roster
+from fastapi.testclient import TestClient
+from app.routes import send_email
+from app.app import app
+import importlib
+import pytest
+
+GRM_EMAIL = "grm@example.com"
+ROSTER = Roster([
+    Employee("Juan", "Dela Cruz", "juan@example.com", "Pedro Reyes", GRM_EMAIL, "TEST BRANCH"),
+    Employee("Maria", "Santos", "maria@example.com", "Pedro Reyes", GRM_EMAIL, "TEST BRANCH"),
+    # The GRM has a report card of their own, so the SC-links email reaches them too.
+    Employee("Pedro", "Reyes", GRM_EMAIL, "Ana Cruz", "ana@example.com", "TEST BRANCH")
+], version="1")
+
+class FakeRosterCache:
+    async def aget(self) -> Roster:
+        return ROSTER
+
+class FakeGmail:
+    """Stands in for `GmailService.send_many`: sends whatever isn't in `reject`."""
+    def __init__(self):
+        self.sent: list[dict] = []
+        self.reject: set[str] = set()
+
+    def send_many(self, messages: list[dict]) -> list[dict]:
+        results = []
+        for message in messages:
+            rejected = message["to"] in self.reject
+            if not rejected:
+                self.sent.append(message)
+            results.append({
+                "to": message["to"],
+                "id": None if rejected else f"msg-{len(self.sent)}",
+                "error": "HTTP 400" if rejected else None,
+                "attempts": 1,
+                "in_doubt": False
+            })
+        return results
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(send_email, "SC_BASE_URL", "https://looker.test/sc")
+    # `components.run` the module, not the `run` function `components` re-exports.
+    monkeypatch.setattr(importlib.import_module("components.run"), "GRM_BASE_URL", "https://looker.test/grm")
+    gmail = FakeGmail()
+    dispatcher = OutboxDispatcher(EmailOutbox(str(tmp_path / "outbox.db")), gmail)
+    app.dependency_overrides[get_roster_cache] = FakeRosterCache
+    app.dependency_overrides[get_outbox_dispatcher] = lambda: dispatcher
+    try:
+        yield TestClient(app), dispatcher, gmail
+    finally:
+        app.dependency_overrides.clear()
+
+PERIOD = {"year": 2025, "month": 8, "strategy": "batch"}
+
+def send_sc(client: TestClient, recipient_type: str = "SC", branch: str = "TEST BRANCH") -> dict:
+    response = client.post(
+        "/send/send-sc-email",
+        params={**PERIOD, "attach_report_card": False},
+        json={"branch": branch, "recipient_type": recipient_type}
+    )
+    assert response.status_code == 200, response.text
+    return response.json()["content"]
+
+def test_sc_links_email_and_grm_digest_to_the_same_grm_are_both_sent(client):
+    client, dispatcher, gmail = client
+    send_sc(client, recipient_type="GRM")
+    response = client.post(
+        "/send/send-grm-email",
+        params={**PERIOD, "grm_email": GRM_EMAIL},
+        json={"branch": "TEST BRANCH", "recipient_type": "GRM"}
+    )
+
+    assert response.json()["content"]["sent"]
+    templates = {entry["template"] for entry in dispatcher.outbox.entries(recipient=GRM_EMAIL)}
+    assert templates == {"SC_LINKS:GRM", "GRM_DIGEST"}
+    assert [message["to"] for message in gmail.sent] == [GRM_EMAIL, GRM_EMAIL]
+    assert gmail.sent[0]["subject"] != gmail.sent[1]["subject"]
+
+def test_resending_a_period_skips_finished_sends_and_retries_failed_ones(client):
+    client, dispatcher, gmail = client
+    gmail.reject = {"maria@example.com"}
+    first = send_sc(client)
+    gmail.reject = set()
+    second = send_sc(client)
+
+    assert [sent["email"] for sent in first["sent"]] == ["juan@example.com", GRM_EMAIL]
+    assert [failed["email"] for failed in first["failed"]] == ["maria@example.com"]
+    assert [sent["email"] for sent in second["sent"]] == ["maria@example.com"]
+    assert second["already_sent"] == 2
+    assert [message["to"] for message in gmail.sent] == ["juan@example.com", GRM_EMAIL, "maria@example.com"]
+
+def test_redrive_only_sends_the_entries_it_requeued(client):
+    client, dispatcher, gmail = client
+    gmail.reject = {"maria@example.com"}
+    send_sc(client)
+    gmail.reject = set()
+    dispatcher.outbox.enqueue("HYUNDAI SHAW", 2025, 8, "SC_LINKS:SC", [
+        {"to": "other@example.com", "subject": "s", "body": "b"}
+    ])
+
+    response = client.post("/send/outbox/redrive", params={"strategy": "batch"}, json={"statuses": ["failed"]})
+    content = response.json()["content"]
+
+    assert content["requeued"] == 1
+    assert [sent["email"] for sent in content["sent"]] == ["maria@example.com"]
+    assert dispatcher.outbox.counts(branch="HYUNDAI SHAW") == {"pending": 1}
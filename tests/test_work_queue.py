@@ -0,0 +1,113 @@
+from components.utils.WorkQueue import WorkQueue
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+import uuid
+import time
+import os
+
+# PostgreSQL runs too when a scratch database is given, e.g.
+# TEST_POSTGRES_DSN=postgresql://postgres@localhost/postgres python -m pytest tests/test_work_queue.py
+POSTGRES_DSN = os.getenv("TEST_POSTGRES_DSN")
+
+@pytest.fixture(params=[
+    "sqlite",
+    pytest.param("postgres", marks=pytest.mark.skipif(not POSTGRES_DSN, reason="TEST_POSTGRES_DSN not set"))
+])
+def queue(request, tmp_path) -> WorkQueue:
+    return WorkQueue(POSTGRES_DSN if request.param == "postgres" else str(tmp_path / "queue.sqlite3"), max_attempts=2)
+
+@pytest.fixture
+def run_id() -> str:
+    # Runs never share items, so a shared PostgreSQL database needs no cleanup.
+    return uuid.uuid4().hex
+
+def employees(count: int) -> dict[str, dict]:
+    return {f"EMPLOYEE {index:03d}": {"url": f"https://looker.test/{index}", "branch": "NORTH"} for index in range(count)}
+
+def test_enqueue_keeps_items_already_queued(queue, run_id):
+    assert queue.enqueue(run_id, employees(3)) == 3
+    assert queue.enqueue(run_id, employees(4)) == 1
+    assert queue.counts(run_id) == {"pending": 4}
+
+def test_each_item_is_claimed_once_and_completed(queue, run_id):
+    queue.enqueue(run_id, employees(2))
+    first = queue.claim(run_id, "worker-a")
+    second = queue.claim(run_id, "worker-b")
+
+    assert {first["item_key"], second["item_key"]} == {"EMPLOYEE 000", "EMPLOYEE 001"}
+    assert first["payload"]["branch"] == "NORTH"
+    assert queue.claim(run_id, "worker-c") is None
+    assert queue.complete(run_id, first["item_key"], "worker-a", {"status": "success"})
+    assert not queue.complete(run_id, second["item_key"], "worker-a", {"status": "success"})
+    assert queue.counts(run_id) == {"done": 1, "leased": 1}
+
+def test_heartbeat_keeps_the_lease(queue, run_id):
+    queue.enqueue(run_id, employees(1))
+    item = queue.claim(run_id, "worker-a", lease_seconds=0.3)
+    for _ in range(3):
+        time.sleep(0.15)
+        assert queue.heartbeat(run_id, item["item_key"], "worker-a", lease_seconds=0.3)
+        assert queue.claim(run_id, "worker-b") is None
+
+    assert not queue.heartbeat(run_id, item["item_key"], "worker-b")
+
+def test_expired_lease_of_a_crashed_worker_is_reclaimed(queue, run_id):
+    queue.enqueue(run_id, employees(1))
+    item = queue.claim(run_id, "crashed", lease_seconds=0.1)
+    time.sleep(0.15)
+
+    reclaimed = queue.claim(run_id, "worker-b")
+    assert reclaimed["item_key"] == item["item_key"]
+    assert reclaimed["lease_owner"] == "worker-b"
+    assert reclaimed["attempts"] == 2
+    # The crashed worker lost the item and can't finish it any more.
+    assert not queue.heartbeat(run_id, item["item_key"], "crashed")
+    assert not queue.complete(run_id, item["item_key"], "crashed", {"status": "success"})
+    assert queue.complete(run_id, item["item_key"], "worker-b", {"status": "success"})
+    assert queue.items(run_id)[0]["result"] == {"status": "success"}
+
+def test_item_fails_once_its_leases_run_out(queue, run_id):
+    queue.enqueue(run_id, employees(1))
+    queue.claim(run_id, "crashed-1", lease_seconds=0.05)
+    time.sleep(0.1)
+    queue.claim(run_id, "crashed-2", lease_seconds=0.05)
+    time.sleep(0.1)
+
+    assert queue.claim(run_id, "worker-c") is None
+    [item] = queue.items(run_id)
+    assert item["status"] == "failed"
+    assert item["error"] == "Lease expired"
+
+def test_failed_item_is_retried_until_out_of_attempts(queue, run_id):
+    queue.enqueue(run_id, employees(1))
+    item = queue.claim(run_id, "worker-a")
+    assert queue.fail(run_id, item["item_key"], "worker-a", "Timeout")
+    assert queue.counts(run_id) == {"pending": 1}
+
+    item = queue.claim(run_id, "worker-b")
+    assert queue.fail(run_id, item["item_key"], "worker-b", "Timeout", result={"status": "timeout"})
+    assert queue.counts(run_id) == {"failed": 1}
+    assert queue.claim(run_id, "worker-c") is None
+
+def test_cancel_leaves_leased_items_alone(queue, run_id):
+    queue.enqueue(run_id, employees(3))
+    queue.claim(run_id, "worker-a")
+
+    assert queue.cancel_pending(run_id) == 2
+    assert queue.counts(run_id) == {"cancelled": 2, "leased": 1}
+
+def test_concurrent_workers_never_claim_the_same_item(queue, run_id):
+    queue.enqueue(run_id, employees(60))
+
+    def work(worker: int) -> list[str]:
+        claimed = []
+        while item := queue.claim(run_id, f"worker-{worker}"):
+            claimed.append(item["item_key"])
+            queue.complete(run_id, item["item_key"], f"worker-{worker}", {"status": "success"})
+        return claimed
+
+    with ThreadPoolExecutor(max_workers=6) as executor:
+        claimed = [key for keys in executor.map(work, range(6)) for key in keys]
+
+    assert sorted(claimed) == sorted(employees(60))
+    assert queue.counts(run_id) == {"done": 60}